@@ -80,12 +80,27 @@ class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: Optional[str] = None
     TEST_DB_URL: Optional[str] = None
+    # Connection pool per worker process (not used with ENV=test, which uses NullPool)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 5.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # asyncpg prepared statement cache per connection; 0 disables (e.g. PgBouncer transaction mode)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Optional streaming replica for read-only endpoints; unset routes all reads to the primary
+    DATABASE_READ_REPLICA_URL: Optional[str] = None
+    # After a successful write, the user's reads stay on the primary this long (replica lag budget)
+    DB_READ_REPLICA_STICKY_SECONDS: float = 5.0
 
     # JWT settings
     SECRET_KEY: Optional[str] = None
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Also look up pre-hash ``blacklist:{jwt}`` revocations; can be disabled once
+    # REFRESH_TOKEN_EXPIRE_DAYS have passed since hashed blacklist keys were deployed
+    BLACKLIST_CHECK_LEGACY_KEYS: bool = True
 
     # Redis settings
     REDIS_HOST: str = "localhost"
@@ -93,6 +108,19 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_PASSWORD: Optional[str] = None
     REDIS_URL: Optional[str] = None
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 1.0  # wait for a free pooled connection
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 1.0
+    REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS: float = 1.0
+    REDIS_RETRY_ON_TIMEOUT: bool = True
+    REDIS_RETRY_ATTEMPTS: int = 1
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
+    # Consecutive connection failures before Redis calls fail fast for the cooldown
+    REDIS_CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    REDIS_CIRCUIT_BREAKER_RESET_SECONDS: float = 10.0
+    # In-process cap on refresh tokens written while Redis is unreachable; blacklist
+    # entries from the same outage are kept until they expire and never evicted
+    REDIS_FALLBACK_MAX_ENTRIES: int = 50_000
 
     # Email verification
     EMAIL_VERIFICATION_TOKEN_EXPIRE_HOURS: int = 24
@@ -121,9 +149,19 @@ class Settings(BaseSettings):
     REQUIRE_SPECIAL_CHAR: bool = True
     REQUIRE_DIGIT: bool = True
     REQUIRE_UPPERCASE: bool = True
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # existing hashes are upgraded on login
+    PASSWORD_HASH_BENCHMARK_ON_STARTUP: bool = True
+    PASSWORD_HASH_TARGET_MS: float = 250.0  # login latency budget for one bcrypt hash
+    PASSWORD_HASH_MAX_WORKERS: int = 4  # threads running bcrypt off the event loop
+    PASSWORD_VERIFY_MAX_CONCURRENT: int = 4  # concurrent bcrypt verifications per process
+    PASSWORD_VERIFY_MAX_QUEUE: int = 32  # waiting verifications before rejecting with 503
+    PASSWORD_VERIFY_QUEUE_TIMEOUT_SECONDS: float = 2.0
 
     # Session settings
     SESSION_TIMEOUT_MINUTES: int = 30
+    USER_STATUS_CACHE_TTL_SECONDS: int = 60
+    USER_STATUS_LOCAL_CACHE_TTL_SECONDS: float = 1.0  # 0 disables the in-process tier
+    USER_STATUS_LOCAL_CACHE_MAX_ENTRIES: int = 10000
 
     # Transport security and endpoint abuse protection
     SECURITY_ENFORCE_TLS: bool = False
@@ -131,8 +169,12 @@ class Settings(BaseSettings):
     SECURITY_TLS_PROTECTED_PATHS: str = "/api/v1/chats,/api/v1/auth/login"
     SECURITY_TRUSTED_PROXIES: str = "127.0.0.1,::1"
     SECURITY_ALLOWED_HOSTS: str = ""
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" (per process) or "redis" (shared)
+    RATE_LIMIT_MEMORY_MAX_KEYS: int = 100_000  # per limiter; LRU keys are evicted beyond
     RATE_LIMIT_LOGIN_MAX_REQUESTS: int = 10
     RATE_LIMIT_LOGIN_WINDOW_SECONDS: int = 60
+    RATE_LIMIT_LOGIN_ACCOUNT_MAX_REQUESTS: int = 10
+    RATE_LIMIT_LOGIN_ACCOUNT_WINDOW_SECONDS: int = 300
     RATE_LIMIT_CHAT_MESSAGE_MAX_REQUESTS: int = 10
     RATE_LIMIT_CHAT_MESSAGE_BURST_REQUESTS: int = 3
     RATE_LIMIT_CHAT_MESSAGE_WINDOW_SECONDS: int = 60
@@ -158,10 +200,23 @@ class Settings(BaseSettings):
     MEILI_URL: str = "http://localhost:7700"
     MEILI_MASTER_KEY: Optional[str] = None
     MEILI_INDEX_UID: str = "nanos_v1"
+    MEILI_TIMEOUT_SECONDS: float = 10.0
+    MEILI_SEARCH_TIMEOUT_SECONDS: float = 5.0
+    MEILI_MAX_CONNECTIONS: int = 20
+    MEILI_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    MEILI_MAX_CONCURRENT_REQUESTS: int = 16
+    SEARCH_RECONCILE_INTERVAL_SECONDS: int = 300  # 0 disables the background reconciler
+    SEARCH_INDEX_BATCH_SIZE: int = 500
+    SEARCH_INDEX_UPLOAD_CONCURRENCY: int = 4
 
     # Search cache settings (Redis)
     SEARCH_CACHE_TTL_SECONDS: int = 1800  # 30 minutes
-    SEARCH_CACHE_KEY_PREFIX: str = "search:v1"
+    SEARCH_CACHE_KEY_PREFIX: str = "search:v2"
+    SEARCH_CACHE_LOCK_TTL_SECONDS: float = 5.0  # cross-worker recompute lock
+    SEARCH_CACHE_LOCK_WAIT_SECONDS: float = 2.0  # wait for a peer before recomputing
+    SEARCH_CACHE_EARLY_REFRESH_WINDOW_SECONDS: float = 30.0  # 0 disables early refresh
+    SEARCH_LOCAL_CACHE_MAX_ENTRIES: int = 1024  # 0 disables the in-process cache
+    SEARCH_LOCAL_CACHE_TTL_SECONDS: float = 10.0
 
     # Upload settings
     UPLOAD_MAX_RETRIES: int = 3
@@ -198,6 +253,12 @@ class Settings(BaseSettings):
         if self.AUTH_RESEND_RETURN_TOKEN is None:
             self.AUTH_RESEND_RETURN_TOKEN = self.ENV in {"development", "test"}
 
+        if not 10 <= self.PASSWORD_BCRYPT_ROUNDS <= 31:
+            raise ValueError("PASSWORD_BCRYPT_ROUNDS must be between 10 and 31.")
+
+        if self.RATE_LIMIT_BACKEND not in {"memory", "redis"}:
+            raise ValueError("RATE_LIMIT_BACKEND must be 'memory' or 'redis'.")
+
         effective_public_base_url = self.effective_verification_base_url
         if self.ENV not in {"development", "test"}:
             parsed_url = urlparse(effective_public_base_url)
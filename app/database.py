@@ -1,12 +1,26 @@
 """Database configuration and session management"""
 
 import logging
-from typing import AsyncGenerator
+from time import perf_counter
+from typing import Any, AsyncGenerator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from fastapi import Depends, Request
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, PoolProxiedConnection
 
 from app.config import get_settings
+from app.monitoring import (
+    DB_POOL_CHECKED_OUT_CONNECTIONS,
+    DB_POOL_CHECKOUT_TIMEOUTS_TOTAL,
+    DB_POOL_CHECKOUT_WAIT_SECONDS,
+    DB_POOL_OVERFLOW_CONNECTIONS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,23 +42,88 @@ logger.info(
     f"{settings.DATABASE_URL.split('@')[0]}@{settings.DATABASE_URL.split('@')[1] if '@' in settings.DATABASE_URL else 'sqlite'}"
 )
 
-# Create async engine for PostgreSQL
-engine_options: dict = {
-    "echo": settings.DEBUG,
-}
 
-if settings.ENV == "test":
-    engine_options["poolclass"] = NullPool
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool exporting checkout wait time and checked-out/overflow counts.
+
+    Only public pool API is used. The checked-out and overflow gauges read
+    ``checkedout()``/``overflow()`` when ``/metrics`` is scraped, so they never
+    lag behind the pool's own bookkeeping. Checkout wait time and timeouts are
+    measured around :meth:`connect`; no pool event fires before a checkout
+    starts waiting, so they cannot be taken from ``checkout`` events.
+
+    Metrics are labelled with the engine's ``pool_logging_name`` (default
+    ``primary``). A pool recreated by ``engine.dispose()`` takes the gauges over.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        DB_POOL_CHECKED_OUT_CONNECTIONS.labels(pool=self._pool_label).set_function(self.checkedout)
+        DB_POOL_OVERFLOW_CONNECTIONS.labels(pool=self._pool_label).set_function(
+            lambda: max(0, self.overflow())
+        )
+
+    @property
+    def _pool_label(self) -> str:
+        return self.logging_name or "primary"
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS_TOTAL.labels(pool=self._pool_label).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT_SECONDS.labels(pool=self._pool_label).observe(
+                perf_counter() - started_at
+            )
+
+
+def _async_database_url(url: str) -> str:
+    """Convert postgresql:// to postgresql+asyncpg:// for async support."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def _create_engine(url: str, pool_name: str) -> AsyncEngine:
+    engine_options: dict = {
+        "echo": settings.DEBUG,
+    }
+
+    if settings.ENV == "test":
+        engine_options["poolclass"] = NullPool
+    else:
+        engine_options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_logging_name=pool_name,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+
+    if url.startswith("postgresql+asyncpg://"):
+        engine_options["connect_args"] = {
+            # asyncpg's own cache and SQLAlchemy's adapter cache are sized together.
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
 
-# Convert postgresql:// to postgresql+asyncpg:// for async support
-database_url = settings.DATABASE_URL
-if database_url.startswith("postgresql://"):
-    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return create_async_engine(url, **engine_options)
+
+
+# Create async engine for PostgreSQL
+database_url = _async_database_url(settings.DATABASE_URL)
 
 try:
-    engine = create_async_engine(
-        database_url,
-        **engine_options,
+    engine = _create_engine(database_url, "primary")
+    read_engine: Optional[AsyncEngine] = (
+        _create_engine(_async_database_url(settings.DATABASE_READ_REPLICA_URL), "replica")
+        if settings.DATABASE_READ_REPLICA_URL
+        else None
     )
 except Exception as e:
     logger.error(f"Failed to create database engine: {e}")
@@ -61,6 +140,13 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Session factory for the read replica; None when reads use the primary
+async_read_session: Optional[async_sessionmaker[AsyncSession]] = (
+    async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -71,3 +157,30 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     async with async_session() as session:
         yield session
+
+
+async def get_read_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a database session dependency for read-only endpoints.
+
+    Uses the read replica (``DATABASE_READ_REPLICA_URL``) when configured. Falls
+    back to the primary session from :func:`get_db` when no replica is set or
+    when the request's user wrote recently (``request.state.reads_need_primary``,
+    set by ``ReadYourWritesMiddleware``), so users always read their own writes.
+    The primary session is only connected if it is actually used.
+
+    Yields:
+        AsyncSession: Database session instance
+    """
+    reads_need_primary = getattr(request.state, "reads_need_primary", None)
+    if async_read_session is None or (
+        reads_need_primary is not None and await reads_need_primary()
+    ):
+        yield db
+        return
+
+    async with async_read_session() as session:
+        yield session
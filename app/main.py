@@ -1,20 +1,30 @@
 """FastAPI application factory"""
 
+import asyncio
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
 from app.config import get_settings
+from app.database import async_session
 from app.modules.admin.router import get_admin_router
 from app.modules.audit.router import get_audit_router
+from app.modules.auth.password import log_password_hash_benchmark, shutdown_password_executor
+from app.modules.auth.read_consistency import ReadYourWritesMiddleware
 from app.modules.auth.router import get_auth_router
 from app.modules.chat.router import get_chat_router
 from app.modules.moderation.router import get_moderation_router
 from app.modules.nanos.router import get_nanos_router
 from app.modules.search.router import get_search_router
+from app.modules.search.service import (
+    close_search_client,
+    get_search_client,
+    run_search_cache_invalidation_listener,
+    run_search_reconciler,
+)
 from app.modules.upload.router import get_upload_router
 from app.monitoring import configure_monitoring
 from app.redis_client import check_redis_health, close_redis, get_redis
@@ -26,11 +36,31 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan (startup and shutdown)"""
-    # Startup: Initialize Redis connection
+    # Startup: Initialize Redis connection and the long-lived search client
     await get_redis()
+    get_search_client()
+    background_tasks: list[asyncio.Task] = []
+    if settings.SEARCH_RECONCILE_INTERVAL_SECONDS > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                run_search_reconciler(async_session, settings.SEARCH_RECONCILE_INTERVAL_SECONDS)
+            )
+        )
+    if settings.SEARCH_LOCAL_CACHE_MAX_ENTRIES > 0:
+        background_tasks.append(asyncio.create_task(run_search_cache_invalidation_listener()))
+    if settings.PASSWORD_HASH_BENCHMARK_ON_STARTUP:
+        background_tasks.append(asyncio.create_task(log_password_hash_benchmark()))
     yield
-    # Shutdown: Close Redis connection
+    # Shutdown: Stop background tasks, close Redis/Meilisearch connections
+    # and the password hashing worker pool
+    for task in background_tasks:
+        task.cancel()
+    for task in background_tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+    await close_search_client()
     await close_redis()
+    shutdown_password_executor()
 
 
 def create_app() -> FastAPI:
@@ -74,6 +104,10 @@ def create_app() -> FastAPI:
             allowed_hosts=frozenset(parse_csv_values(settings.SECURITY_ALLOWED_HOSTS)),
         )
 
+    # Keep users' reads on the primary right after their writes (replica lag)
+    if settings.DATABASE_READ_REPLICA_URL:
+        app.add_middleware(ReadYourWritesMiddleware)
+
     # Include routers
     app.include_router(get_auth_router())
     app.include_router(get_admin_router())
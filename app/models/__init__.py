@@ -15,6 +15,7 @@ from sqlalchemy import (
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import (
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -243,6 +244,8 @@ class AuditLog(Base):
     """Audit log for tracking user actions and system events"""
 
     __tablename__ = "audit_logs"
+    # Matches the (created_at, id) keyset used by the paginated audit log query.
+    __table_args__ = (Index("ix_audit_logs_created_at_id", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
@@ -445,6 +448,42 @@ class Nano(Base):
     rating_count: Mapped[int] = mapped_column(
         Integer, default=0, nullable=False, comment="Total ratings (cache)"
     )
+    # Per-score histogram of approved ratings, maintained with atomic deltas.
+    rating_count_1: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Approved 1-star ratings (cache)",
+    )
+    rating_count_2: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Approved 2-star ratings (cache)",
+    )
+    rating_count_3: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Approved 3-star ratings (cache)",
+    )
+    rating_count_4: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Approved 4-star ratings (cache)",
+    )
+    rating_count_5: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Approved 5-star ratings (cache)",
+    )
 
     def __repr__(self) -> str:
         """String representation of Nano"""
@@ -537,6 +576,12 @@ class ChatMessage(Base):
             "length(content) <= 1000",
             name="ck_chat_messages_content_max_length",
         ),
+        Index(
+            "ix_chat_messages_session_id_created_at_id",
+            "session_id",
+            "created_at",
+            "id",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -8,7 +8,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import AuditAction, UserRole, UserStatus
 from app.modules.admin.service import (
     AdminRoleChangeError,
@@ -21,6 +21,8 @@ from app.modules.admin.service import (
 from app.modules.audit.service import AuditLogger
 from app.modules.auth.middleware import ROLE_ADMIN, require_role
 from app.modules.auth.tokens import TokenData
+from app.modules.auth.user_status import invalidate_user_status
+from app.pagination import MAX_CURSOR_LENGTH
 from app.redis_client import delete_refresh_token
 from app.schemas import AdminUserListResponse, AdminUserRoleUpdateRequest, UserResponse
 
@@ -45,15 +47,17 @@ def get_admin_router(prefix: str = "/api/v1/admin", tags: list[str] | None = Non
     async def get_users(
         request: Request,
         current_user: Annotated[TokenData, Depends(require_role(ROLE_ADMIN))],
-        db: Annotated[AsyncSession, Depends(get_db)],
+        db: Annotated[AsyncSession, Depends(get_read_db)],
         search: Annotated[str | None, Query(max_length=100)] = None,
         role: Annotated[UserRole | None, Query()] = None,
         user_status: Annotated[UserStatus | None, Query(alias="status")] = None,
         exclude_deleted: Annotated[bool, Query()] = True,
         limit: Annotated[int, Query(ge=1, le=100)] = 20,
         offset: Annotated[int, Query(ge=0)] = 0,
+        cursor: Annotated[str | None, Query(max_length=MAX_CURSOR_LENGTH)] = None,
+        include_total: Annotated[bool | None, Query()] = None,
     ) -> AdminUserListResponse:
-        users, total = await list_admin_users(
+        users, total, next_cursor = await list_admin_users(
             db,
             search=search,
             role=role,
@@ -61,6 +65,8 @@ def get_admin_router(prefix: str = "/api/v1/admin", tags: list[str] | None = Non
             exclude_deleted=exclude_deleted,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         return AdminUserListResponse(
@@ -68,6 +74,7 @@ def get_admin_router(prefix: str = "/api/v1/admin", tags: list[str] | None = Non
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=next_cursor,
         )
 
     @router.patch(
@@ -158,6 +165,7 @@ def get_admin_router(prefix: str = "/api/v1/admin", tags: list[str] | None = Non
         # an already-committed admin delete.
         await db.commit()
         await db.refresh(user)
+        await invalidate_user_status(user.id)
 
         try:
             await delete_refresh_token(str(user.id))
@@ -8,7 +8,8 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import User, UserRole, UserStatus
-from app.modules.auth.password import hash_password
+from app.modules.auth.password import hash_password_async
+from app.pagination import paginate_keyset_or_400, should_count_total, split_page
 
 
 class AdminUserManagementError(Exception):
@@ -36,15 +37,26 @@ async def list_admin_users(
     exclude_deleted: bool = True,
     limit: int = 20,
     offset: int = 0,
-) -> tuple[list[User], int]:
+    cursor: str | None = None,
+    include_total: bool | None = None,
+) -> tuple[list[User], int | None, str | None]:
     """Return a filtered, paginated user list for the admin panel.
 
+    Returns ``(users, total, next_cursor)``. ``total`` is None when the count
+    was skipped, which is the default when paging by ``cursor``.
+
     Args:
         exclude_deleted: When True (default) and no explicit ``status`` filter is
             provided, soft-deleted users are omitted.  Set to False to include
             them in an unfiltered result set.  When ``status`` is passed
             explicitly this flag is ignored — the caller controls inclusion via
             the status filter.
+        cursor: Opaque keyset cursor from a previous page; ``offset`` is ignored
+            when it is given.
+        include_total: Force or skip the total count.
+
+    Raises:
+        HTTPException: 400 if ``cursor`` is malformed.
     """
     filters = []
 
@@ -71,22 +83,30 @@ async def list_admin_users(
         # query parameter so the intent stays explicit for all callers.
         filters.append(User.status != UserStatus.DELETED)
 
-    count_query = select(func.count()).select_from(User)
-    if filters:
-        count_query = count_query.where(*filters)
-    total = (await db.execute(count_query)).scalar() or 0
-
-    query = (
-        select(User)
-        .order_by(User.created_at.desc(), User.id.desc())
-        .limit(min(limit, 100))
-        .offset(offset)
-    )
+    total: int | None = None
+    if should_count_total(cursor, include_total):
+        count_query = select(func.count()).select_from(User)
+        if filters:
+            count_query = count_query.where(*filters)
+        total = (await db.execute(count_query)).scalar() or 0
+
+    limit = min(limit, 100)
+    query = select(User)
     if filters:
         query = query.where(*filters)
+    query = paginate_keyset_or_400(
+        query,
+        (User.created_at, User.id),
+        limit=limit,
+        cursor=cursor,
+        offset=offset,
+        descending=True,
+    )
 
-    users = (await db.execute(query)).scalars().all()
-    return users, total
+    users, next_cursor = split_page(
+        (await db.execute(query)).scalars().all(), limit, lambda user: (user.created_at, user.id)
+    )
+    return users, total, next_cursor
 
 
 async def update_admin_user_role(
@@ -147,7 +167,7 @@ async def delete_admin_user(
     anonymized_suffix = user.id.hex[:16]
     user.email = f"deleted+{user.id.hex}@example.com"
     user.username = f"del_{anonymized_suffix}"
-    user.password_hash = hash_password(uuid4().hex)
+    user.password_hash = await hash_password_async(uuid4().hex)
     user.status = UserStatus.DELETED
     user.role = UserRole.CONSUMER
     user.email_verified = False
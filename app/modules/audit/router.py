@@ -4,13 +4,14 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import AuditAction
 from app.modules.audit.service import AuditLogger
 from app.modules.auth.middleware import require_role
+from app.pagination import MAX_CURSOR_LENGTH
 from app.schemas import AuditLogResponse, AuditLogsQueryResponse, SuspiciousActivityResponse
 
 
@@ -33,7 +34,7 @@ def get_audit_router() -> APIRouter:
         description="Get paginated audit logs with optional filtering by user, action, resource type, and date range.",
     )
     async def query_audit_logs(
-        session: AsyncSession = Depends(get_db),
+        session: AsyncSession = Depends(get_read_db),
         user_id: Optional[UUID] = Query(
             None, description="Filter by user who performed the action"
         ),
@@ -47,13 +48,24 @@ def get_audit_router() -> APIRouter:
         ),
         limit: int = Query(100, ge=1, le=1000, description="Maximum number of logs to return"),
         offset: int = Query(0, ge=0, description="Number of logs to skip"),
+        cursor: Optional[str] = Query(
+            None,
+            max_length=MAX_CURSOR_LENGTH,
+            description="Opaque cursor from a previous page's next_cursor",
+        ),
+        include_total: Optional[bool] = Query(
+            None, description="Count all matching logs (default: offset mode only)"
+        ),
     ) -> AuditLogsQueryResponse:
         """Query audit logs with filtering and pagination.
 
+        Passing ``cursor`` seeks directly past the previous page instead of
+        skipping ``offset`` rows, so deep pages are as cheap as the first one.
+
         Returns:
             AuditLogsQueryResponse: Paginated list of audit logs
         """
-        logs, total = await AuditLogger.query_logs(
+        logs, total, next_cursor = await AuditLogger.query_logs(
             session,
             user_id=user_id,
             action=action,
@@ -62,6 +74,8 @@ def get_audit_router() -> APIRouter:
             end_date=end_date,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         # Convert ORM models to schemas
@@ -85,6 +99,7 @@ def get_audit_router() -> APIRouter:
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=next_cursor,
         )
 
     @router.get(
@@ -8,6 +8,7 @@ from sqlalchemy import and_, delete, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import AuditAction, AuditLog
+from app.pagination import paginate_keyset_or_400, should_count_total, split_page
 
 
 class AuditLogger:
@@ -63,7 +64,9 @@ class AuditLogger:
         end_date: Optional[datetime] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[AuditLog], int]:
+        cursor: Optional[str] = None,
+        include_total: Optional[bool] = None,
+    ) -> tuple[list[AuditLog], Optional[int], Optional[str]]:
         """Query audit logs with filtering options.
 
         Args:
@@ -74,10 +77,16 @@ class AuditLogger:
             start_date: Filter logs after this date (inclusive)
             end_date: Filter logs before this date (inclusive)
             limit: Maximum number of logs to return (max 1000)
-            offset: Number of logs to skip
+            offset: Number of logs to skip (ignored when ``cursor`` is given)
+            cursor: Opaque keyset cursor returned for the previous page
+            include_total: Force or skip the total count; by default it is
+                only computed for offset queries
 
         Returns:
-            Tuple of (logs, total_count)
+            Tuple of (logs, total_count or None, next_cursor or None)
+
+        Raises:
+            HTTPException: 400 if ``cursor`` is malformed
         """
         # Build query filters
         filters = []
@@ -107,22 +116,33 @@ class AuditLogger:
         limit = min(limit, 1000)
 
         # Get total count for pagination
-        count_query = select(func.count()).select_from(AuditLog)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-        count_result = await session.execute(count_query)
-        total_count = count_result.scalar() or 0
-
-        # Get paginated results
-        query = select(AuditLog).order_by(desc(AuditLog.created_at)).limit(limit).offset(offset)
-
+        total_count: Optional[int] = None
+        if should_count_total(cursor, include_total):
+            count_query = select(func.count()).select_from(AuditLog)
+            if filters:
+                count_query = count_query.where(and_(*filters))
+            count_result = await session.execute(count_query)
+            total_count = count_result.scalar() or 0
+
+        # Get paginated results, newest first with id as tiebreaker
+        query = select(AuditLog)
         if filters:
             query = query.where(and_(*filters))
+        query = paginate_keyset_or_400(
+            query,
+            (AuditLog.created_at, AuditLog.id),
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            descending=True,
+        )
 
         result = await session.execute(query)
-        logs = result.scalars().all()
+        logs, next_cursor = split_page(
+            result.scalars().all(), limit, lambda log: (log.created_at, log.id)
+        )
 
-        return logs, total_count
+        return logs, total_count, next_cursor
 
     @staticmethod
     async def get_recent_logs(
@@ -8,6 +8,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import ConsentAudit, User, UserStatus
+from app.modules.auth.user_status import invalidate_user_status
+from app.modules.nanos.ratings import remove_user_ratings
 from app.schemas import AccountDeletionResponse, ConsentResponse, UserDataExport
 
 
@@ -115,6 +117,7 @@ async def request_account_deletion(
     user.status = UserStatus.INACTIVE  # Deactivate account immediately
 
     await db_session.commit()
+    await invalidate_user_status(user_id)
 
     return AccountDeletionResponse(
         message=f"Account deletion scheduled. You have {grace_period_days} days to cancel.",
@@ -163,6 +166,7 @@ async def cancel_account_deletion(db_session: AsyncSession, user_id: UUID) -> No
     user.status = UserStatus.ACTIVE  # Reactivate account
 
     await db_session.commit()
+    await invalidate_user_status(user_id)
 
 
 async def execute_account_deletion(db_session: AsyncSession, user_id: UUID) -> None:
@@ -203,9 +207,13 @@ async def execute_account_deletion(db_session: AsyncSession, user_id: UUID) -> N
     # Delete consent audit records
     await db_session.execute(ConsentAudit.__table__.delete().where(ConsentAudit.user_id == user_id))
 
+    # Keep cached rating histograms in step with the cascading rating delete
+    await remove_user_ratings(db_session, user_id)
+
     # Delete user (hard delete)
     await db_session.delete(user)
     await db_session.commit()
+    await invalidate_user_status(user_id)
 
 
 async def get_user_consents(db_session: AsyncSession, user_id: UUID) -> list[ConsentResponse]:
@@ -6,12 +6,12 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.models import User, UserStatus
+from app.models import UserStatus
 from app.modules.auth.tokens import TokenData, verify_token
+from app.modules.auth.user_status import get_token_auth_state
 from app.redis_client import is_token_blacklisted
 
 security = HTTPBearer(auto_error=False)
@@ -33,9 +33,9 @@ async def get_current_user(
 
     Args:
         credentials: HTTP Bearer token from Authorization header
-        db: Database session used to verify the user's current account status.
-            This guards against access tokens for soft-deleted accounts that
-            have not yet expired.
+        db: Database session used to verify the user's current account status
+            on a status-cache miss. This guards against access tokens for
+            soft-deleted accounts that have not yet expired.
 
     Returns:
         TokenData with user information
@@ -53,14 +53,6 @@ async def get_current_user(
 
     token = credentials.credentials
 
-    # Check if token is blacklisted
-    if await is_token_blacklisted(token):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has been revoked",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
     # Verify token
     token_data = verify_token(token, token_type="access")
 
@@ -71,13 +63,20 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Confirm the user's DB record is still active.  Refresh tokens are revoked
-    # on admin delete, but outstanding access tokens remain valid until expiry
-    # unless we perform this check.  This ensures immediate lockout.
-    db_user = (
-        await db.execute(select(User).where(User.id == token_data.user_id))
-    ).scalar_one_or_none()
-    if db_user is None or db_user.status == UserStatus.DELETED:
+    # Check the blacklist and the user's current account status together.
+    # Refresh tokens are revoked on admin delete, but outstanding access tokens
+    # remain valid until expiry unless we check the status.  The status comes
+    # from the user status cache, which deletion flows invalidate after commit
+    # (see user_status.py); the database is only read on a cache miss.
+    blacklisted, user_status = await get_token_auth_state(db, token, token_data.user_id)
+    if blacklisted:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if user_status is None or user_status == UserStatus.DELETED:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User account is no longer active",
@@ -4,10 +4,12 @@ This module implements secure password hashing using bcrypt with a minimum
 cost factor of 12. The implementation follows OWASP guidelines for password
 storage and includes:
 
-- bcrypt hashing with cost factor 12 (2^12 = 4096 iterations)
+- bcrypt hashing with a configurable cost factor (default 12 = 4096 iterations)
 - bcrypt's constant-time verification primitive
 - SHA256 pre-hashing for passwords exceeding bcrypt's 72-byte limit
 - no plain-text password storage or logging
+- async variants that run bcrypt in a bounded worker thread pool, so hashing
+  never blocks the event loop (bcrypt releases the GIL)
 
 Security properties:
 - passwords are hashed using bcrypt with a unique salt per hash
@@ -16,24 +18,56 @@ Security properties:
 - no passwords are stored in logs or error messages
 """
 
+import asyncio
 import hashlib
 import logging
-from typing import Final
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable, Final, Optional, TypeVar
+from uuid import uuid4
 
 import bcrypt
 
+from app.config import get_settings
+from app.monitoring import (
+    PASSWORD_HASH_DURATION_SECONDS,
+    PASSWORD_HASH_QUEUE_DEPTH,
+    PASSWORD_HASH_QUEUE_WAIT_SECONDS,
+    PASSWORD_VERIFICATION_QUEUE_DEPTH,
+    PASSWORD_VERIFICATION_REJECTED_TOTAL,
+)
+from app.security.admission import ConcurrencyAdmissionController
+
+T = TypeVar("T")
+
+settings = get_settings()
+
 # Configure logging (passwords will NEVER be logged)
 logger = logging.getLogger(__name__)
 
-# Bcrypt cost factor
+# Bcrypt cost factor (PASSWORD_BCRYPT_ROUNDS, default 12)
 # 12 rounds = 2^12 = 4096 iterations (meets OWASP minimum of 10)
-# Higher values increase security but also computation time
-BCRYPT_ROUNDS: Final[int] = 12
+# Higher values increase security but also computation time; each step doubles it
+BCRYPT_ROUNDS: Final[int] = settings.PASSWORD_BCRYPT_ROUNDS
 
 # Bcrypt has a 72-byte password limit
 BCRYPT_MAX_PASSWORD_BYTES: Final[int] = 72
 BCRYPT_PREFIXES: Final[tuple[str, ...]] = ("$2a$", "$2b$", "$2y$")
 
+_password_executor: Optional[ThreadPoolExecutor] = None
+
+# Caps bcrypt verifications per process so credential stuffing cannot queue
+# unbounded CPU work; excess callers get AdmissionRejectedError.
+PASSWORD_VERIFICATION_ADMISSION = ConcurrencyAdmissionController(
+    max_concurrent=settings.PASSWORD_VERIFY_MAX_CONCURRENT,
+    max_queue=settings.PASSWORD_VERIFY_MAX_QUEUE,
+    queue_timeout_seconds=settings.PASSWORD_VERIFY_QUEUE_TIMEOUT_SECONDS,
+    queue_depth_gauge=PASSWORD_VERIFICATION_QUEUE_DEPTH,
+    rejected_counter=PASSWORD_VERIFICATION_REJECTED_TOTAL,
+)
+
 
 def _normalize_password(password: str) -> str:
     """Normalize passwords before hashing or verification.
@@ -128,6 +162,144 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def _get_password_executor() -> ThreadPoolExecutor:
+    global _password_executor
+
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=get_settings().PASSWORD_HASH_MAX_WORKERS,
+            thread_name_prefix="password-hash",
+        )
+    return _password_executor
+
+
+async def _run_in_password_pool(operation: str, func: Callable[..., T], *args: str) -> T:
+    """Run a bcrypt call in the password worker pool and record queue metrics."""
+    enqueued_at = perf_counter()
+    dequeued = threading.Lock()
+
+    def leave_queue() -> bool:
+        # Called by the worker when the job starts, and by the caller if the job
+        # is cancelled while still queued; only the first call counts.
+        if not dequeued.acquire(blocking=False):
+            return False
+        PASSWORD_HASH_QUEUE_DEPTH.dec()
+        return True
+
+    def job() -> T:
+        leave_queue()
+        started_at = perf_counter()
+        PASSWORD_HASH_QUEUE_WAIT_SECONDS.labels(operation=operation).observe(
+            started_at - enqueued_at
+        )
+        try:
+            return func(*args)
+        finally:
+            PASSWORD_HASH_DURATION_SECONDS.labels(operation=operation).observe(
+                perf_counter() - started_at
+            )
+
+    PASSWORD_HASH_QUEUE_DEPTH.inc()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_password_executor(), job)
+    finally:
+        leave_queue()
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+
+    Same contract as :func:`hash_password`; bcrypt runs in the password worker
+    pool (``PASSWORD_HASH_MAX_WORKERS`` threads).
+    """
+    return await _run_in_password_pool("hash", hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+
+    Same contract as :func:`verify_password`; bcrypt runs in the password worker
+    pool (``PASSWORD_HASH_MAX_WORKERS`` threads) once admitted by
+    ``PASSWORD_VERIFICATION_ADMISSION``.
+
+    Raises:
+        AdmissionRejectedError: If too many verifications are running or queued
+    """
+    if not plain_password or not hashed_password:
+        return False
+    async with PASSWORD_VERIFICATION_ADMISSION.admit():
+        return await _run_in_password_pool(
+            "verify", verify_password, plain_password, hashed_password
+        )
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Return True if a valid bcrypt hash uses a cost other than ``BCRYPT_ROUNDS``."""
+    info = get_password_hash_info(hashed_password)
+    return bool(info["valid"]) and info["rounds"] != BCRYPT_ROUNDS
+
+
+async def benchmark_password_hash(samples: int = 3) -> float:
+    """
+    Measure the wall time of one bcrypt hash at ``BCRYPT_ROUNDS`` on this host.
+
+    Runs in the password worker pool, so it does not block the event loop.
+
+    Args:
+        samples: Number of hashes to time; the fastest one is reported
+
+    Returns:
+        Milliseconds per hash
+    """
+    password = uuid4().hex
+
+    def timed_hash() -> float:
+        started_at = perf_counter()
+        hash_password(password)
+        return (perf_counter() - started_at) * 1000
+
+    timings = [await _run_in_password_pool("benchmark", timed_hash) for _ in range(samples)]
+    return min(timings)
+
+
+def recommend_bcrypt_rounds(ms_per_hash: float, target_ms: float) -> int:
+    """Return the highest cost whose hash time stays within ``target_ms``.
+
+    Each additional round doubles the work, so the estimate is extrapolated from
+    the time measured at ``BCRYPT_ROUNDS``. Never recommends less than 10 rounds.
+    """
+    if ms_per_hash <= 0 or target_ms <= 0:
+        return BCRYPT_ROUNDS
+    return max(10, BCRYPT_ROUNDS + math.floor(math.log2(target_ms / ms_per_hash)))
+
+
+async def log_password_hash_benchmark() -> None:
+    """Log the measured bcrypt cost on this host for tuning ``PASSWORD_BCRYPT_ROUNDS``."""
+    ms_per_hash = await benchmark_password_hash()
+    logger.info(
+        "password_hash_benchmark",
+        extra={
+            "rounds": BCRYPT_ROUNDS,
+            "ms_per_hash": round(ms_per_hash, 1),
+            "target_ms": settings.PASSWORD_HASH_TARGET_MS,
+            "recommended_rounds": recommend_bcrypt_rounds(
+                ms_per_hash, settings.PASSWORD_HASH_TARGET_MS
+            ),
+        },
+    )
+
+
+def shutdown_password_executor() -> None:
+    """Stop the password worker pool. Called during application shutdown."""
+    global _password_executor
+
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+        _password_executor = None
+
+
 def get_password_hash_info(hashed_password: str) -> dict[str, str | int | None]:
     """
     Extract metadata from a bcrypt password hash.
@@ -0,0 +1,124 @@
+"""Read-your-writes routing between the primary database and the read replica.
+
+After a successful write request, the user's reads are served by the primary
+for ``DB_READ_REPLICA_STICKY_SECONDS`` so replication lag never hides their own
+changes. Write marks are kept in process memory and in Redis, so every worker
+sees them. The check runs lazily from :func:`app.database.get_read_db`, so only
+requests that actually use the replica pay for the token decode and Redis lookup.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Optional
+from uuid import UUID
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+from app.modules.auth.tokens import verify_token
+from app.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_LOCAL_MAX_ENTRIES = 10_000
+
+# user_id -> monotonic deadline until which reads stay on the primary
+_recent_writes: OrderedDict[UUID, float] = OrderedDict()
+
+
+def _read_primary_key(user_id: UUID) -> str:
+    return f"read_primary:{user_id}"
+
+
+async def record_user_write(user_id: UUID) -> None:
+    """Pin the user's reads to the primary for the configured sticky window."""
+    sticky_seconds = get_settings().DB_READ_REPLICA_STICKY_SECONDS
+    _recent_writes[user_id] = time.monotonic() + sticky_seconds
+    _recent_writes.move_to_end(user_id)
+    while len(_recent_writes) > _LOCAL_MAX_ENTRIES:
+        _recent_writes.popitem(last=False)
+
+    try:
+        redis_client = await get_redis()
+        await redis_client.set(
+            _read_primary_key(user_id), "1", px=max(1, int(sticky_seconds * 1000))
+        )
+    except Exception:
+        logger.warning("read_consistency_unavailable_on_set")
+
+
+async def user_wrote_recently(user_id: UUID) -> bool:
+    """Return True if the user's reads must go to the primary.
+
+    Also True while Redis is unavailable, since writes by other workers cannot
+    be ruled out and the primary is always consistent.
+    """
+    deadline = _recent_writes.get(user_id)
+    if deadline is not None:
+        if deadline > time.monotonic():
+            return True
+        _recent_writes.pop(user_id, None)
+
+    try:
+        redis_client = await get_redis()
+        return bool(await redis_client.exists(_read_primary_key(user_id)))
+    except Exception:
+        logger.warning("read_consistency_unavailable_on_get")
+        return True
+
+
+def _user_id_from_scope(scope: Scope) -> Optional[UUID]:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            token_data = verify_token(token.strip(), token_type="access")
+            return token_data.user_id if token_data else None
+    return None
+
+
+async def _reads_need_primary(scope: Scope) -> bool:
+    user_id = _user_id_from_scope(scope)
+    return user_id is not None and await user_wrote_recently(user_id)
+
+
+class ReadYourWritesMiddleware:
+    """Record successful writes and route the same user's reads accordingly.
+
+    Unsafe requests (POST, PUT, PATCH, DELETE) with a status below 400 pin the
+    authenticated user's reads to the primary before the response is sent.
+    Safe requests get ``request.state.reads_need_primary``, a coroutine function
+    that ``get_read_db`` awaits only when it would otherwise use the replica.
+    Anonymous requests are not tracked.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] in _SAFE_METHODS:
+            scope.setdefault("state", {})["reads_need_primary"] = partial(
+                _reads_need_primary, scope
+            )
+            await self.app(scope, receive, send)
+            return
+
+        user_id = _user_id_from_scope(scope)
+        if user_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_after_recording_write(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                await record_user_write(user_id)
+            await send(message)
+
+        await self.app(scope, receive, send_after_recording_write)
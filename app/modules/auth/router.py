@@ -52,6 +52,7 @@ from app.modules.mail import (
     send_mail,
     set_mail_context,
 )
+from app.monitoring import LOGIN_RATE_LIMITED_TOTAL
 from app.schemas import (
     AccountDeletionRequest,
     AccountDeletionResponse,
@@ -73,8 +74,9 @@ from app.schemas import (
     UserResponse,
     VerificationEmailResponse,
 )
+from app.security.admission import AdmissionRejectedError
 from app.security.middleware import parse_csv_values
-from app.security.rate_limit import SlidingWindowRateLimiter
+from app.security.rate_limit import create_rate_limiter
 
 router = APIRouter(
     prefix="/api/v1/auth",
@@ -88,11 +90,22 @@ MAIL_DELIVERY_UNAVAILABLE_DETAIL = (
     "Email delivery is currently unavailable. Please try again later."
 )
 
-LOGIN_RATE_LIMITER = SlidingWindowRateLimiter(
+LOGIN_RATE_LIMITER = create_rate_limiter(
     max_requests=settings.RATE_LIMIT_LOGIN_MAX_REQUESTS,
     window_seconds=settings.RATE_LIMIT_LOGIN_WINDOW_SECONDS,
+    name="login",
 )
 
+# Per-account limit so distributed credential stuffing against one account is
+# throttled even when every attempt comes from a different IP.
+LOGIN_ACCOUNT_RATE_LIMITER = create_rate_limiter(
+    max_requests=settings.RATE_LIMIT_LOGIN_ACCOUNT_MAX_REQUESTS,
+    window_seconds=settings.RATE_LIMIT_LOGIN_ACCOUNT_WINDOW_SECONDS,
+    name="login_account",
+)
+
+PASSWORD_VERIFICATION_BUSY_DETAIL = "Login is temporarily overloaded. Please retry shortly."
+
 
 # IP addresses of reverse proxies that are allowed to supply X-Forwarded-For
 # values that we trust for rate limiting and audit logging. Loaded from
@@ -167,14 +180,20 @@ async def _send_verification_mail(
         ) from error
 
 
-async def _enforce_login_rate_limit(request: Request) -> None:
-    """Apply per-client login rate limiting."""
+async def _enforce_login_rate_limit(request: Request, email: str) -> None:
+    """Apply per-client and per-account login rate limiting."""
     client_ip = _get_client_ip(request)
-    key = f"login:{client_ip}"
 
-    allowed, retry_after_seconds = await LOGIN_RATE_LIMITER.check(key)
+    allowed, retry_after_seconds = await LOGIN_RATE_LIMITER.check(f"login:{client_ip}")
     if allowed:
-        return
+        allowed, retry_after_seconds = await LOGIN_ACCOUNT_RATE_LIMITER.check(
+            f"login-account:{email.lower()}"
+        )
+        if allowed:
+            return
+        LOGIN_RATE_LIMITED_TOTAL.labels(scope="account").inc()
+    else:
+        LOGIN_RATE_LIMITED_TOTAL.labels(scope="ip").inc()
 
     raise HTTPException(
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -183,6 +202,15 @@ async def _enforce_login_rate_limit(request: Request) -> None:
     )
 
 
+def _password_verification_busy(error: AdmissionRejectedError) -> HTTPException:
+    """Map a shed password verification to 503 with a retry hint."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=PASSWORD_VERIFICATION_BUSY_DETAIL,
+        headers={"Retry-After": str(error.retry_after_seconds)},
+    )
+
+
 @router.post(
     "/register",
     response_model=UserResponse,
@@ -274,6 +302,14 @@ async def register(
             "model": SimpleErrorResponse,
             "description": "Forbidden - account locked or not verified",
         },
+        429: {
+            "model": SimpleErrorResponse,
+            "description": "Too many login attempts for this client or account",
+        },
+        503: {
+            "model": SimpleErrorResponse,
+            "description": "Service unavailable - password verification overloaded",
+        },
     },
 )
 async def login(
@@ -290,7 +326,7 @@ async def login(
     Returns access_token (15 min expiry) and refresh_token (7 days expiry).
     User must have verified email to login. Account locks after 3 failed attempts for 1 hour.
     """
-    await _enforce_login_rate_limit(request)
+    await _enforce_login_rate_limit(request, credentials.email)
 
     try:  # NOTE: authenticate_user() commits internally (updates last_login, resets attempts)
         # before we log the audit entry. If audit logging fails, login state is already committed.
@@ -368,6 +404,8 @@ async def login(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e),
         )
+    except AdmissionRejectedError as e:
+        raise _password_verification_busy(e) from e
 
 
 @router.post(
@@ -768,6 +806,8 @@ async def change_my_password(
         await db.commit()
 
         return MessageResponse(message="Password changed successfully")
+    except AdmissionRejectedError as e:
+        raise _password_verification_busy(e) from e
     except PasswordChangeError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
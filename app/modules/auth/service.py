@@ -1,15 +1,21 @@
 """Authentication service business logic"""
 
+import asyncio
+import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.models import ConsentAudit, ConsentType, User, UserRole, UserStatus
-from app.modules.auth.password import hash_password, verify_password
+from app.modules.auth.password import (
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from app.modules.auth.tokens import (
     create_access_token,
     create_email_verification_token,
@@ -31,6 +37,10 @@ from app.redis_client import (
 from app.schemas import TokenResponse, UserProfileUpdate, UserRegister, UserResponse
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Strong references to running hash upgrades so they are not garbage-collected.
+_background_rehashes: set[asyncio.Task] = set()
 
 
 def _is_pending_deletion(user: User) -> bool:
@@ -131,7 +141,7 @@ async def register_user(db_session: AsyncSession, user_data: UserRegister) -> Us
     user = User(
         email=email_lower,
         username=user_data.username,
-        password_hash=hash_password(user_data.password),
+        password_hash=await hash_password_async(user_data.password),
         first_name=user_data.first_name,
         last_name=user_data.last_name,
         bio=user_data.bio,
@@ -169,6 +179,36 @@ async def register_user(db_session: AsyncSession, user_data: UserRegister) -> Us
     return UserResponse.model_validate(user)
 
 
+async def _upgrade_password_hash(
+    db_session: AsyncSession, user_id: UUID, previous_hash: str, password: str
+) -> None:
+    """Rehash a password at the configured cost in a separate session.
+
+    The update only applies if the stored hash is still ``previous_hash``, so a
+    concurrent password change is never overwritten.
+    """
+    try:
+        new_hash = await hash_password_async(password)
+        async with AsyncSession(db_session.bind, expire_on_commit=False) as session:
+            await session.execute(
+                update(User)
+                .where(User.id == user_id, User.password_hash == previous_hash)
+                .values(password_hash=new_hash)
+            )
+            await session.commit()
+    except Exception:
+        logger.warning("password_rehash_failed", extra={"user_id": str(user_id)}, exc_info=True)
+
+
+def _schedule_password_rehash(db_session: AsyncSession, user: User, password: str) -> None:
+    """Upgrade the user's hash to the current bcrypt cost off the login's critical path."""
+    task = asyncio.create_task(
+        _upgrade_password_hash(db_session, user.id, user.password_hash, password)
+    )
+    _background_rehashes.add(task)
+    task.add_done_callback(_background_rehashes.discard)
+
+
 async def authenticate_user(
     db_session: AsyncSession, email: str, password: str
 ) -> tuple[UserResponse, TokenResponse]:
@@ -209,7 +249,7 @@ async def authenticate_user(
         if locked_until > now:
             raise AccountLockedError("Account is locked due to too many failed login attempts")
 
-    if not verify_password(password, user.password_hash):
+    if not await verify_password_async(password, user.password_hash):
         raise InvalidCredentialsError("Invalid email or password")
 
     # Check if email is verified
@@ -229,6 +269,9 @@ async def authenticate_user(
     await db_session.commit()
     await db_session.refresh(user)
 
+    if password_needs_rehash(user.password_hash):
+        _schedule_password_rehash(db_session, user, password)
+
     # Create tokens with role
     access_token, access_expires_in = create_access_token(user.id, user.email, user.role.value)
     refresh_token, refresh_expires_in = create_refresh_token(user.id, user.email, user.role.value)
@@ -547,7 +590,7 @@ async def change_user_password(
         raise AuthenticationError("User not found")
 
     # Re-authenticate: verify the current password.
-    if not verify_password(current_password, user.password_hash):
+    if not await verify_password_async(current_password, user.password_hash):
         raise PasswordChangeError("Current password is incorrect")
 
     # Validate new password strength.
@@ -556,7 +599,7 @@ async def change_user_password(
         raise AuthenticationError(f"New password does not meet requirements: {error_msg}")
 
     # Hash and persist the new password.
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await hash_password_async(new_password)
     db_session.add(user)
     await db_session.flush()
 
@@ -0,0 +1,173 @@
+"""Cached user account status for request authentication.
+
+``get_current_user`` needs the account status of the token owner on every
+protected request. The status is cached in Redis (shared by all workers) and,
+for a very short time, in process memory, so the common path makes no database
+call; the Redis entry is read together with the token blacklist flag in a single
+round-trip (see :func:`get_token_auth_state`). Flows that change a user's status
+or role invalidate the entry explicitly after their commit, which keeps lockout
+immediate across workers; only the in-process tier of other workers may serve
+the previous status, bounded by ``USER_STATUS_LOCAL_CACHE_TTL_SECONDS``.
+"""
+
+import logging
+from collections import OrderedDict
+from time import monotonic
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import User, UserStatus
+from app.redis_client import (
+    decode_redis_value,
+    get_redis,
+    is_token_blacklisted,
+    is_token_blacklisted_with_value,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cached marker for user ids without a database row (e.g. after GDPR hard deletion).
+_MISSING_USER = "missing"
+
+_local_status_cache: OrderedDict[UUID, tuple[str, float]] = OrderedDict()
+
+
+def _user_status_key(user_id: UUID) -> str:
+    return f"user_status:{user_id}"
+
+
+def _decode_status(value: str) -> Optional[UserStatus]:
+    if value == _MISSING_USER:
+        return None
+    return UserStatus(value)
+
+
+def _local_get(user_id: UUID) -> Optional[str]:
+    entry = _local_status_cache.get(user_id)
+    if entry is None:
+        return None
+
+    value, expires_at = entry
+    if expires_at <= monotonic():
+        _local_status_cache.pop(user_id, None)
+        return None
+    return value
+
+
+def _local_set(user_id: UUID, value: str) -> None:
+    settings = get_settings()
+    if settings.USER_STATUS_LOCAL_CACHE_TTL_SECONDS <= 0:
+        return
+
+    _local_status_cache[user_id] = (
+        value,
+        monotonic() + settings.USER_STATUS_LOCAL_CACHE_TTL_SECONDS,
+    )
+    _local_status_cache.move_to_end(user_id)
+    while len(_local_status_cache) > settings.USER_STATUS_LOCAL_CACHE_MAX_ENTRIES:
+        _local_status_cache.popitem(last=False)
+
+
+async def load_user_status(db: AsyncSession, user_id: UUID) -> Optional[UserStatus]:
+    """Read a user's status from the database, selecting only the status column."""
+    return (await db.execute(select(User.status).where(User.id == user_id))).scalar_one_or_none()
+
+
+async def _load_and_cache_status(
+    db: AsyncSession, user_id: UUID, *, write_to_redis: bool = True
+) -> Optional[UserStatus]:
+    user_status = await load_user_status(db, user_id)
+    value = _MISSING_USER if user_status is None else user_status.value
+    if write_to_redis:
+        try:
+            redis_client = await get_redis()
+            await redis_client.setex(
+                _user_status_key(user_id), get_settings().USER_STATUS_CACHE_TTL_SECONDS, value
+            )
+        except Exception:
+            logger.warning("user_status_cache_unavailable_on_set")
+    _local_set(user_id, value)
+    return user_status
+
+
+async def get_user_status(db: AsyncSession, user_id: UUID) -> Optional[UserStatus]:
+    """Return the account status of a user, or ``None`` if the user does not exist.
+
+    Lookup order is process memory, Redis, then the database; database results
+    are written back to both cache tiers. Redis outages fall back to the database.
+
+    Args:
+        db: Database session used on cache misses
+        user_id: User ID from the access token
+    """
+    cached_value = _local_get(user_id)
+    if cached_value is not None:
+        return _decode_status(cached_value)
+
+    redis_available = True
+    try:
+        redis_client = await get_redis()
+        cached_value = decode_redis_value(await redis_client.get(_user_status_key(user_id)))
+    except Exception:
+        redis_available = False
+        logger.warning("user_status_cache_unavailable_on_get")
+
+    if cached_value is not None:
+        _local_set(user_id, cached_value)
+        return _decode_status(cached_value)
+
+    return await _load_and_cache_status(db, user_id, write_to_redis=redis_available)
+
+
+async def get_token_auth_state(
+    db: AsyncSession, token: str, user_id: UUID
+) -> tuple[bool, Optional[UserStatus]]:
+    """Return the blacklist flag of an access token and the status of its owner.
+
+    The blacklist flag and the cached status are fetched with one Redis ``MGET``;
+    an in-process status hit only leaves the blacklist lookup. The database is
+    queried only when the token is not blacklisted and the status is not cached.
+
+    Args:
+        db: Database session used on cache misses
+        token: Encoded access token
+        user_id: User ID from the access token
+
+    Returns:
+        Tuple of the blacklist flag and the user's status. The status is ``None``
+        for unknown users and is not looked up for blacklisted tokens.
+    """
+    cached_value = _local_get(user_id)
+    if cached_value is not None:
+        return await is_token_blacklisted(token), _decode_status(cached_value)
+
+    blacklisted, cached_value = await is_token_blacklisted_with_value(
+        token, _user_status_key(user_id)
+    )
+    if blacklisted:
+        return True, None
+
+    if cached_value is not None:
+        _local_set(user_id, cached_value)
+        return False, _decode_status(cached_value)
+
+    return False, await _load_and_cache_status(db, user_id)
+
+
+async def invalidate_user_status(user_id: UUID) -> None:
+    """Drop the cached status of a user.
+
+    Must be called after the transaction that changed the user's status or role
+    has been committed, so no concurrent request can re-cache the old value.
+    Redis errors are logged and swallowed; the entry then expires by TTL.
+    """
+    _local_status_cache.pop(user_id, None)
+    try:
+        redis_client = await get_redis()
+        await redis_client.delete(_user_status_key(user_id))
+    except Exception:
+        logger.warning("user_status_cache_unavailable_on_invalidate")
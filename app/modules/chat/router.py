@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.modules.auth.middleware import (
     ROLE_ADMIN,
     ROLE_CONSUMER,
@@ -34,18 +34,20 @@ from app.modules.chat.service import (
     send_message,
 )
 from app.monitoring import SPAM_MESSAGE_RATE_LIMIT_429_TOTAL
-from app.security.rate_limit import SlidingWindowRateLimiter
+from app.pagination import MAX_CURSOR_LENGTH
+from app.security.rate_limit import create_rate_limiter
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
-CHAT_MESSAGE_RATE_LIMITER = SlidingWindowRateLimiter(
+CHAT_MESSAGE_RATE_LIMITER = create_rate_limiter(
     max_requests=(
         settings.RATE_LIMIT_CHAT_MESSAGE_MAX_REQUESTS
         + settings.RATE_LIMIT_CHAT_MESSAGE_BURST_REQUESTS
     ),
     window_seconds=settings.RATE_LIMIT_CHAT_MESSAGE_WINDOW_SECONDS,
+    name="chat_message",
 )
 CHAT_CONTENT_FILTER = SpamContentFilter()
 
@@ -129,6 +131,7 @@ def get_chat_router(prefix: str = "/api/v1/chats", tags: list[str] | None = None
         response_model=ChatSessionListResponse,
         summary="List chat sessions for current user",
         responses={
+            400: {"description": "Invalid pagination cursor"},
             401: {"description": "Missing or invalid authentication token"},
         },
     )
@@ -146,11 +149,28 @@ def get_chat_router(prefix: str = "/api/v1/chats", tags: list[str] | None = None
             int,
             Query(ge=1, le=200, description="Maximum results per page"),
         ] = 50,
-        db: AsyncSession = Depends(get_db),
+        cursor: Annotated[
+            str | None,
+            Query(
+                max_length=MAX_CURSOR_LENGTH,
+                description="Opaque cursor from a previous page's next_cursor",
+            ),
+        ] = None,
+        include_total: Annotated[
+            bool | None,
+            Query(description="Count all matching sessions (default: page mode only)"),
+        ] = None,
+        db: AsyncSession = Depends(get_read_db),
     ) -> ChatSessionListResponse:
         """Return chat sessions where current user is creator or participant."""
         return await list_chat_sessions(
-            db=db, current_user=token_data, nano_id=nano_id, page=page, limit=limit
+            db=db,
+            current_user=token_data,
+            nano_id=nano_id,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     # ------------------------------------------------------------------
@@ -194,6 +214,7 @@ def get_chat_router(prefix: str = "/api/v1/chats", tags: list[str] | None = None
         response_model=ChatMessageListResponse,
         summary="Poll for messages in a chat session",
         responses={
+            400: {"description": "Invalid pagination cursor"},
             401: {"description": "Missing or invalid authentication token"},
             403: {"description": "User is not a participant of this session"},
             404: {"description": "Chat session not found"},
@@ -214,12 +235,24 @@ def get_chat_router(prefix: str = "/api/v1/chats", tags: list[str] | None = None
             int,
             Query(ge=1, le=200, description="Maximum results per page"),
         ] = 50,
+        cursor: Annotated[
+            str | None,
+            Query(
+                max_length=MAX_CURSOR_LENGTH,
+                description="Opaque cursor from a previous page's next_cursor",
+            ),
+        ] = None,
+        include_total: Annotated[
+            bool | None,
+            Query(description="Count all matching messages (default: page mode only)"),
+        ] = None,
         db: AsyncSession = Depends(get_db),
     ) -> ChatMessageListResponse:
         """Retrieve messages in a chat session in chronological order.
 
         Pass ``since`` (ISO-8601 timestamp) to implement polling: only messages
-        created strictly after that timestamp are returned.
+        created strictly after that timestamp are returned. Pass ``cursor`` to
+        continue from a previous page without counting or skipping rows.
         """
         return await list_messages(
             db=db,
@@ -228,6 +261,8 @@ def get_chat_router(prefix: str = "/api/v1/chats", tags: list[str] | None = None
             since=since,
             page=page,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     return router
@@ -37,13 +37,22 @@ class ChatSessionCreateResponse(BaseModel):
 class ChatSessionListMeta(BaseModel):
     """Metadata for session listing with pagination info."""
 
-    total_results: int = Field(ge=0, description="Total number of matching sessions")
+    total_results: int | None = Field(
+        ge=0, description="Total number of matching sessions (null when the count was skipped)"
+    )
     nano_filter_applied: bool = Field(description="Whether nano_id filter was applied")
-    current_page: int = Field(ge=1, description="Current page number")
+    current_page: int | None = Field(
+        ge=1, description="Current page number (null when paginating by cursor)"
+    )
     page_size: int = Field(ge=1, description="Maximum results per page")
-    total_pages: int = Field(ge=0, description="Total number of pages")
+    total_pages: int | None = Field(
+        ge=0, description="Total number of pages (null when the count was skipped)"
+    )
     has_next_page: bool = Field(description="Whether a next page exists")
     has_prev_page: bool = Field(description="Whether a previous page exists")
+    next_cursor: str | None = Field(
+        default=None, description="Opaque cursor for the next page (null on the last page)"
+    )
 
 
 class ChatSessionListResponse(BaseModel):
@@ -92,13 +101,22 @@ class ChatMessageCreateResponse(BaseModel):
 class ChatMessageListMeta(BaseModel):
     """Pagination and filter metadata for the message list response."""
 
-    total_results: int = Field(ge=0, description="Total number of matching messages")
+    total_results: int | None = Field(
+        ge=0, description="Total number of matching messages (null when the count was skipped)"
+    )
     since_filter_applied: bool = Field(description="Whether since timestamp filter was applied")
-    current_page: int = Field(ge=1, description="Current page number")
+    current_page: int | None = Field(
+        ge=1, description="Current page number (null when paginating by cursor)"
+    )
     page_size: int = Field(ge=1, description="Maximum results per page")
-    total_pages: int = Field(ge=0, description="Total number of pages")
+    total_pages: int | None = Field(
+        ge=0, description="Total number of pages (null when the count was skipped)"
+    )
     has_next_page: bool = Field(description="Whether a next page exists")
     has_prev_page: bool = Field(description="Whether a previous page exists")
+    next_cursor: str | None = Field(
+        default=None, description="Opaque cursor for the next page (null on the last page)"
+    )
 
 
 class ChatMessageListResponse(BaseModel):
@@ -1,10 +1,11 @@
 """Business logic for chat session and message endpoints."""
 
 from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import Select, and_, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +23,7 @@ from app.modules.chat.schemas import (
     ChatSessionListMeta,
     ChatSessionListResponse,
 )
+from app.pagination import paginate_keyset_or_400, should_count_total, split_page
 
 
 def _to_session_data(session: ChatSession, current_user_id: UUID) -> ChatSessionData:
@@ -41,6 +43,39 @@ def _to_session_data(session: ChatSession, current_user_id: UUID) -> ChatSession
     )
 
 
+async def _count_if_requested(
+    db: AsyncSession,
+    id_query: Select,
+    cursor: str | None,
+    include_total: bool | None,
+) -> int | None:
+    """Count the rows of ``id_query`` unless the caller is scrolling by cursor."""
+    if not should_count_total(cursor, include_total):
+        return None
+    count_query = select(func.count()).select_from(id_query.subquery())
+    return (await db.execute(count_query)).scalar_one()
+
+
+def _page_meta_fields(
+    page: int,
+    limit: int,
+    cursor: str | None,
+    total_results: int | None,
+    next_cursor: str | None,
+) -> dict[str, Any]:
+    """Pagination fields shared by the session and message list metadata."""
+    return {
+        "current_page": None if cursor is not None else page,
+        "page_size": limit,
+        "total_pages": (
+            (total_results + limit - 1) // limit if total_results is not None else None
+        ),
+        "has_next_page": next_cursor is not None,
+        "has_prev_page": cursor is not None or page > 1,
+        "next_cursor": next_cursor,
+    }
+
+
 async def create_or_get_chat_session(
     *,
     db: AsyncSession,
@@ -140,8 +175,13 @@ async def list_chat_sessions(
     nano_id: UUID | None = None,
     page: int = 1,
     limit: int = 50,
+    cursor: str | None = None,
+    include_total: bool | None = None,
 ) -> ChatSessionListResponse:
-    """List chat sessions where current user is one of the participants (paginated)."""
+    """List chat sessions where current user is one of the participants (paginated).
+
+    ``cursor`` (a previous page's ``next_cursor``) takes precedence over ``page``.
+    """
     filters = [
         or_(
             ChatSession.creator_id == current_user.user_id,
@@ -151,22 +191,24 @@ async def list_chat_sessions(
     if nano_id is not None:
         filters.append(ChatSession.nano_id == nano_id)
 
-    count_query = select(func.count()).select_from(
-        select(ChatSession.id).where(and_(*filters)).subquery()
+    total_results = await _count_if_requested(
+        db, select(ChatSession.id).where(and_(*filters)), cursor, include_total
     )
-    total_results = (await db.execute(count_query)).scalar_one()
-
-    offset = (page - 1) * limit
-    query = (
-        select(ChatSession)
-        .where(and_(*filters))
-        .order_by(ChatSession.updated_at.desc(), ChatSession.created_at.desc())
-        .offset(offset)
-        .limit(limit)
+
+    query = paginate_keyset_or_400(
+        select(ChatSession).where(and_(*filters)),
+        (ChatSession.updated_at, ChatSession.created_at, ChatSession.id),
+        limit=limit,
+        cursor=cursor,
+        offset=(page - 1) * limit,
+        descending=True,
     )
 
-    rows = (await db.execute(query)).scalars().all()
-    total_pages = (total_results + limit - 1) // limit if limit > 0 else 1
+    rows, next_cursor = split_page(
+        (await db.execute(query)).scalars().all(),
+        limit,
+        lambda session: (session.updated_at, session.created_at, session.id),
+    )
     now = datetime.now(timezone.utc)
     return ChatSessionListResponse(
         success=True,
@@ -174,11 +216,7 @@ async def list_chat_sessions(
         meta=ChatSessionListMeta(
             total_results=total_results,
             nano_filter_applied=nano_id is not None,
-            current_page=page,
-            page_size=limit,
-            total_pages=total_pages,
-            has_next_page=page < total_pages,
-            has_prev_page=page > 1,
+            **_page_meta_fields(page, limit, cursor, total_results, next_cursor),
         ),
         timestamp=now,
     )
@@ -288,11 +326,14 @@ async def list_messages(
     since: datetime | None = None,
     page: int = 1,
     limit: int = 50,
+    cursor: str | None = None,
+    include_total: bool | None = None,
 ) -> ChatMessageListResponse:
     """Return messages in a chat session in chronological order.
 
     The ``since`` parameter enables polling: passing the ``created_at`` of the
-    last received message returns only newer messages.
+    last received message returns only newer messages. ``cursor`` (a previous
+    page's ``next_cursor``) pages through history without an OFFSET scan.
     """
     await _get_session_or_403(
         db=db,
@@ -304,22 +345,23 @@ async def list_messages(
     if since is not None:
         filters.append(ChatMessage.created_at > since)
 
-    count_query = select(func.count()).select_from(
-        select(ChatMessage.id).where(and_(*filters)).subquery()
+    total_results = await _count_if_requested(
+        db, select(ChatMessage.id).where(and_(*filters)), cursor, include_total
     )
-    total_results = (await db.execute(count_query)).scalar_one()
-
-    offset = (page - 1) * limit
-    query = (
-        select(ChatMessage)
-        .where(and_(*filters))
-        .order_by(ChatMessage.created_at.asc(), ChatMessage.id.asc())
-        .offset(offset)
-        .limit(limit)
+
+    query = paginate_keyset_or_400(
+        select(ChatMessage).where(and_(*filters)),
+        (ChatMessage.created_at, ChatMessage.id),
+        limit=limit,
+        cursor=cursor,
+        offset=(page - 1) * limit,
     )
 
-    rows = (await db.execute(query)).scalars().all()
-    total_pages = (total_results + limit - 1) // limit if limit > 0 else 1
+    rows, next_cursor = split_page(
+        (await db.execute(query)).scalars().all(),
+        limit,
+        lambda msg: (msg.created_at, msg.id),
+    )
     now = datetime.now(timezone.utc)
     return ChatMessageListResponse(
         success=True,
@@ -327,11 +369,7 @@ async def list_messages(
         meta=ChatMessageListMeta(
             total_results=total_results,
             since_filter_applied=since is not None,
-            current_page=page,
-            page_size=limit,
-            total_pages=total_pages,
-            has_next_page=page < total_pages,
-            has_prev_page=page > 1,
+            **_page_meta_fields(page, limit, cursor, total_results, next_cursor),
         ),
         timestamp=now,
     )
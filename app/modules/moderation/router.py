@@ -34,6 +34,7 @@ from app.modules.moderation.service import (
     get_moderation_queue,
     review_moderation_case,
 )
+from app.pagination import MAX_CURSOR_LENGTH
 
 
 def get_moderation_router(
@@ -70,6 +71,10 @@ def get_moderation_router(
           every status.
         - ``page``: 1-indexed page number (default: 1).
         - ``limit``: Results per page (1–100, default: 20).
+        - ``cursor``: Opaque ``next_cursor`` from a previous page; takes precedence over
+          ``page`` and avoids the OFFSET scan on deep pages.
+        - ``include_total``: Force or skip the total count (default: only for ``page``
+          requests).
 
         **Response:** Paginated list of :class:`ModerationQueueItem` objects enriched
         with type-specific ``content_detail``.
@@ -91,6 +96,16 @@ def get_moderation_router(
         ] = "pending",
         page: Annotated[int, Query(ge=1, description="Page number (1-indexed)")] = 1,
         limit: Annotated[int, Query(ge=1, le=100, description="Results per page (1–100)")] = 20,
+        cursor: Annotated[
+            str | None,
+            Query(
+                max_length=MAX_CURSOR_LENGTH,
+                description="Opaque cursor from a previous page's next_cursor",
+            ),
+        ] = None,
+        include_total: Annotated[
+            bool | None, Query(description="Count all matching cases (default: page mode only)")
+        ] = None,
     ) -> ModerationQueueResponse:
         # Map "all" to None so the service includes all statuses.
         resolved_status: ModerationCaseStatus | None
@@ -116,6 +131,8 @@ def get_moderation_router(
             status_filter=resolved_status,
             page=page,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     @router.get(
@@ -149,12 +149,13 @@ class ModerationQueueItem(BaseModel):
 class PaginationMeta(BaseModel):
     """Pagination metadata for list responses."""
 
-    current_page: int
+    current_page: Optional[int]
     page_size: int
-    total_results: int
-    total_pages: int
+    total_results: Optional[int]
+    total_pages: Optional[int]
     has_next_page: bool
     has_prev_page: bool
+    next_cursor: Optional[str] = None
 
 
 class ModerationQueueResponse(BaseModel):
@@ -26,7 +26,6 @@ Design notes
 
 import logging
 from datetime import datetime, timezone
-from decimal import ROUND_HALF_UP, Decimal
 from typing import Optional
 from uuid import UUID
 
@@ -63,7 +62,9 @@ from app.modules.moderation.schemas import (
     PaginationMeta,
     RatingContentDetail,
 )
-from app.modules.search.service import invalidate_search_cache
+from app.modules.nanos.ratings import apply_rating_change
+from app.modules.search.service import invalidate_search_cache_for_nano, sync_nano_search_document
+from app.pagination import paginate_keyset_or_400, should_count_total, split_page
 
 logger = logging.getLogger(__name__)
 
@@ -155,11 +156,13 @@ async def get_moderation_queue(
     status_filter: Optional[ModerationCaseStatus] = ModerationCaseStatus.PENDING,
     page: int = 1,
     limit: int = 20,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
 ) -> ModerationQueueResponse:
     """Return a paginated, filterable moderation queue.
 
     The queue is sorted by ``created_at`` ascending (FIFO) so that the oldest
-    cases are reviewed first.
+    cases are reviewed first; ``id`` breaks ties so keyset cursors are stable.
 
     Args:
         db:            Active database session.
@@ -169,6 +172,10 @@ async def get_moderation_queue(
                        queue).  Pass ``None`` to include all statuses.
         page:          1-indexed page number.
         limit:         Results per page (1–100).
+        cursor:        Opaque keyset cursor from a previous page's
+                       ``next_cursor``; takes precedence over ``page``.
+        include_total: Force (``True``) or skip (``False``) the total count.
+                       By default it is computed for offset pages only.
 
     Returns:
         :class:`~app.modules.moderation.schemas.ModerationQueueResponse`
@@ -181,7 +188,7 @@ async def get_moderation_queue(
             await db.commit()
 
     # --- Build base query ---------------------------------------------------
-    base_stmt = select(ModerationCase).order_by(ModerationCase.created_at, ModerationCase.id)
+    base_stmt = select(ModerationCase)
 
     if status_filter is not None:
         base_stmt = base_stmt.where(ModerationCase.status == status_filter)
@@ -190,16 +197,25 @@ async def get_moderation_queue(
         base_stmt = base_stmt.where(ModerationCase.content_type == content_type)
 
     # --- Count total matching rows ------------------------------------------
-    count_stmt = select(func.count()).select_from(base_stmt.subquery())
-    total_results = int(await db.scalar(count_stmt) or 0)
+    total_results: Optional[int] = None
+    total_pages: Optional[int] = None
+    if should_count_total(cursor, include_total):
+        count_stmt = select(func.count()).select_from(base_stmt.subquery())
+        total_results = int(await db.scalar(count_stmt) or 0)
+        total_pages = (total_results + limit - 1) // limit
 
     # --- Fetch current page -------------------------------------------------
-    offset = (page - 1) * limit
-    page_stmt = base_stmt.offset(offset).limit(limit)
+    page_stmt = paginate_keyset_or_400(
+        base_stmt,
+        (ModerationCase.created_at, ModerationCase.id),
+        limit=limit,
+        cursor=cursor,
+        offset=(page - 1) * limit,
+    )
     page_result = await db.execute(page_stmt)
-    cases = page_result.scalars().all()
-
-    total_pages = (total_results + limit - 1) // limit if limit > 0 else 1
+    cases, next_cursor = split_page(
+        page_result.scalars().all(), limit, lambda case: (case.created_at, case.id)
+    )
 
     # --- Enrich each case with content details ------------------------------
     detail_map = await _load_content_details_for_cases(db, cases)
@@ -227,12 +243,13 @@ async def get_moderation_queue(
     return ModerationQueueResponse(
         items=items,
         pagination=PaginationMeta(
-            current_page=page,
+            current_page=None if cursor is not None else page,
             page_size=limit,
             total_results=total_results,
             total_pages=total_pages,
-            has_next_page=page < total_pages,
-            has_prev_page=page > 1,
+            has_next_page=next_cursor is not None,
+            has_prev_page=cursor is not None or page > 1,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -469,7 +486,7 @@ async def review_moderation_case(
     case.deferred_until = request.deferred_until if request.decision == "defer" else None
 
     # --- Apply decision to underlying content --------------------------------
-    nano_visibility_changed = await _apply_decision_to_content(
+    nano_status_change = await _apply_decision_to_content(
         db=db,
         case=case,
         decided_by=decided_by,
@@ -509,9 +526,23 @@ async def review_moderation_case(
     # --- Single atomic commit for case + content + audit --------------------
     await db.commit()
 
-    # Keep search results consistent when moderation changes Nano visibility.
-    if nano_visibility_changed:
-        await invalidate_search_cache(reason="moderation_nano_status_reviewed")
+    # Keep search results consistent when moderation changes Nano status.
+    if nano_status_change is not None:
+        old_nano_status, new_nano_status = nano_status_change
+        await sync_nano_search_document(
+            db,
+            case.content_id,
+            reason="moderation_nano_status_reviewed",
+            old_status=old_nano_status,
+            new_status=new_nano_status,
+        )
+        await invalidate_search_cache_for_nano(
+            db,
+            case.content_id,
+            reason="moderation_nano_status_reviewed",
+            old_status=old_nano_status,
+            new_status=new_nano_status,
+        )
 
     await db.refresh(case)
 
@@ -547,11 +578,15 @@ async def _apply_decision_to_content(
     decided_by: TokenData,
     request: ModerationReviewRequest,
     now: datetime,
-) -> bool:
+) -> Optional[tuple[NanoStatus, NanoStatus]]:
     """Update the underlying content record based on the moderation decision.
 
     Modifications are flushed to the session but NOT committed here; the
     caller is responsible for the final commit.
+
+    Returns:
+        ``(old_status, new_status)`` when a Nano decision changed its status,
+        otherwise ``None``.
     """
     decision = request.decision
 
@@ -573,7 +608,7 @@ async def _apply_decision_to_content(
             db=db, case=case, decided_by=decided_by, decision=decision, now=now
         )
 
-    return False
+    return None
 
 
 async def _apply_nano_decision(
@@ -582,16 +617,21 @@ async def _apply_nano_decision(
     case: ModerationCase,
     decision: str,
     now: datetime,
-) -> bool:
-    """Apply an approve/reject/defer/escalate decision to a Nano."""
+) -> Optional[tuple[NanoStatus, NanoStatus]]:
+    """Apply an approve/reject/defer/escalate decision to a Nano.
+
+    Returns:
+        ``(old_status, new_status)`` for approve/reject, otherwise ``None``.
+    """
     stmt = select(Nano).where(Nano.id == case.content_id)
     result = await db.execute(stmt)
     nano = result.scalar_one_or_none()
 
     if not nano:
         # Content was deleted before the case was decided — nothing to update.
-        return False
+        return None
 
+    old_status = nano.status
     if decision == "approve":
         # Validate that the Nano has all required metadata before publishing.
         _validate_nano_publishable(nano)
@@ -604,7 +644,9 @@ async def _apply_nano_decision(
 
     # defer / escalate: leave nano in pending_review; no status change.
     await db.flush()
-    return decision in {"approve", "reject"}
+    if decision not in {"approve", "reject"}:
+        return None
+    return old_status, nano.status
 
 
 def _validate_nano_publishable(nano: Nano) -> None:
@@ -645,7 +687,13 @@ async def _apply_rating_decision(
     now: datetime,
 ) -> None:
     """Apply an approve/reject/defer/escalate decision to a NanoRating."""
-    stmt = select(NanoRating).where(NanoRating.id == case.content_id)
+    # Lock the rating so the before state fed to the histogram delta is current
+    stmt = (
+        select(NanoRating)
+        .where(NanoRating.id == case.content_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
     result = await db.execute(stmt)
     rating = result.scalar_one_or_none()
 
@@ -653,14 +701,15 @@ async def _apply_rating_decision(
         return
 
     decision = request.decision
+    previous_state = (rating.score, rating.moderation_status)
     if decision == "approve":
         rating.moderation_status = FeedbackModerationStatus.APPROVED
         rating.moderated_at = now
         rating.moderated_by_user_id = decided_by.user_id
         rating.moderation_reason = request.reason
         await db.flush()
-        # Sync denormalised rating cache on the parent Nano
-        await _sync_nano_rating_cache(db=db, nano_id=rating.nano_id)
+        # Move the vote into the parent Nano's denormalised rating histogram
+        await _apply_rating_change(db=db, rating=rating, before=previous_state)
 
     elif decision == "reject":
         rating.moderation_status = FeedbackModerationStatus.HIDDEN
@@ -668,8 +717,8 @@ async def _apply_rating_decision(
         rating.moderated_by_user_id = decided_by.user_id
         rating.moderation_reason = request.reason
         await db.flush()
-        # Sync denormalised rating cache on the parent Nano
-        await _sync_nano_rating_cache(db=db, nano_id=rating.nano_id)
+        # Remove a previously approved vote from the parent Nano's histogram
+        await _apply_rating_change(db=db, rating=rating, before=previous_state)
 
     # defer / escalate: leave rating as PENDING, no moderation_status update.
     await db.flush()
@@ -736,39 +785,22 @@ async def _apply_flag_decision(
     await db.flush()
 
 
-async def _sync_nano_rating_cache(*, db: AsyncSession, nano_id: UUID) -> None:
-    """Recompute and persist the denormalised average_rating / rating_count on Nano.
-
-    This is a local reimplementation to avoid a cross-module import cycle with
-    ``app.modules.nanos.service``.  The query is identical to the one in that
-    module.
-    """
-    stmt = select(Nano).where(Nano.id == nano_id)
+async def _apply_rating_change(
+    *,
+    db: AsyncSession,
+    rating: NanoRating,
+    before: tuple[int, FeedbackModerationStatus],
+) -> None:
+    """Apply a rating's status change to the parent Nano's rating histogram cache."""
+    stmt = select(Nano).where(Nano.id == rating.nano_id)
     result = await db.execute(stmt)
     nano = result.scalar_one_or_none()
     if not nano:
         return
 
-    agg_stmt = select(
-        func.count(NanoRating.id),
-        func.avg(NanoRating.score),
-    ).where(
-        NanoRating.nano_id == nano_id,
-        NanoRating.moderation_status == FeedbackModerationStatus.APPROVED,
+    await apply_rating_change(
+        nano, db, before=before, after=(rating.score, rating.moderation_status)
     )
-    agg_result = await db.execute(agg_stmt)
-    rating_count_raw, average_raw = agg_result.one()
-
-    rating_count = int(rating_count_raw)
-    if rating_count == 0:
-        nano.average_rating = Decimal("0.00")
-        nano.rating_count = 0
-    else:
-        nano.average_rating = Decimal(str(average_raw)).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        nano.rating_count = rating_count
-
     await db.flush()
 
 
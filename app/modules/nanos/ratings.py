@@ -0,0 +1,263 @@
+"""
+Star-rating aggregation shared by the nanos and moderation services.
+
+Scores are integers from 1 to 5, so the five per-score counts are enough to
+derive count, sum, average and median in Python. Each Nano caches that
+histogram of approved ratings in ``rating_count_1`` .. ``rating_count_5``;
+rating writes move one vote between buckets with an atomic
+``UPDATE ... SET rating_count_N = rating_count_N + 1`` and refresh the cached
+``average_rating``/``rating_count`` from the returned counters, so summaries
+never scan ``nano_ratings``. Callers read a rating's before state with
+``SELECT ... FOR UPDATE``, so concurrent writes to the same rating apply their
+deltas one after another instead of both starting from the same state.
+Deleting a user removes their ratings through ``ON DELETE CASCADE``, so
+:func:`remove_user_ratings` must run first in the same transaction. :func:`repair_nano_rating_caches` recomputes the counters from
+scratch to fix drift left by writes that bypass this module (e.g. manual SQL).
+"""
+
+import logging
+from collections.abc import Mapping, Sequence
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional, cast
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models import FeedbackModerationStatus, Nano, NanoRating
+from app.modules.nanos.schemas import NanoRatingAggregation, NanoRatingDistributionItem
+
+logger = logging.getLogger(__name__)
+
+RATING_SCORES = range(1, 6)
+
+# (score, moderation_status) of a rating before or after a write
+RatingState = tuple[int, FeedbackModerationStatus]
+
+
+def quantize_rating(value: Decimal) -> Decimal:
+    """Normalize a rating value to two decimal places."""
+    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def _histogram_column(score: int) -> InstrumentedAttribute[int]:
+    return cast(InstrumentedAttribute[int], getattr(Nano, f"rating_count_{score}"))
+
+
+def _score_at(histogram: Mapping[int, int], position: int) -> int:
+    """Return the score at a 0-indexed position of the sorted ratings."""
+    seen = 0
+    for score in RATING_SCORES:
+        seen += histogram.get(score, 0)
+        if position < seen:
+            return score
+    raise ValueError(f"Position {position} is outside the rating histogram")
+
+
+def aggregation_from_histogram(histogram: Mapping[int, int]) -> NanoRatingAggregation:
+    """Derive count, average, median and distribution from per-score counts."""
+    counts = {score: max(histogram.get(score, 0), 0) for score in RATING_SCORES}
+    distribution = [
+        NanoRatingDistributionItem(score=score, count=counts[score]) for score in RATING_SCORES
+    ]
+    rating_count = sum(counts.values())
+    if rating_count == 0:
+        return NanoRatingAggregation(
+            average_rating=Decimal("0.00"),
+            median_rating=Decimal("0.00"),
+            rating_count=0,
+            distribution=distribution,
+        )
+
+    score_sum = sum(score * count for score, count in counts.items())
+    lower_median = _score_at(counts, (rating_count - 1) // 2)
+    upper_median = _score_at(counts, rating_count // 2)
+
+    return NanoRatingAggregation(
+        average_rating=quantize_rating(Decimal(score_sum) / Decimal(rating_count)),
+        median_rating=quantize_rating(Decimal(lower_median + upper_median) / Decimal("2")),
+        rating_count=rating_count,
+        distribution=distribution,
+    )
+
+
+def nano_rating_aggregation(nano: Nano) -> NanoRatingAggregation:
+    """Build the rating aggregation from a Nano's cached histogram (no query)."""
+    return aggregation_from_histogram(
+        {score: getattr(nano, f"rating_count_{score}") for score in RATING_SCORES}
+    )
+
+
+def _store_histogram(nano: Nano, histogram: Mapping[int, int]) -> NanoRatingAggregation:
+    """Cache average and count derived from ``histogram`` on the Nano."""
+    aggregation = aggregation_from_histogram(histogram)
+    nano.average_rating = aggregation.average_rating
+    nano.rating_count = aggregation.rating_count
+    return aggregation
+
+
+def _counted_score(state: Optional[RatingState]) -> Optional[int]:
+    if state is None:
+        return None
+    score, moderation_status = state
+    return score if moderation_status == FeedbackModerationStatus.APPROVED else None
+
+
+async def apply_rating_change(
+    nano: Nano,
+    db: AsyncSession,
+    *,
+    before: Optional[RatingState],
+    after: Optional[RatingState],
+) -> NanoRatingAggregation:
+    """Move one rating between the Nano's histogram buckets.
+
+    Only approved ratings are counted, so a new pending rating or a pending
+    score change is a no-op, while moderation flips into or out of APPROVED
+    add or remove one vote. The counter UPDATE holds the Nano row lock until
+    commit, so the cached average is always derived from counters that include
+    every concurrent delta.
+
+    Args:
+        nano: Parent Nano of the rating (loaded in ``db``).
+        db: Database session; the caller commits.
+        before: Rating state before the write, or None for a new rating. Read it
+            from a row locked ``FOR UPDATE`` so a concurrent write cannot apply
+            the same transition twice.
+        after: Rating state after the write, or None for a removed rating.
+    """
+    deltas: dict[int, int] = {}
+    previous_score = _counted_score(before)
+    if previous_score is not None:
+        deltas[previous_score] = deltas.get(previous_score, 0) - 1
+    new_score = _counted_score(after)
+    if new_score is not None:
+        deltas[new_score] = deltas.get(new_score, 0) + 1
+    deltas = {score: delta for score, delta in deltas.items() if delta}
+    if not deltas:
+        return nano_rating_aggregation(nano)
+
+    stmt = (
+        update(Nano)
+        .where(Nano.id == nano.id)
+        .values(
+            {
+                _histogram_column(score): _histogram_column(score) + delta
+                for score, delta in deltas.items()
+            }
+        )
+        .returning(*(_histogram_column(score) for score in RATING_SCORES))
+        .execution_options(synchronize_session=False)
+    )
+    counters = (await db.execute(stmt)).one()
+    histogram = dict(zip(RATING_SCORES, counters))
+    for score, count in histogram.items():
+        set_committed_value(nano, f"rating_count_{score}", count)
+    return _store_histogram(nano, histogram)
+
+
+async def remove_user_ratings(db: AsyncSession, user_id: UUID) -> list[UUID]:
+    """Take a user's approved ratings out of the cached histograms.
+
+    Call before deleting the user: their ``nano_ratings`` rows are removed by
+    ``ON DELETE CASCADE``, which never reaches :func:`apply_rating_change`.
+
+    Args:
+        db: Database session; the caller deletes the user and commits.
+        user_id: ID of the user about to be deleted.
+
+    Returns:
+        IDs of the Nanos whose counters were decremented.
+    """
+    ratings_stmt = (
+        select(NanoRating.nano_id, NanoRating.score)
+        .where(
+            NanoRating.user_id == user_id,
+            NanoRating.moderation_status == FeedbackModerationStatus.APPROVED,
+        )
+        .with_for_update()
+    )
+    scores = {nano_id: score for nano_id, score in (await db.execute(ratings_stmt)).all()}
+    if not scores:
+        return []
+
+    nanos = (await db.execute(select(Nano).where(Nano.id.in_(scores)))).scalars().all()
+    for nano in nanos:
+        await apply_rating_change(
+            nano,
+            db,
+            before=(scores[nano.id], FeedbackModerationStatus.APPROVED),
+            after=None,
+        )
+    return [nano.id for nano in nanos]
+
+
+async def _approved_histograms(
+    db: AsyncSession, nano_ids: Sequence[UUID]
+) -> dict[UUID, dict[int, int]]:
+    """Count approved ratings per Nano and score with one grouped query."""
+    histogram_stmt = (
+        select(NanoRating.nano_id, NanoRating.score, func.count(NanoRating.id))
+        .where(
+            NanoRating.nano_id.in_(nano_ids),
+            NanoRating.moderation_status == FeedbackModerationStatus.APPROVED,
+        )
+        .group_by(NanoRating.nano_id, NanoRating.score)
+    )
+    histograms: dict[UUID, dict[int, int]] = {}
+    for nano_id, score, score_count in (await db.execute(histogram_stmt)).all():
+        histograms.setdefault(nano_id, {})[int(score)] = int(score_count)
+    return histograms
+
+
+def _reset_histogram(nano: Nano, histogram: Mapping[int, int]) -> bool:
+    """Overwrite the Nano's cached rating fields; return True if anything changed."""
+    counts = {score: histogram.get(score, 0) for score in RATING_SCORES}
+    cached = {score: getattr(nano, f"rating_count_{score}") for score in RATING_SCORES}
+    previous = (nano.average_rating, nano.rating_count)
+    for score, count in counts.items():
+        setattr(nano, f"rating_count_{score}", count)
+    _store_histogram(nano, counts)
+    return cached != counts or previous != (nano.average_rating, nano.rating_count)
+
+
+async def recompute_nano_rating_cache(nano: Nano, db: AsyncSession) -> NanoRatingAggregation:
+    """Rebuild one Nano's cached histogram from ``nano_ratings``.
+
+    For callers that write ratings without going through :func:`apply_rating_change`,
+    such as seed scripts.
+    """
+    histograms = await _approved_histograms(db, [nano.id])
+    _reset_histogram(nano, histograms.get(nano.id, {}))
+    return nano_rating_aggregation(nano)
+
+
+async def repair_nano_rating_caches(db: AsyncSession, *, batch_size: int = 500) -> list[UUID]:
+    """Recompute every Nano's rating histogram from ``nano_ratings`` and fix drift.
+
+    Nanos are processed in ``id`` order in batches, each locked ``FOR UPDATE``
+    and committed on its own so concurrent rating writes wait at most one batch.
+
+    Returns:
+        IDs of the Nanos whose cached counters or average were corrected.
+    """
+    repaired: list[UUID] = []
+    last_id: Optional[UUID] = None
+    while True:
+        batch_stmt = select(Nano).order_by(Nano.id).limit(batch_size).with_for_update()
+        if last_id is not None:
+            batch_stmt = batch_stmt.where(Nano.id > last_id)
+        nanos = (await db.execute(batch_stmt)).scalars().all()
+        if not nanos:
+            return repaired
+
+        histograms = await _approved_histograms(db, [nano.id for nano in nanos])
+        for nano in nanos:
+            if _reset_histogram(nano, histograms.get(nano.id, {})):
+                repaired.append(nano.id)
+                logger.warning("nano_rating_cache_repaired nano_id=%s", nano.id)
+
+        last_id = nanos[-1].id
+        await db.commit()
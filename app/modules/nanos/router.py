@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.modules.auth.middleware import (
     ROLE_ADMIN,
     ROLE_CREATOR,
@@ -71,6 +71,7 @@ from app.modules.nanos.service import (
     update_nano_status,
 )
 from app.monitoring import FeedbackMetricsRoute, record_feedback_moderation_decision
+from app.pagination import MAX_CURSOR_LENGTH
 
 
 def get_nanos_router(prefix: str = "/api/v1/nanos", tags: list[str] | None = None) -> APIRouter:
@@ -153,18 +154,22 @@ def get_nanos_router(prefix: str = "/api/v1/nanos", tags: list[str] | None = Non
         - `page`: Page number (1-indexed, default 1)
         - `limit`: Results per page (default 20, max 100)
         - `status`: Optional status filter (draft, published, archived, etc.)
+        - `cursor`: Opaque `next_cursor` from a previous page (takes precedence over `page`)
+        - `include_total`: Force or skip the total count (default: only for `page` requests)
 
         **Response:**
         - List of creator's Nanos with pagination metadata
-        - Results ordered by updated_at (newest first)
+        - Results ordered by updated_at (newest first), ties broken by id
 
         **Error Cases:**
+        - 400: Invalid status filter or cursor
         - 401: Not authenticated
         - 403: User is not a creator
         - 404: Creator not found
         """,
         responses={
             200: {"description": "Creator's Nanos list retrieved successfully"},
+            400: {"description": "Invalid status filter or cursor"},
             401: {"description": "Not authenticated"},
             403: {"description": "User is not a creator"},
             404: {"description": "Creator not found"},
@@ -174,6 +179,16 @@ def get_nanos_router(prefix: str = "/api/v1/nanos", tags: list[str] | None = Non
         page: Annotated[int, Query(ge=1, description="Page number")] = 1,
         limit: Annotated[int, Query(ge=1, le=100, description="Results per page")] = 20,
         status: Annotated[str | None, Query(description="Optional status filter")] = None,
+        cursor: Annotated[
+            str | None,
+            Query(
+                max_length=MAX_CURSOR_LENGTH,
+                description="Opaque cursor from a previous page's next_cursor",
+            ),
+        ] = None,
+        include_total: Annotated[
+            bool | None, Query(description="Count all matching Nanos (default: page mode only)")
+        ] = None,
         current_user: Annotated[
             TokenData,
             Depends(
@@ -185,7 +200,7 @@ def get_nanos_router(prefix: str = "/api/v1/nanos", tags: list[str] | None = Non
                 )
             ),
         ] = None,
-        db: Annotated[AsyncSession, Depends(get_db)] = None,
+        db: Annotated[AsyncSession, Depends(get_read_db)] = None,
     ) -> CreatorNanoListResponse:
         """Get creator's Nano list with pagination."""
         return await get_creator_nanos(
@@ -194,6 +209,8 @@ def get_nanos_router(prefix: str = "/api/v1/nanos", tags: list[str] | None = Non
             page=page,
             limit=limit,
             status_filter=status,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     @router.get(
@@ -291,7 +308,7 @@ def get_nanos_router(prefix: str = "/api/v1/nanos", tags: list[str] | None = Non
     async def get_nano_detail_view(
         nano_id: UUID,
         current_user: Annotated[TokenData | None, Depends(get_optional_current_user)],
-        db: Annotated[AsyncSession, Depends(get_db)],
+        db: Annotated[AsyncSession, Depends(get_read_db)],
     ) -> NanoDetailResponse:
         """Get Nano detail payload with visibility and download-access hints."""
         return await get_nano_detail(nano_id=nano_id, db=db, current_user=current_user)
@@ -483,25 +500,44 @@ def get_nanos_router(prefix: str = "/api/v1/nanos", tags: list[str] | None = Non
         **Query Parameters:**
         - `page`: Page number (1-indexed, default 1)
         - `limit`: Results per page (default 20, max 100)
+        - `cursor`: Opaque `next_cursor` from a previous page (takes precedence over `page`)
+        - `include_total`: Force or skip the total count (default: only for `page` requests)
 
         **Error Cases:**
-        - 400: Nano is not published (comments not allowed)
+        - 400: Nano is not published (comments not allowed) or invalid cursor
         - 404: Nano not found
         """,
         responses={
             200: {"description": "Comments retrieved successfully"},
-            400: {"description": "Nano is not published"},
+            400: {"description": "Nano is not published or invalid cursor"},
             404: {"description": "Nano not found"},
         },
     )
     async def list_nano_comments_endpoint(
         nano_id: UUID,
-        db: Annotated[AsyncSession, Depends(get_db)],
+        db: Annotated[AsyncSession, Depends(get_read_db)],
         page: Annotated[int, Query(ge=1, description="Page number")] = 1,
         limit: Annotated[int, Query(ge=1, le=100, description="Results per page")] = 20,
+        cursor: Annotated[
+            str | None,
+            Query(
+                max_length=MAX_CURSOR_LENGTH,
+                description="Opaque cursor from a previous page's next_cursor",
+            ),
+        ] = None,
+        include_total: Annotated[
+            bool | None, Query(description="Count all comments (default: page mode only)")
+        ] = None,
     ) -> NanoCommentListResponse:
         """List comments for a published Nano with deterministic pagination."""
-        return await get_nano_comments(nano_id=nano_id, db=db, page=page, limit=limit)
+        return await get_nano_comments(
+            nano_id=nano_id,
+            db=db,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
 
     @router.post(
         "/{nano_id}/flags",
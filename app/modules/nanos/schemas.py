@@ -605,12 +605,21 @@ class CreatorNanoListItem(BaseModel):
 class PaginationMeta(BaseModel):
     """Pagination metadata for list responses."""
 
-    current_page: int = Field(..., ge=1, description="Current page number")
+    current_page: Optional[int] = Field(
+        ..., ge=1, description="Current page number (null when paginating by cursor)"
+    )
     page_size: int = Field(..., ge=1, description="Results per page")
-    total_results: int = Field(..., ge=0, description="Total number of results")
-    total_pages: int = Field(..., ge=0, description="Total number of pages")
+    total_results: Optional[int] = Field(
+        ..., ge=0, description="Total number of results (null when the count was skipped)"
+    )
+    total_pages: Optional[int] = Field(
+        ..., ge=0, description="Total number of pages (null when the count was skipped)"
+    )
     has_next_page: bool = Field(..., description="Whether there is a next page")
     has_prev_page: bool = Field(..., description="Whether there is a previous page")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page (null on the last page)"
+    )
 
 
 class CreatorNanoListResponse(BaseModel):
@@ -7,12 +7,12 @@ Nano metadata with proper validation and authorization checks.
 
 import logging
 from datetime import datetime, timezone
-from decimal import ROUND_HALF_UP, Decimal
+from decimal import Decimal
 from html import escape
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import desc, func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ColumnElement
@@ -38,6 +38,7 @@ from app.models import (
 from app.modules.audit.service import AuditLogger
 from app.modules.auth.tokens import TokenData
 from app.modules.moderation.service import upsert_moderation_case
+from app.modules.nanos.ratings import apply_rating_change, nano_rating_aggregation
 from app.modules.nanos.schemas import (
     AdminTakedownRequest,
     AdminTakedownResponse,
@@ -65,8 +66,6 @@ from app.modules.nanos.schemas import (
     NanoFlagCreateRequest,
     NanoFlagResponse,
     NanoMetadataResponse,
-    NanoRatingAggregation,
-    NanoRatingDistributionItem,
     NanoRatingModerationItem,
     NanoRatingModerationResponse,
     NanoRatingMutationResponse,
@@ -77,12 +76,19 @@ from app.modules.nanos.schemas import (
     PaginationMeta,
     StatusUpdateRequest,
 )
-from app.modules.search.service import invalidate_search_cache
+from app.modules.search.service import (
+    invalidate_search_cache_for_nano,
+    load_search_facets,
+    sync_nano_search_document,
+)
 from app.modules.upload.storage import StorageError, get_storage_adapter
+from app.pagination import paginate_keyset_or_400, should_count_total, split_page
 
 logger = logging.getLogger(__name__)
 
 MAX_COMMENT_LENGTH = 1000
+# Metadata fields that feed the category/language/level search cache scopes
+SEARCH_FACET_METADATA_FIELDS = frozenset({"category_ids", "competency_level", "language"})
 
 
 async def get_nano_metadata(
@@ -394,11 +400,6 @@ def _can_access_restricted_nano(nano: Nano, current_user: TokenData) -> bool:
     return current_user.role in {UserRole.ADMIN.value, UserRole.MODERATOR.value}
 
 
-def _quantize_rating(value: Decimal) -> Decimal:
-    """Normalize a rating value to two decimal places."""
-    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-
 def _approved_feedback_filter(
     model: type[NanoRating] | type[NanoComment],
 ) -> ColumnElement[bool]:
@@ -406,6 +407,27 @@ def _approved_feedback_filter(
     return model.moderation_status == FeedbackModerationStatus.APPROVED
 
 
+def _pagination_meta(
+    *,
+    page: int,
+    limit: int,
+    cursor: str | None,
+    total_results: int | None,
+    next_cursor: str | None,
+) -> PaginationMeta:
+    """Build pagination metadata for offset pages and cursor pages alike."""
+    total_pages = (total_results + limit - 1) // limit if total_results is not None else None
+    return PaginationMeta(
+        current_page=None if cursor is not None else page,
+        page_size=limit,
+        total_results=total_results,
+        total_pages=total_pages,
+        has_next_page=next_cursor is not None,
+        has_prev_page=cursor is not None or page > 1,
+        next_cursor=next_cursor,
+    )
+
+
 async def _get_nano_or_404(nano_id: UUID, db: AsyncSession) -> Nano:
     """Load a Nano by ID or raise 404."""
     stmt = select(Nano).where(Nano.id == nano_id)
@@ -439,88 +461,14 @@ def _validate_published_for_comments(nano: Nano) -> None:
         )
 
 
-async def _calculate_nano_rating_aggregation(
-    nano_id: UUID, db: AsyncSession
-) -> NanoRatingAggregation:
-    """Calculate average, median, count, and distribution for one Nano via database queries."""
-    aggregate_stmt = select(
-        func.count(NanoRating.id),
-        func.avg(NanoRating.score),
-    ).where(NanoRating.nano_id == nano_id, _approved_feedback_filter(NanoRating))
-    aggregate_result = await db.execute(aggregate_stmt)
-    rating_count_raw, average_raw = aggregate_result.one()
-
-    rating_count = int(rating_count_raw)
-    if rating_count == 0:
-        return NanoRatingAggregation(
-            average_rating=Decimal("0.00"),
-            median_rating=Decimal("0.00"),
-            rating_count=0,
-            distribution=[
-                NanoRatingDistributionItem(score=score, count=0) for score in range(1, 6)
-            ],
-        )
-
-    average_rating = _quantize_rating(Decimal(str(average_raw)))
-
-    if rating_count % 2 == 1:
-        median_offset = rating_count // 2
-        median_stmt = (
-            select(NanoRating.score)
-            .where(NanoRating.nano_id == nano_id, _approved_feedback_filter(NanoRating))
-            .order_by(NanoRating.score)
-            .offset(median_offset)
-            .limit(1)
-        )
-        median_result = await db.execute(median_stmt)
-        median_score = median_result.scalar_one()
-        median_rating = _quantize_rating(Decimal(median_score))
-    else:
-        median_offset = (rating_count // 2) - 1
-        median_stmt = (
-            select(NanoRating.score)
-            .where(NanoRating.nano_id == nano_id, _approved_feedback_filter(NanoRating))
-            .order_by(NanoRating.score)
-            .offset(median_offset)
-            .limit(2)
-        )
-        median_result = await db.execute(median_stmt)
-        median_scores = list(median_result.scalars().all())
-        median_rating = _quantize_rating(
-            (Decimal(median_scores[0]) + Decimal(median_scores[1])) / Decimal("2")
-        )
-
-    distribution_stmt = (
-        select(NanoRating.score, func.count(NanoRating.id))
-        .where(NanoRating.nano_id == nano_id, _approved_feedback_filter(NanoRating))
-        .group_by(NanoRating.score)
-    )
-    distribution_result = await db.execute(distribution_stmt)
-    distribution_rows = distribution_result.all()
-
-    distribution_counts = {score: 0 for score in range(1, 6)}
-    for score, score_count in distribution_rows:
-        distribution_counts[int(score)] = int(score_count)
-
-    distribution = [
-        NanoRatingDistributionItem(score=score, count=distribution_counts[score])
-        for score in range(1, 6)
-    ]
-
-    return NanoRatingAggregation(
-        average_rating=average_rating,
-        median_rating=median_rating,
-        rating_count=rating_count,
-        distribution=distribution,
-    )
-
-
-async def _sync_nano_rating_cache(nano: Nano, db: AsyncSession) -> NanoRatingAggregation:
-    """Recompute and persist denormalized Nano rating cache fields."""
-    aggregation = await _calculate_nano_rating_aggregation(nano_id=nano.id, db=db)
-    nano.average_rating = aggregation.average_rating
-    nano.rating_count = aggregation.rating_count
-    return aggregation
+def _rating_cache_changed_fields(nano: Nano, previous: tuple[Decimal, int]) -> list[str]:
+    """Return the denormalized rating fields that differ from ``previous``."""
+    changed_fields = []
+    if nano.average_rating != previous[0]:
+        changed_fields.append("average_rating")
+    if nano.rating_count != previous[1]:
+        changed_fields.append("rating_count")
+    return changed_fields
 
 
 async def create_nano_rating(
@@ -554,9 +502,16 @@ async def create_nano_rating(
     )
     db.add(rating)
 
+    previous_rating_cache = (nano.average_rating, nano.rating_count)
     try:
         await db.flush()
-        aggregation = await _sync_nano_rating_cache(nano=nano, db=db)
+        aggregation = await apply_rating_change(
+            nano,
+            db,
+            before=None,
+            after=(rating.score, rating.moderation_status),
+        )
+        rating_fields_changed = _rating_cache_changed_fields(nano, previous_rating_cache)
         await upsert_moderation_case(db, ModerationContentType.NANO_RATING, rating.id)
         await db.commit()
     except IntegrityError as exc:
@@ -567,7 +522,14 @@ async def create_nano_rating(
         ) from exc
 
     await db.refresh(rating)
-    await invalidate_search_cache(reason="nano_rating_created")
+    await invalidate_search_cache_for_nano(
+        db,
+        nano_id,
+        reason="nano_rating_created",
+        old_status=NanoStatus.PUBLISHED,
+        new_status=NanoStatus.PUBLISHED,
+        changed_fields=rating_fields_changed,
+    )
 
     return NanoRatingMutationResponse(
         nano_id=nano_id,
@@ -591,9 +553,14 @@ async def update_nano_rating(
     nano = await _get_nano_or_404(nano_id=nano_id, db=db)
     _validate_published_for_rating(nano=nano)
 
-    rating_stmt = select(NanoRating).where(
-        NanoRating.nano_id == nano_id,
-        NanoRating.user_id == current_user.user_id,
+    rating_stmt = (
+        select(NanoRating)
+        .where(
+            NanoRating.nano_id == nano_id,
+            NanoRating.user_id == current_user.user_id,
+        )
+        .with_for_update()
+        .execution_options(populate_existing=True)
     )
     rating_result = await db.execute(rating_stmt)
     rating = rating_result.scalar_one_or_none()
@@ -604,6 +571,7 @@ async def update_nano_rating(
             detail="No existing rating found for this user and Nano",
         )
 
+    previous_rating_state = (rating.score, rating.moderation_status)
     rating.score = payload.score
     rating.moderation_status = FeedbackModerationStatus.PENDING
     rating.moderated_at = None
@@ -611,12 +579,26 @@ async def update_nano_rating(
     rating.moderation_reason = None
     await db.flush()
 
-    aggregation = await _sync_nano_rating_cache(nano=nano, db=db)
+    previous_rating_cache = (nano.average_rating, nano.rating_count)
+    aggregation = await apply_rating_change(
+        nano,
+        db,
+        before=previous_rating_state,
+        after=(rating.score, rating.moderation_status),
+    )
+    rating_fields_changed = _rating_cache_changed_fields(nano, previous_rating_cache)
     await upsert_moderation_case(db, ModerationContentType.NANO_RATING, rating.id)
     await db.commit()
     await db.refresh(rating)
 
-    await invalidate_search_cache(reason="nano_rating_updated")
+    await invalidate_search_cache_for_nano(
+        db,
+        nano_id,
+        reason="nano_rating_updated",
+        old_status=NanoStatus.PUBLISHED,
+        new_status=NanoStatus.PUBLISHED,
+        changed_fields=rating_fields_changed,
+    )
 
     return NanoRatingMutationResponse(
         nano_id=nano_id,
@@ -639,7 +621,7 @@ async def get_nano_ratings(
     nano = await _get_nano_or_404(nano_id=nano_id, db=db)
     _validate_published_for_rating(nano=nano)
 
-    aggregation = await _calculate_nano_rating_aggregation(nano_id=nano_id, db=db)
+    aggregation = nano_rating_aggregation(nano)
 
     current_user_rating: NanoUserRating | None = None
     if current_user is not None:
@@ -760,29 +742,38 @@ async def get_nano_comments(
     db: AsyncSession,
     page: int = 1,
     limit: int = 20,
+    cursor: str | None = None,
+    include_total: bool | None = None,
 ) -> NanoCommentListResponse:
-    """Get paginated comments for a published Nano with stable sorting."""
+    """Get paginated comments for a published Nano with stable sorting.
+
+    ``cursor`` (from a previous page's ``next_cursor``) takes precedence over
+    ``page``; the total is only counted for offset pages unless ``include_total``.
+    """
     nano = await _get_nano_or_404(nano_id=nano_id, db=db)
     _validate_published_for_comments(nano=nano)
 
-    count_stmt = select(func.count(NanoComment.id)).where(NanoComment.nano_id == nano_id)
-    count_stmt = count_stmt.where(_approved_feedback_filter(NanoComment))
-    count_result = await db.execute(count_stmt)
-    total_results = int(count_result.scalar() or 0)
-
-    total_pages = (total_results + limit - 1) // limit if limit > 0 else 1
-    offset = (page - 1) * limit
+    total_results: int | None = None
+    if should_count_total(cursor, include_total):
+        count_stmt = select(func.count(NanoComment.id)).where(NanoComment.nano_id == nano_id)
+        count_stmt = count_stmt.where(_approved_feedback_filter(NanoComment))
+        count_result = await db.execute(count_stmt)
+        total_results = int(count_result.scalar() or 0)
 
-    list_stmt = (
+    list_stmt = paginate_keyset_or_400(
         select(NanoComment, User.username)
         .outerjoin(User, NanoComment.user_id == User.id)
-        .where(NanoComment.nano_id == nano_id, _approved_feedback_filter(NanoComment))
-        .order_by(desc(NanoComment.updated_at), desc(NanoComment.id))
-        .offset(offset)
-        .limit(limit)
+        .where(NanoComment.nano_id == nano_id, _approved_feedback_filter(NanoComment)),
+        (NanoComment.updated_at, NanoComment.id),
+        limit=limit,
+        cursor=cursor,
+        offset=(page - 1) * limit,
+        descending=True,
     )
     list_result = await db.execute(list_stmt)
-    rows = list_result.all()
+    rows, next_cursor = split_page(
+        list_result.all(), limit, lambda row: (row[0].updated_at, row[0].id)
+    )
 
     comments = [
         NanoCommentItem(
@@ -801,13 +792,12 @@ async def get_nano_comments(
 
     return NanoCommentListResponse(
         comments=comments,
-        pagination=PaginationMeta(
-            current_page=page,
-            page_size=limit,
+        pagination=_pagination_meta(
+            page=page,
+            limit=limit,
+            cursor=cursor,
             total_results=total_results,
-            total_pages=total_pages,
-            has_next_page=page < total_pages,
-            has_prev_page=page > 1,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -1022,9 +1012,14 @@ async def moderate_nano_rating(
     nano = await _get_nano_or_404(nano_id=nano_id, db=db)
     _validate_published_for_rating(nano=nano)
 
-    rating_stmt = select(NanoRating).where(
-        NanoRating.id == rating_id,
-        NanoRating.nano_id == nano_id,
+    rating_stmt = (
+        select(NanoRating)
+        .where(
+            NanoRating.id == rating_id,
+            NanoRating.nano_id == nano_id,
+        )
+        .with_for_update()
+        .execution_options(populate_existing=True)
     )
     rating_result = await db.execute(rating_stmt)
     rating = rating_result.scalar_one_or_none()
@@ -1036,9 +1031,15 @@ async def moderate_nano_rating(
         )
 
     previous_status = rating.moderation_status.value
+    previous_rating_state = (rating.score, rating.moderation_status)
     _apply_feedback_moderation(target=rating, moderation=moderation, moderator=current_user)
     await db.flush()
-    aggregation = await _sync_nano_rating_cache(nano=nano, db=db)
+    aggregation = await apply_rating_change(
+        nano,
+        db,
+        before=previous_rating_state,
+        after=(rating.score, rating.moderation_status),
+    )
 
     await AuditLogger.log_action(
         session=db,
@@ -1159,6 +1160,12 @@ async def update_nano_metadata(
     updated_fields = []
     fields_set = metadata.model_fields_set
 
+    # Capture the facets cached searches are scoped by before they change, so the
+    # invalidation below also reaches searches filtered by the old values.
+    previous_facets = None
+    if nano.status == NanoStatus.PUBLISHED and fields_set & SEARCH_FACET_METADATA_FIELDS:
+        previous_facets = await load_search_facets(db, nano_id)
+
     # Update basic fields (check if field was provided, even if None)
     if "title" in fields_set:
         # Title is NOT NULL in DB - reject explicit None
@@ -1287,8 +1294,25 @@ async def update_nano_metadata(
     await db.commit()
     await db.refresh(nano)
 
-    # Invalidate search cache to prevent stale discovery results after metadata changes
-    await invalidate_search_cache(reason="nano_metadata_updated")
+    # Sync the index entry and invalidate search cache to prevent stale discovery results.
+    # Only draft Nanos are editable, so both steps are normally skipped.
+    await sync_nano_search_document(
+        db,
+        nano_id,
+        reason="nano_metadata_updated",
+        old_status=nano.status,
+        new_status=nano.status,
+        changed_fields=updated_fields,
+    )
+    await invalidate_search_cache_for_nano(
+        db,
+        nano_id,
+        reason="nano_metadata_updated",
+        old_status=nano.status,
+        new_status=nano.status,
+        changed_fields=updated_fields,
+        previous_facets=previous_facets,
+    )
 
     return nano, updated_fields
 
@@ -1423,8 +1447,22 @@ async def update_nano_status(
     # Commit audit log changes to ensure they persist beyond request scope
     await db.commit()
 
-    # Invalidate search cache because status changes affect search visibility
-    await invalidate_search_cache(reason="nano_status_updated")
+    # Sync the index entry and invalidate search cache because status changes affect
+    # search visibility
+    await sync_nano_search_document(
+        db,
+        nano_id,
+        reason="nano_status_updated",
+        old_status=old_status,
+        new_status=new_status,
+    )
+    await invalidate_search_cache_for_nano(
+        db,
+        nano_id,
+        reason="nano_status_updated",
+        old_status=old_status,
+        new_status=new_status,
+    )
 
     return nano, old_status, new_status
 
@@ -1490,7 +1528,20 @@ async def admin_takedown_nano(
 
     await db.commit()
     await db.refresh(nano)
-    await invalidate_search_cache(reason="nano_admin_takedown")
+    await sync_nano_search_document(
+        db,
+        nano_id,
+        reason="nano_admin_takedown",
+        old_status=old_status,
+        new_status=new_status,
+    )
+    await invalidate_search_cache_for_nano(
+        db,
+        nano_id,
+        reason="nano_admin_takedown",
+        old_status=old_status,
+        new_status=new_status,
+    )
 
     message = (
         "Nano was already out of public visibility; takedown action recorded"
@@ -1601,6 +1652,8 @@ async def get_creator_nanos(
     page: int = 1,
     limit: int = 20,
     status_filter: str | None = None,
+    cursor: str | None = None,
+    include_total: bool | None = None,
 ) -> CreatorNanoListResponse:
     """
     Get list of Nanos owned by a creator with pagination.
@@ -1611,12 +1664,15 @@ async def get_creator_nanos(
         page: Page number (1-indexed), defaults to 1
         limit: Results per page, defaults to 20, max 100
         status_filter: Optional status filter (draft, published, etc.)
+        cursor: Opaque keyset cursor from a previous page; takes precedence over page
+        include_total: Force (True) or skip (False) the total count; by default it
+            is computed for offset pages only
 
     Returns:
         CreatorNanoListResponse with paginated list of creator's Nanos
 
     Raises:
-        HTTPException: 404 if creator not found
+        HTTPException: 404 if creator not found, 400 if the cursor is invalid
     """
     # Validate creator exists
     creator_stmt = select(User).where(User.id == creator_id)
@@ -1651,21 +1707,28 @@ async def get_creator_nanos(
         query = query.where(Nano.status == status_enum_filter)
 
     # Count total results
-    count_query = select(func.count(Nano.id)).where(Nano.creator_id == creator_id)
-    if status_enum_filter is not None:
-        count_query = count_query.where(Nano.status == status_enum_filter)
-
-    count_result = await db.execute(count_query)
-    total_results = count_result.scalar() or 0
+    total_results: int | None = None
+    if should_count_total(cursor, include_total):
+        count_query = select(func.count(Nano.id)).where(Nano.creator_id == creator_id)
+        if status_enum_filter is not None:
+            count_query = count_query.where(Nano.status == status_enum_filter)
 
-    # Calculate pagination
-    total_pages = (total_results + limit - 1) // limit if limit > 0 else 1
-    offset = (page - 1) * limit
+        count_result = await db.execute(count_query)
+        total_results = count_result.scalar() or 0
 
     # Fetch paginated results ordered by updated_at descending
-    query = query.order_by(desc(Nano.updated_at)).offset(offset).limit(limit)
+    query = paginate_keyset_or_400(
+        query,
+        (Nano.updated_at, Nano.id),
+        limit=limit,
+        cursor=cursor,
+        offset=(page - 1) * limit,
+        descending=True,
+    )
     result = await db.execute(query)
-    nanos = result.scalars().all()
+    nanos, next_cursor = split_page(
+        result.scalars().all(), limit, lambda nano: (nano.updated_at, nano.id)
+    )
 
     # Convert to response items
     nano_items = [
@@ -1684,13 +1747,12 @@ async def get_creator_nanos(
     ]
 
     # Build pagination metadata
-    pagination = PaginationMeta(
-        current_page=page,
-        page_size=limit,
+    pagination = _pagination_meta(
+        page=page,
+        limit=limit,
+        cursor=cursor,
         total_results=total_results,
-        total_pages=total_pages,
-        has_next_page=page < total_pages,
-        has_prev_page=page > 1,
+        next_cursor=next_cursor,
     )
 
     return CreatorNanoListResponse(nanos=nano_items, pagination=pagination)
@@ -1757,8 +1819,21 @@ async def delete_nano(
     await db.commit()
     await db.refresh(nano)
 
-    # Invalidate search cache after the database has been updated
-    await invalidate_search_cache(reason="nano_deleted")
+    # Sync the index entry and invalidate search cache after the database has been updated
+    await sync_nano_search_document(
+        db,
+        nano_id,
+        reason="nano_deleted",
+        old_status=old_status,
+        new_status=NanoStatus.DELETED,
+    )
+    await invalidate_search_cache_for_nano(
+        db,
+        nano_id,
+        reason="nano_deleted",
+        old_status=old_status,
+        new_status=NanoStatus.DELETED,
+    )
 
     # Log audit event
     await AuditLogger.log_action(
@@ -1887,6 +1962,7 @@ async def get_pending_review_nanos(
         total_pages=total_pages,
         has_next_page=page < total_pages,
         has_prev_page=page > 1,
+        next_cursor=None,
     )
 
     return ModeratorQueueListResponse(
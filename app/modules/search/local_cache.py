@@ -0,0 +1,81 @@
+"""In-process LRU cache for validated search responses.
+
+Sits in front of the Redis search cache so hot searches (mostly empty-query
+browse pages) are served without a network hop or JSON decode. Entries are
+bounded by count and age, and are dropped per facet scope when an invalidation
+is applied locally or received from another worker via Redis pub/sub.
+"""
+
+from collections import OrderedDict
+from time import monotonic
+from typing import Generic, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SearchLocalCache(Generic[T]):
+    """Size- and TTL-bounded LRU keyed by canonical search parameters."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries (0 disables the cache)
+            ttl_seconds: Maximum age of an entry in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[str, float, T]] = OrderedDict()
+        self._epoch = 0
+
+    @property
+    def epoch(self) -> int:
+        """Counter bumped by every invalidation; guards against stale late writes."""
+        return self._epoch
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[T]:
+        """Return a fresh entry and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        _, expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, scope: str, value: T, *, epoch: int) -> None:
+        """Store an entry unless an invalidation happened since ``epoch`` was read.
+
+        Args:
+            key: Canonical search parameters
+            scope: Facet scope the entry depends on (see ``_search_cache_scope``)
+            value: Validated response
+            epoch: Value of :attr:`epoch` captured before the response was fetched
+        """
+        if self.max_entries <= 0 or epoch != self._epoch:
+            return
+
+        self._entries[key] = (scope, monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, scopes: Optional[Iterable[str]] = None) -> None:
+        """Drop entries of the given scopes, or every entry when ``scopes`` is None."""
+        self._epoch += 1
+        if scopes is None:
+            self._entries.clear()
+            return
+
+        scope_set = set(scopes)
+        stale_keys = [key for key, (scope, _, _) in self._entries.items() if scope in scope_set]
+        for key in stale_keys:
+            del self._entries[key]
@@ -2,12 +2,12 @@
 
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_read_db
 from app.modules.search.schemas import SearchResponse
-from app.modules.search.service import search_nanos
+from app.modules.search.service import search_nanos_json
 
 
 def get_search_router(prefix: str = "/api/v1/search", tags: list[str] | None = None) -> APIRouter:
@@ -128,10 +128,14 @@ def get_search_router(prefix: str = "/api/v1/search", tags: list[str] | None = N
         ] = None,
         page: Annotated[int, Query(ge=1, description="Page number")] = 1,
         limit: Annotated[int, Query(ge=1, le=100, description="Results per page")] = 20,
-        db: AsyncSession = Depends(get_db),
-    ) -> SearchResponse:
-        """Search for Nanos using full-text search with filters."""
-        result = await search_nanos(
+        db: AsyncSession = Depends(get_read_db),
+    ) -> Response:
+        """Search for Nanos using full-text search with filters.
+
+        The service returns the serialized SearchResponse, which is sent as-is
+        so cached results are not decoded and re-encoded per request.
+        """
+        body = await search_nanos_json(
             db=db,
             query=q,
             category=category,
@@ -141,6 +145,6 @@ def get_search_router(prefix: str = "/api/v1/search", tags: list[str] | None = N
             page=page,
             limit=limit,
         )
-        return result
+        return Response(content=body, media_type="application/json")
 
     return router
@@ -8,22 +8,42 @@ published PostgreSQL data.
 import asyncio
 import json
 import logging
+import math
+import random
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from hashlib import sha256
-from typing import Any, Optional
-from urllib.error import HTTPError
+from time import perf_counter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    Sequence,
+    Unpack,
+)
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-from uuid import UUID
+from uuid import UUID, uuid4
 
+import httpx
 from fastapi import HTTPException, status
-from pydantic import ValidationError
-from sqlalchemy import select
+from pydantic import TypeAdapter, ValidationError
+from redis.asyncio.client import PubSub
+from sqlalchemy import Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.models import Category, Nano, NanoCategoryAssignment, NanoStatus, User
+from app.modules.search.local_cache import SearchLocalCache
 from app.modules.search.schemas import SearchNano, SearchResponse
+from app.modules.search.transport import (
+    MeiliTransport,
+    close_meili_transport,
+    get_meili_transport,
+)
 from app.redis_client import get_redis
 
 settings = get_settings()
@@ -39,6 +59,7 @@ MEILI_FILTERABLE_ATTRIBUTES = [
     "language",
 ]
 MEILI_SORTABLE_ATTRIBUTES = ["average_rating", "published_at", "download_count"]
+MEILI_DOCUMENTS_PAGE_SIZE = 1000
 
 
 def _cache_key_hash(cache_key: str) -> str:
@@ -46,40 +67,8 @@ def _cache_key_hash(cache_key: str) -> str:
     return sha256(cache_key.encode("utf-8")).hexdigest()[:12]
 
 
-def _meili_headers() -> dict[str, str]:
-    headers = {"Content-Type": "application/json"}
-    if settings.MEILI_MASTER_KEY:
-        headers["Authorization"] = f"Bearer {settings.MEILI_MASTER_KEY}"
-    return headers
-
-
 async def _meili_request(path: str, *, method: str = "GET", payload: Any = None) -> tuple[int, Any]:
-    def _execute_request() -> tuple[int, Any]:
-        body = None
-        if payload is not None:
-            body = json.dumps(payload).encode("utf-8")
-
-        request = Request(
-            f"{settings.MEILI_URL.rstrip('/')}{path}",
-            data=body,
-            headers=_meili_headers(),
-            method=method,
-        )
-
-        try:
-            with urlopen(request, timeout=10) as response:
-                response_body = response.read().decode("utf-8")
-                return response.status, json.loads(response_body) if response_body else None
-        except HTTPError as error:
-            response_body = error.read().decode("utf-8", errors="replace")
-            parsed_body: Any
-            try:
-                parsed_body = json.loads(response_body) if response_body else None
-            except json.JSONDecodeError:
-                parsed_body = response_body
-            return error.code, parsed_body
-
-    return await asyncio.to_thread(_execute_request)
+    return await get_meili_transport().request(path, method=method, payload=payload)
 
 
 async def _wait_for_meili_task(task_uid: int, *, ignore_index_not_found: bool = False) -> None:
@@ -134,18 +123,45 @@ def _task_uid_from_response(payload: dict[str, Any]) -> int:
     return task_uid
 
 
-async def _build_search_documents(db: AsyncSession) -> list[dict[str, Any]]:
-    nano_result = await db.execute(
-        select(Nano, User.username)
-        .outerjoin(User, Nano.creator_id == User.id)
-        .where(Nano.status == NanoStatus.PUBLISHED)
-        .order_by(Nano.average_rating.desc(), Nano.published_at.desc(), Nano.id.desc())
-    )
-    nano_rows = nano_result.all()
-    if not nano_rows:
-        return []
+def _normalize_watermark(value: Optional[datetime]) -> Optional[str]:
+    """Return a canonical UTC ISO timestamp used as the per-document sync watermark."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _to_search_document(
+    nano: Any, creator_username: Optional[str], category_name: Optional[str]
+) -> dict[str, Any]:
+    """Map one published Nano (entity or column row) to its Meilisearch document."""
+    published_at = nano.published_at or nano.updated_at or nano.uploaded_at
+    return {
+        "id": str(nano.id),
+        "title": nano.title,
+        "description": nano.description,
+        "creator": creator_username,
+        "duration_minutes": nano.duration_minutes,
+        "competency_level": int(nano.competency_level),
+        "category": category_name,
+        "format": nano.format.value.lower(),
+        "average_rating": float(nano.average_rating),
+        "rating_count": nano.rating_count,
+        "published_at": published_at.isoformat() if published_at else None,
+        "thumbnail_url": nano.thumbnail_url,
+        "status": nano.status.value,
+        "language": nano.language,
+        "download_count": nano.download_count,
+        "updated_at": _normalize_watermark(nano.updated_at),
+    }
+
+
+async def _load_primary_categories(db: AsyncSession, nano_ids: list[UUID]) -> dict[UUID, str]:
+    """Resolve the highest-ranked category name for each given Nano."""
+    if not nano_ids:
+        return {}
 
-    nano_ids = [nano.id for nano, _ in nano_rows]
     category_result = await db.execute(
         select(NanoCategoryAssignment.nano_id, Category.name)
         .join(Category, NanoCategoryAssignment.category_id == Category.id)
@@ -158,102 +174,337 @@ async def _build_search_documents(db: AsyncSession) -> list[dict[str, Any]]:
     primary_categories: dict[UUID, str] = {}
     for nano_id, category_name in category_result.all():
         primary_categories.setdefault(nano_id, category_name)
+    return primary_categories
+
+
+# Columns needed to build a search document. Selecting plain columns instead of ORM
+# entities keeps streamed rows out of the session identity map.
+_SEARCH_DOCUMENT_COLUMNS = (
+    Nano.id,
+    Nano.title,
+    Nano.description,
+    Nano.duration_minutes,
+    Nano.competency_level,
+    Nano.format,
+    Nano.average_rating,
+    Nano.rating_count,
+    Nano.published_at,
+    Nano.updated_at,
+    Nano.uploaded_at,
+    Nano.thumbnail_url,
+    Nano.status,
+    Nano.language,
+    Nano.download_count,
+)
+
+
+async def _iter_search_document_batches(
+    db: AsyncSession, nano_ids: Optional[list[UUID]] = None
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield search documents for published Nanos in fixed-size batches.
+
+    Rows are read in keyset order on ``Nano.id`` with one bounded query per batch,
+    so peak memory depends on ``SEARCH_INDEX_BATCH_SIZE`` rather than catalog size.
+    When ``nano_ids`` is given only those Nanos are considered.
+    """
+    batch_size = settings.SEARCH_INDEX_BATCH_SIZE
+    base_stmt = (
+        select(*_SEARCH_DOCUMENT_COLUMNS, User.username)
+        .outerjoin(User, Nano.creator_id == User.id)
+        .where(Nano.status == NanoStatus.PUBLISHED)
+        .order_by(Nano.id)
+        .limit(batch_size)
+    )
 
-    documents: list[dict[str, Any]] = []
-    for nano, creator_username in nano_rows:
-        published_at = nano.published_at or nano.updated_at or nano.uploaded_at
-        documents.append(
-            {
-                "id": str(nano.id),
-                "title": nano.title,
-                "description": nano.description,
-                "creator": creator_username,
-                "duration_minutes": nano.duration_minutes,
-                "competency_level": int(nano.competency_level),
-                "category": primary_categories.get(nano.id),
-                "format": nano.format.value.lower(),
-                "average_rating": float(nano.average_rating),
-                "rating_count": nano.rating_count,
-                "published_at": published_at.isoformat() if published_at else None,
-                "thumbnail_url": nano.thumbnail_url,
-                "status": nano.status.value,
-                "language": nano.language,
-                "download_count": nano.download_count,
-            }
-        )
+    if nano_ids is not None:
+        ordered_ids = sorted(set(nano_ids))
+        id_chunks = [
+            ordered_ids[offset : offset + batch_size]
+            for offset in range(0, len(ordered_ids), batch_size)
+        ]
+        statements = (base_stmt.where(Nano.id.in_(chunk)) for chunk in id_chunks)
+        async for batch in _documents_from_statements(db, statements):
+            yield batch
+        return
+
+    last_id: Optional[UUID] = None
+    while True:
+        stmt = base_stmt if last_id is None else base_stmt.where(Nano.id > last_id)
+        batch_rows = (await db.execute(stmt)).all()
+        if not batch_rows:
+            return
 
-    return documents
+        yield await _rows_to_search_documents(db, batch_rows)
 
+        if len(batch_rows) < batch_size:
+            return
+        last_id = batch_rows[-1].id
+
+
+async def _documents_from_statements(
+    db: AsyncSession, statements: Iterable[Select[Unpack[tuple[Any, ...]]]]
+) -> AsyncIterator[list[dict[str, Any]]]:
+    for stmt in statements:
+        batch_rows = (await db.execute(stmt)).all()
+        if batch_rows:
+            yield await _rows_to_search_documents(db, batch_rows)
+
+
+async def _rows_to_search_documents(
+    db: AsyncSession, rows: Sequence[Row[Unpack[tuple[Any, ...]]]]
+) -> list[dict[str, Any]]:
+    primary_categories = await _load_primary_categories(db, [row.id for row in rows])
+    return [_to_search_document(row, row.username, primary_categories.get(row.id)) for row in rows]
 
-async def rebuild_search_index(
-    db: AsyncSession, index_name: Optional[str] = None
-) -> dict[str, Any]:
-    """Rebuild the configured Meilisearch index from published PostgreSQL nanos."""
-    target_index = index_name or settings.MEILI_INDEX_UID
-    documents = await _build_search_documents(db)
+
+async def _build_search_documents(
+    db: AsyncSession, nano_ids: Optional[list[UUID]] = None
+) -> list[dict[str, Any]]:
+    """Build search documents for published Nanos, optionally restricted to ``nano_ids``."""
+    return [
+        document
+        async for batch in _iter_search_document_batches(db, nano_ids=nano_ids)
+        for document in batch
+    ]
+
+
+async def _stream_search_documents(
+    db: AsyncSession, target_index: str, nano_ids: Optional[list[UUID]] = None
+) -> int:
+    """Build and upload documents batch by batch with bounded upload concurrency.
+
+    Each batch becomes its own Meilisearch task. At most
+    ``SEARCH_INDEX_UPLOAD_CONCURRENCY`` uploads are in flight while the next batch
+    is read from the database, which overlaps DB reads with index writes and
+    caps the number of batches held in memory.
+
+    Returns:
+        Number of uploaded documents.
+    """
+    semaphore = asyncio.Semaphore(settings.SEARCH_INDEX_UPLOAD_CONCURRENCY)
+    pending: set[asyncio.Task[None]] = set()
+    document_count = 0
+
+    async def _upload(batch: list[dict[str, Any]]) -> None:
+        try:
+            await _upsert_search_documents(target_index, batch)
+        finally:
+            semaphore.release()
 
     try:
-        delete_status, delete_payload = await _meili_request(
-            f"/indexes/{target_index}", method="DELETE"
+        async for batch in _iter_search_document_batches(db, nano_ids=nano_ids):
+            await semaphore.acquire()
+            for task in [task for task in pending if task.done()]:
+                pending.discard(task)
+                task.result()
+            pending.add(asyncio.create_task(_upload(batch)))
+            document_count += len(batch)
+
+        await asyncio.gather(*pending)
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise
+
+    return document_count
+
+
+async def _apply_index_settings(target_index: str) -> None:
+    """Apply filterable and sortable attribute settings to an index (idempotent)."""
+    filterable_status, filterable_payload = await _meili_request(
+        f"/indexes/{target_index}/settings/filterable-attributes",
+        method="PUT",
+        payload=MEILI_FILTERABLE_ATTRIBUTES,
+    )
+    if filterable_status >= 400:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Search filterable settings update failed: {filterable_payload}",
         )
-        if delete_status == 202:
-            await _wait_for_meili_task(
-                _task_uid_from_response(delete_payload),
-                ignore_index_not_found=True,
-            )
-        elif delete_status != 404:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Search index deletion failed: {delete_payload}",
-            )
+    await _wait_for_meili_task(_task_uid_from_response(filterable_payload))
 
-        create_status, create_payload = await _meili_request(
-            "/indexes",
-            method="POST",
-            payload={"uid": target_index, "primaryKey": "id"},
+    sortable_status, sortable_payload = await _meili_request(
+        f"/indexes/{target_index}/settings/sortable-attributes",
+        method="PUT",
+        payload=MEILI_SORTABLE_ATTRIBUTES,
+    )
+    if sortable_status >= 400:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Search sortable settings update failed: {sortable_payload}",
         )
-        if create_status >= 400:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Search index creation failed: {create_payload}",
-            )
-        await _wait_for_meili_task(_task_uid_from_response(create_payload))
+    await _wait_for_meili_task(_task_uid_from_response(sortable_payload))
+
 
-        filterable_status, filterable_payload = await _meili_request(
-            f"/indexes/{target_index}/settings/filterable-attributes",
-            method="PUT",
-            payload=MEILI_FILTERABLE_ATTRIBUTES,
+async def _upsert_search_documents(
+    target_index: str, documents: list[dict[str, Any]], *, wait: bool = True
+) -> None:
+    """Add or replace documents in an index, by default waiting for the indexing task."""
+    if not documents:
+        return
+
+    documents_status, documents_payload = await _meili_request(
+        f"/indexes/{target_index}/documents",
+        method="POST",
+        payload=documents,
+    )
+    if documents_status >= 400:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Search document upload failed: {documents_payload}",
         )
-        if filterable_status >= 400:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Search filterable settings update failed: {filterable_payload}",
-            )
-        await _wait_for_meili_task(_task_uid_from_response(filterable_payload))
+    if wait:
+        await _wait_for_meili_task(_task_uid_from_response(documents_payload))
+
 
-        sortable_status, sortable_payload = await _meili_request(
-            f"/indexes/{target_index}/settings/sortable-attributes",
-            method="PUT",
-            payload=MEILI_SORTABLE_ATTRIBUTES,
+async def _delete_search_documents(
+    target_index: str, document_ids: list[str], *, wait: bool = True
+) -> None:
+    """Remove documents from an index by primary key, by default waiting for the task."""
+    if not document_ids:
+        return
+
+    delete_status, delete_payload = await _meili_request(
+        f"/indexes/{target_index}/documents/delete-batch",
+        method="POST",
+        payload=document_ids,
+    )
+    if delete_status == 404:
+        # Index does not exist yet, so there is nothing to remove.
+        return
+    if delete_status >= 400:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Search document deletion failed: {delete_payload}",
+        )
+    if wait:
+        await _wait_for_meili_task(
+            _task_uid_from_response(delete_payload), ignore_index_not_found=True
         )
-        if sortable_status >= 400:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Search sortable settings update failed: {sortable_payload}",
-            )
-        await _wait_for_meili_task(_task_uid_from_response(sortable_payload))
 
-        documents_status, documents_payload = await _meili_request(
-            f"/indexes/{target_index}/documents",
-            method="POST",
-            payload=documents,
+
+async def _fetch_index_watermarks(target_index: str) -> dict[str, Optional[str]]:
+    """Return ``{document_id: updated_at}`` for every document currently in the index."""
+    watermarks: dict[str, Optional[str]] = {}
+    offset = 0
+    while True:
+        query = urlencode(
+            {"fields": "id,updated_at", "limit": MEILI_DOCUMENTS_PAGE_SIZE, "offset": offset}
+        )
+        response_status, payload = await _meili_request(
+            f"/indexes/{target_index}/documents?{query}"
         )
-        if documents_status >= 400:
+        if response_status == 404:
+            return {}
+        if response_status >= 400 or not isinstance(payload, dict):
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Search document upload failed: {documents_payload}",
+                detail=f"Search document listing failed: {payload}",
             )
-        await _wait_for_meili_task(_task_uid_from_response(documents_payload))
+
+        results = payload.get("results") or []
+        for document in results:
+            watermarks[str(document.get("id"))] = document.get("updated_at")
+
+        offset += len(results)
+        total = payload.get("total")
+        if not results or (isinstance(total, int) and offset >= total):
+            return watermarks
+
+
+async def sync_nano_search_document(
+    db: AsyncSession,
+    nano_id: UUID,
+    reason: str,
+    *,
+    old_status: Any,
+    new_status: Any,
+    changed_fields: Optional[Iterable[str]] = None,
+) -> bool:
+    """Bring a single Nano's search document in line with its database state.
+
+    Published Nanos are upserted; any other status (or a missing row) removes the
+    document. This is the incremental counterpart to :func:`rebuild_search_index`
+    and is called on write paths after the owning transaction has committed, so it
+    only enqueues the Meilisearch task instead of polling for its completion.
+    Changes that are invisible to search (see :func:`is_search_visible_change`)
+    are skipped. Failures are logged and swallowed: the periodic reconciler
+    repairs any drift left behind.
+
+    Args:
+        db: Database session used to read the committed Nano state.
+        nano_id: Nano whose document should be synchronized.
+        reason: Context for observability/logging.
+        old_status: Nano status before the change.
+        new_status: Nano status after the change.
+        changed_fields: Changed field names, if known.
+
+    Returns:
+        True if an index task was enqueued, False if skipped or failed.
+    """
+    if not is_search_visible_change(old_status, new_status, changed_fields):
+        return False
+
+    target_index = settings.MEILI_INDEX_UID
+    try:
+        documents = await _build_search_documents(db, nano_ids=[nano_id])
+        if documents:
+            await _upsert_search_documents(target_index, documents, wait=False)
+            operation = "upsert"
+        else:
+            await _delete_search_documents(target_index, [str(nano_id)], wait=False)
+            operation = "delete"
+    except Exception:
+        logger.warning(
+            "search_index_sync_failed",
+            extra={"nano_id": str(nano_id), "reason": reason},
+        )
+        return False
+
+    logger.info(
+        "search_index_sync",
+        extra={"nano_id": str(nano_id), "operation": operation, "reason": reason},
+    )
+    return True
+
+
+async def reconcile_search_index(
+    db: AsyncSession, index_name: Optional[str] = None
+) -> dict[str, Any]:
+    """Diff published Nanos against the index by ``updated_at`` watermark and repair drift.
+
+    Documents that are missing or carry an older watermark are re-uploaded, and
+    documents whose Nano is no longer published are removed. Index settings are
+    re-applied (a no-op when unchanged) so an index implicitly created by an
+    incremental upsert still gets its filterable/sortable attributes.
+
+    Returns:
+        Summary with the number of upserted and deleted documents.
+    """
+    target_index = index_name or settings.MEILI_INDEX_UID
+
+    published_result = await db.execute(
+        select(Nano.id, Nano.updated_at).where(Nano.status == NanoStatus.PUBLISHED)
+    )
+    expected = {
+        str(nano_id): _normalize_watermark(updated_at)
+        for nano_id, updated_at in published_result.all()
+    }
+
+    try:
+        indexed = await _fetch_index_watermarks(target_index)
+        stale_ids = [
+            UUID(nano_id)
+            for nano_id, watermark in expected.items()
+            if nano_id not in indexed or indexed[nano_id] != watermark
+        ]
+        removed_ids = [nano_id for nano_id in indexed if nano_id not in expected]
+
+        if stale_ids:
+            await _stream_search_documents(db, target_index, nano_ids=stale_ids)
+        await _delete_search_documents(target_index, removed_ids)
+        await _apply_index_settings(target_index)
     except HTTPException:
         raise
     except Exception as error:
@@ -262,41 +513,259 @@ async def rebuild_search_index(
             detail="Search indexing unavailable",
         ) from error
 
+    if stale_ids or removed_ids:
+        await invalidate_search_cache(reason="search_reconcile")
+
+    logger.info(
+        "search_index_reconciled",
+        extra={
+            "index_name": target_index,
+            "upserted": len(stale_ids),
+            "deleted": len(removed_ids),
+        },
+    )
+    return {
+        "index_name": target_index,
+        "upserted_count": len(stale_ids),
+        "deleted_count": len(removed_ids),
+    }
+
+
+async def run_search_reconciler(
+    session_factory: Callable[[], AsyncSession], interval_seconds: float
+) -> None:
+    """Run :func:`reconcile_search_index` forever at a fixed interval.
+
+    Intended to be started as a background task from the application lifespan.
+    Every worker runs this loop, but each round first takes a Redis lease that
+    lives for one interval, so only one worker reconciles per interval (all of
+    them do while Redis is unavailable, which is safe because reconciling is
+    idempotent). Errors are logged and the loop keeps going until cancelled.
+    """
+    lock_key = _search_reconcile_lock_key()
+    while True:
+        await asyncio.sleep(interval_seconds)
+        if not await _try_lock_search_key(lock_key, str(uuid4()), ttl_seconds=interval_seconds):
+            logger.info("search_index_reconcile_skipped_locked")
+            continue
+        try:
+            async with session_factory() as session:
+                await reconcile_search_index(session)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("search_index_reconcile_failed")
+
+
+async def _create_index(index_uid: str, *, ignore_existing: bool = False) -> None:
+    """Create an index with ``id`` as primary key and wait for the task."""
+    create_status, create_payload = await _meili_request(
+        "/indexes",
+        method="POST",
+        payload={"uid": index_uid, "primaryKey": "id"},
+    )
+    if create_status >= 400:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Search index creation failed: {create_payload}",
+        )
+    try:
+        await _wait_for_meili_task(_task_uid_from_response(create_payload))
+    except HTTPException as error:
+        if ignore_existing and "index_already_exists" in str(error.detail):
+            return
+        raise
+
+
+async def _delete_index(index_uid: str) -> None:
+    """Delete an index if it exists and wait for the task."""
+    delete_status, delete_payload = await _meili_request(f"/indexes/{index_uid}", method="DELETE")
+    if delete_status == 202:
+        await _wait_for_meili_task(
+            _task_uid_from_response(delete_payload),
+            ignore_index_not_found=True,
+        )
+    elif delete_status != 404:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Search index deletion failed: {delete_payload}",
+        )
+
+
+async def _swap_indexes(live_index: str, shadow_index: str) -> None:
+    """Atomically exchange the contents of two indexes via the swap-indexes API."""
+    swap_status, swap_payload = await _meili_request(
+        "/swap-indexes",
+        method="POST",
+        payload=[{"indexes": [live_index, shadow_index]}],
+    )
+    if swap_status >= 400:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Search index swap failed: {swap_payload}",
+        )
+    await _wait_for_meili_task(_task_uid_from_response(swap_payload))
+
+
+def _build_shadow_index_uid(live_index: str) -> str:
+    """Return a timestamped shadow index UID such as ``nanos_v1__20260317101500``."""
+    return f"{live_index}__{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
+
+
+async def rebuild_search_index(
+    db: AsyncSession, index_name: Optional[str] = None
+) -> dict[str, Any]:
+    """Rebuild the configured Meilisearch index from published PostgreSQL nanos.
+
+    The rebuild is blue/green: documents are loaded into a timestamped shadow
+    index with the filterable/sortable settings applied, then exchanged with the
+    live index in one atomic swap task, and only afterwards is the previous
+    index dropped. Searches keep hitting the old index until the swap, so there
+    is no window of missing or empty results. Changes committed while the shadow
+    index was being built are caught up by a reconcile pass after the swap.
+
+    Day-to-day changes are kept in sync incrementally via
+    :func:`sync_nano_search_document` and :func:`reconcile_search_index`; a full
+    rebuild is only required when the document schema or index settings change.
+
+    Returns:
+        Summary with document count, shadow build duration and swap window length.
+    """
+    target_index = index_name or settings.MEILI_INDEX_UID
+    shadow_index = _build_shadow_index_uid(target_index)
+
+    build_started_at = perf_counter()
+    try:
+        await _create_index(shadow_index)
+        await _apply_index_settings(shadow_index)
+        document_count = await _stream_search_documents(db, shadow_index)
+        build_seconds = perf_counter() - build_started_at
+
+        # The swap API requires both sides to exist; first-time setups get an empty
+        # live index that is immediately replaced.
+        await _create_index(target_index, ignore_existing=True)
+
+        swap_started_at = perf_counter()
+        await _swap_indexes(target_index, shadow_index)
+        swap_seconds = perf_counter() - swap_started_at
+    except Exception as error:
+        # The live index is untouched; drop the partial shadow build.
+        try:
+            await _delete_index(shadow_index)
+        except Exception:
+            logger.warning("search_shadow_index_cleanup_failed", extra={"index_name": shadow_index})
+        if isinstance(error, HTTPException):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search indexing unavailable",
+        ) from error
+
+    # After the swap the shadow UID holds the previous live documents.
+    try:
+        await _delete_index(shadow_index)
+    except Exception:
+        logger.warning("search_shadow_index_cleanup_failed", extra={"index_name": shadow_index})
+
     await invalidate_search_cache(reason="search_reindex")
+    try:
+        await reconcile_search_index(db, index_name=target_index)
+    except HTTPException:
+        logger.warning("search_index_reconcile_failed", extra={"index_name": target_index})
     logger.info(
-        "search_index_rebuilt", extra={"index_name": target_index, "documents": len(documents)}
+        "search_index_rebuilt",
+        extra={
+            "index_name": target_index,
+            "shadow_index_name": shadow_index,
+            "documents": document_count,
+            "build_seconds": round(build_seconds, 3),
+            "swap_seconds": round(swap_seconds, 3),
+        },
     )
-    return {"index_name": target_index, "document_count": len(documents)}
+    return {
+        "index_name": target_index,
+        "document_count": document_count,
+        "build_seconds": build_seconds,
+        "swap_seconds": swap_seconds,
+    }
 
 
 class MeilisearchClient:
-    """Meilisearch API client for search operations."""
+    """Long-lived Meilisearch API client for search operations.
+
+    The index handle is resolved once (one ``GET /indexes/{uid}``) and reused, so
+    a search normally costs a single ``POST /indexes/{uid}/search`` round-trip.
+    The handle is re-resolved lazily when a search fails because the index is
+    missing or the backend was unreachable.
+    """
 
     def __init__(
         self,
-        url: str,
-        master_key: Optional[str] = None,
         index_name: Optional[str] = None,
+        transport: Optional[MeiliTransport] = None,
     ):
         """
         Initialize Meilisearch client.
 
         Args:
-            url: Meilisearch server URL (e.g., http://localhost:7700)
-            master_key: Master key for API authentication
             index_name: Optional target index UID (defaults to configured setting)
+            transport: Optional transport (defaults to the shared pooled transport)
         """
+        self._index_name = index_name
+        self._transport = transport
+        self._resolved_index: Optional[str] = None
+
+    @property
+    def index_name(self) -> str:
+        """Target index UID, following the configured setting unless pinned."""
+        return self._index_name or settings.MEILI_INDEX_UID
+
+    @property
+    def transport(self) -> MeiliTransport:
+        """Transport used for requests (the shared pooled transport by default)."""
+        return self._transport or get_meili_transport()
+
+    async def _resolve_index(self) -> None:
+        """Verify the target index exists and remember it as resolved."""
+        index_name = self.index_name
         try:
-            import meilisearch
-        except ImportError:
-            raise ImportError(
-                "meilisearch package not installed. Install with: pip install meilisearch"
+            index_status, _ = await self.transport.request(
+                f"/indexes/{index_name}", timeout=settings.MEILI_SEARCH_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Search service unavailable",
+            ) from e
+        if index_status >= 400:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Search service unavailable",
             )
+        self._resolved_index = index_name
 
-        self.client = meilisearch.Client(url, api_key=master_key)
-        self.index_name = index_name or settings.MEILI_INDEX_UID
+    async def _post_search(self, search_params: dict[str, Any]) -> tuple[int, Any]:
+        """POST a search request, dropping the resolved handle on network failure."""
+        try:
+            return await self.transport.request(
+                f"/indexes/{self.index_name}/search",
+                method="POST",
+                payload=search_params,
+                timeout=settings.MEILI_SEARCH_TIMEOUT_SECONDS,
+            )
+        except httpx.HTTPError as e:
+            self._resolved_index = None
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Search service unavailable",
+            ) from e
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Search operation failed",
+            ) from e
 
-    def search(
+    async def search(
         self,
         query: str,
         category: Optional[str] = None,
@@ -324,13 +793,8 @@ class MeilisearchClient:
         Raises:
             HTTPException: If Meilisearch is unavailable
         """
-        try:
-            index = self.client.get_index(self.index_name)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Search service unavailable",
-            ) from e
+        if self._resolved_index != self.index_name:
+            await self._resolve_index()
 
         # Build filter expressions for Meilisearch
         filters = []
@@ -364,19 +828,127 @@ class MeilisearchClient:
         filter_expression = " AND ".join(filters)
         offset = (page - 1) * limit
 
-        try:
-            search_params = {
-                "offset": offset,
-                "limit": limit,
-                "sort": ["average_rating:desc"],
-                "filter": filter_expression,
-            }
-            return index.search(query, search_params)
-        except Exception as e:
+        search_params = {
+            "q": query,
+            "offset": offset,
+            "limit": limit,
+            "sort": ["average_rating:desc"],
+            "filter": filter_expression,
+        }
+        search_status, search_payload = await self._post_search(search_params)
+        if search_status == status.HTTP_404_NOT_FOUND:
+            # The index vanished since it was resolved; refresh the handle once.
+            self._resolved_index = None
+            await self._resolve_index()
+            search_status, search_payload = await self._post_search(search_params)
+
+        if search_status >= 400 or not isinstance(search_payload, dict):
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Search operation failed",
-            ) from e
+            )
+        return search_payload
+
+
+_search_client: Optional[MeilisearchClient] = None
+
+
+def get_search_client() -> MeilisearchClient:
+    """Get the shared search client, creating it on first use.
+
+    Returns:
+        Process-wide :class:`MeilisearchClient` instance.
+    """
+    global _search_client
+
+    if _search_client is None:
+        _search_client = MeilisearchClient()
+
+    return _search_client
+
+
+async def close_search_client() -> None:
+    """Drop the shared search client and close its pooled transport.
+
+    Should be called during application shutdown.
+    """
+    global _search_client
+
+    _search_client = None
+    await close_meili_transport()
+
+
+# Nano fields that end up in search documents; changes to any other field cannot
+# alter search results.
+SEARCH_VISIBLE_FIELDS = frozenset(
+    {
+        "title",
+        "description",
+        "creator",
+        "duration_minutes",
+        "competency_level",
+        "category",
+        "categories",
+        "format",
+        "average_rating",
+        "rating_count",
+        "published_at",
+        "thumbnail_url",
+        "language",
+    }
+)
+
+
+@dataclass(frozen=True)
+class SearchFacets:
+    """Filterable facet values of one Nano as seen by the search index."""
+
+    category: Optional[str]
+    language: Optional[str]
+    level: Optional[int]
+
+
+def _search_cache_generation_key(scope: Optional[str] = None) -> str:
+    """Redis key of a counter that versions the search cache namespace.
+
+    Without ``scope`` this is the global generation bumped by full invalidations;
+    with a scope (``all``, ``category:<name>``, ``language:<code>``, ``level:<n>``)
+    it is the generation of the cache entries filtered by that facet.
+    """
+    if scope is None:
+        return f"{settings.SEARCH_CACHE_KEY_PREFIX}:gen"
+    return f"{settings.SEARCH_CACHE_KEY_PREFIX}:gen:{scope}"
+
+
+def _search_cache_scope(
+    category: Optional[str], language: Optional[str], level: Optional[int]
+) -> str:
+    """Pick the most selective facet scope a cached search depends on.
+
+    A search filtered by category can only change when a Nano of that category
+    changes, so its entry is versioned by that category alone; language and level
+    follow the same rule, and unfiltered searches depend on every visible change.
+    """
+    if category:
+        return f"category:{category}"
+    if language:
+        return f"language:{language}"
+    if level is not None:
+        return f"level:{level}"
+    return "all"
+
+
+def _facet_scopes(facets: Iterable[SearchFacets]) -> set[str]:
+    """All cache scopes a change to Nanos with the given facets can affect."""
+    scopes = {"all"}
+    for facet in facets:
+        if facet.category:
+            scopes.add(f"category:{facet.category}")
+        if facet.language:
+            scopes.add(f"language:{facet.language}")
+        if facet.level is not None:
+            scopes.add(f"level:{facet.level}")
+    return scopes
 
 
 def build_search_cache_key(
@@ -387,8 +959,29 @@ def build_search_cache_key(
     language: Optional[str],
     page: int,
     limit: int,
+    generation: int = 0,
+    scope_generation: int = 0,
 ) -> str:
-    """Build a deterministic Redis cache key for search parameters."""
+    """Build a deterministic Redis cache key for search parameters.
+
+    The global cache generation and the generation of the entry's facet scope are
+    part of the key, so bumping either orphans the affected entries at once; those
+    keys simply expire by TTL.
+    """
+    canonical = _canonical_search_params(query, category, level, duration, language, page, limit)
+    return f"{settings.SEARCH_CACHE_KEY_PREFIX}:g{generation}:s{scope_generation}:{canonical}"
+
+
+def _canonical_search_params(
+    query: str,
+    category: Optional[str],
+    level: Optional[int],
+    duration: Optional[str],
+    language: Optional[str],
+    page: int,
+    limit: int,
+) -> str:
+    """Encode search parameters in a deterministic, generation-independent form."""
     key_params = {
         "q": query.strip(),
         "category": category or "",
@@ -398,76 +991,431 @@ def build_search_cache_key(
         "page": str(page),
         "limit": str(limit),
     }
-    canonical = urlencode(sorted(key_params.items()))
-    return f"{settings.SEARCH_CACHE_KEY_PREFIX}:{canonical}"
+    return urlencode(sorted(key_params.items()))
+
+
+async def _get_search_cache_generations(scope: str) -> tuple[int, int]:
+    """Read the global and scope cache generations in one round-trip.
+
+    Unset counters and Redis outages both read as ``0``.
+    """
+    try:
+        redis_client = await get_redis()
+        raw_generation, raw_scope_generation = await redis_client.mget(
+            _search_cache_generation_key(), _search_cache_generation_key(scope)
+        )
+        return int(raw_generation or 0), int(raw_scope_generation or 0)
+    except Exception:
+        logger.warning("search_cache_unavailable_on_generation")
+        return 0, 0
 
 
-async def _get_cached_search_response(cache_key: str) -> Optional[SearchResponse]:
-    """Fetch and deserialize search response from Redis cache."""
+_TIMESTAMP_ADAPTER = TypeAdapter(datetime)
+
+
+def _encode_search_body(response: SearchResponse) -> bytes:
+    """Serialize a search response without its ``timestamp`` for caching."""
+    return response.model_dump_json(exclude={"timestamp"}).encode("utf-8")
+
+
+def _with_fresh_timestamp(body: bytes) -> bytes:
+    """Complete a cached response body with the current ``timestamp``.
+
+    The cached body is a JSON object without ``timestamp``; the field is appended
+    as the last member, matching the serialized field order of SearchResponse.
+    """
+    timestamp = _TIMESTAMP_ADAPTER.dump_json(datetime.now(timezone.utc))
+    return body[:-1] + b',"timestamp":' + timestamp + b"}"
+
+
+async def _get_cached_search_body(cache_key: str) -> tuple[Optional[bytes], Optional[float]]:
+    """Fetch a cached, pre-serialized search response body plus its remaining TTL.
+
+    Value and TTL are read in one pipelined round-trip. The body is returned as
+    stored, without decoding it.
+
+    Returns:
+        ``(body, remaining_ttl_seconds)``; ``(None, None)`` on miss or outage.
+    """
     cache_key_hash = _cache_key_hash(cache_key)
     try:
         redis_client = await get_redis()
-        payload = await redis_client.get(cache_key)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(cache_key)
+            pipe.pttl(cache_key)
+            payload, ttl_ms = await pipe.execute()
         if not payload:
-            return None
+            return None, None
+
+        body = payload.encode("utf-8") if isinstance(payload, str) else payload
+        if not (body.startswith(b"{") and body.endswith(b"}")):
+            logger.warning("search_cache_malformed_entry", extra={"cache_key_hash": cache_key_hash})
+            return None, None
 
         logger.info("search_cache_hit", extra={"cache_key_hash": cache_key_hash})
-        return SearchResponse.model_validate_json(payload)
+        ttl_seconds = ttl_ms / 1000 if isinstance(ttl_ms, int) and ttl_ms > 0 else None
+        return body, ttl_seconds
     except Exception:
         logger.warning("search_cache_unavailable_on_get", extra={"cache_key_hash": cache_key_hash})
-        return None
+        return None, None
 
 
-async def _set_cached_search_response(cache_key: str, response: SearchResponse) -> None:
-    """Store search response in Redis cache with configured TTL."""
+async def _set_cached_search_body(cache_key: str, body: bytes) -> None:
+    """Store a pre-serialized search response body in Redis with configured TTL."""
     cache_key_hash = _cache_key_hash(cache_key)
     try:
         redis_client = await get_redis()
-        await redis_client.setex(
-            cache_key,
-            settings.SEARCH_CACHE_TTL_SECONDS,
-            response.model_dump_json(),
-        )
+        await redis_client.setex(cache_key, settings.SEARCH_CACHE_TTL_SECONDS, body)
         logger.info("search_cache_store", extra={"cache_key_hash": cache_key_hash})
     except Exception:
         logger.warning("search_cache_unavailable_on_set", extra={"cache_key_hash": cache_key_hash})
 
 
+# In-flight recomputations per cache key, shared by all requests of this process.
+_inflight_searches: dict[str, asyncio.Task[Optional[bytes]]] = {}
+# Strong references to fire-and-forget early refreshes.
+_background_refreshes: set[asyncio.Task[Optional[bytes]]] = set()
+
+_SEARCH_LOCK_POLL_SECONDS = 0.05
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _search_lock_key(cache_key: str) -> str:
+    """Redis key of the cross-worker recompute lock for one cache key."""
+    return f"{settings.SEARCH_CACHE_KEY_PREFIX}:lock:{_cache_key_hash(cache_key)}"
+
+
+def _search_reconcile_lock_key() -> str:
+    """Redis key of the cross-worker lease for the periodic index reconciler."""
+    return f"{settings.SEARCH_CACHE_KEY_PREFIX}:lock:reconcile"
+
+
+async def _try_lock_search_key(
+    lock_key: str, token: str, *, ttl_seconds: Optional[float] = None
+) -> bool:
+    """Take a cross-worker lock; also returns True when Redis is unavailable.
+
+    ``ttl_seconds`` defaults to ``SEARCH_CACHE_LOCK_TTL_SECONDS``.
+    """
+    if ttl_seconds is None:
+        ttl_seconds = settings.SEARCH_CACHE_LOCK_TTL_SECONDS
+    try:
+        redis_client = await get_redis()
+        return bool(await redis_client.set(lock_key, token, nx=True, px=int(ttl_seconds * 1000)))
+    except Exception:
+        logger.warning("search_cache_unavailable_on_lock")
+        return True
+
+
+async def _unlock_search_key(lock_key: str, token: str) -> None:
+    """Release the recompute lock if it is still owned by ``token``."""
+    try:
+        redis_client = await get_redis()
+        await redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+    except Exception:
+        logger.warning("search_cache_unavailable_on_unlock")
+
+
+async def _wait_for_peer_search_body(cache_key: str) -> Optional[bytes]:
+    """Poll the cache while another worker holds the recompute lock."""
+    deadline = perf_counter() + settings.SEARCH_CACHE_LOCK_WAIT_SECONDS
+    while perf_counter() < deadline:
+        await asyncio.sleep(_SEARCH_LOCK_POLL_SECONDS)
+        cached_body, _ = await _get_cached_search_body(cache_key)
+        if cached_body is not None:
+            return cached_body
+    return None
+
+
+async def _recompute_search_response(
+    cache_key: str,
+    compute: Callable[[], Awaitable[bytes]],
+    *,
+    wait_for_peer: bool,
+) -> Optional[bytes]:
+    """Recompute and cache one search response body under the cross-worker lock.
+
+    When another worker holds the lock, either wait for its result (falling back
+    to computing locally after ``SEARCH_CACHE_LOCK_WAIT_SECONDS``) or, for early
+    refreshes, give up and return ``None``.
+    """
+    lock_key = _search_lock_key(cache_key)
+    token = uuid4().hex
+    if not await _try_lock_search_key(lock_key, token):
+        if not wait_for_peer:
+            return None
+        cached_body = await _wait_for_peer_search_body(cache_key)
+        if cached_body is not None:
+            return cached_body
+        logger.info(
+            "search_cache_lock_wait_timeout",
+            extra={"cache_key_hash": _cache_key_hash(cache_key)},
+        )
+        body = await compute()
+        await _set_cached_search_body(cache_key, body)
+        return body
+
+    try:
+        body = await compute()
+        await _set_cached_search_body(cache_key, body)
+        return body
+    finally:
+        await _unlock_search_key(lock_key, token)
+
+
+def _forget_inflight_search(cache_key: str, task: asyncio.Task[Any]) -> None:
+    if _inflight_searches.get(cache_key) is task:
+        del _inflight_searches[cache_key]
+    if not task.cancelled():
+        # Mark the outcome as retrieved even if every waiter was cancelled.
+        task.exception()
+
+
+async def _coalesced_search(
+    cache_key: str,
+    compute: Callable[[], Awaitable[bytes]],
+    *,
+    wait_for_peer: bool = True,
+) -> Optional[bytes]:
+    """Single-flight: concurrent misses for one key share a single recomputation.
+
+    The recomputation runs in its own task, so a cancelled caller (e.g. a client
+    disconnect) does not abort it for the other waiters.
+    """
+    task = _inflight_searches.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(
+            _recompute_search_response(cache_key, compute, wait_for_peer=wait_for_peer)
+        )
+        _inflight_searches[cache_key] = task
+        task.add_done_callback(partial(_forget_inflight_search, cache_key))
+    else:
+        logger.info("search_cache_coalesced", extra={"cache_key_hash": _cache_key_hash(cache_key)})
+    return await asyncio.shield(task)
+
+
+def _should_refresh_early(ttl_seconds: Optional[float]) -> bool:
+    """Probabilistic early expiration (XFetch).
+
+    Refreshes with probability ``exp(-ttl / window)``, so entries close to expiry
+    are refreshed by one of their many readers while cold entries rarely are.
+    """
+    window = settings.SEARCH_CACHE_EARLY_REFRESH_WINDOW_SECONDS
+    if window <= 0 or ttl_seconds is None:
+        return False
+    return ttl_seconds < -window * math.log(1.0 - random.random())
+
+
+def _forget_background_refresh(task: asyncio.Task[Any]) -> None:
+    _background_refreshes.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("search_cache_early_refresh_failed", exc_info=task.exception())
+
+
+def _schedule_early_refresh(cache_key: str, compute: Callable[[], Awaitable[bytes]]) -> None:
+    """Refresh a hot cache entry in the background before its TTL runs out."""
+    if cache_key in _inflight_searches:
+        return
+    logger.info("search_cache_early_refresh", extra={"cache_key_hash": _cache_key_hash(cache_key)})
+    task = asyncio.create_task(_coalesced_search(cache_key, compute, wait_for_peer=False))
+    _background_refreshes.add(task)
+    task.add_done_callback(_forget_background_refresh)
+
+
+_local_search_cache: SearchLocalCache[bytes] = SearchLocalCache(
+    max_entries=settings.SEARCH_LOCAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEARCH_LOCAL_CACHE_TTL_SECONDS,
+)
+
+_INVALIDATE_ALL_MESSAGE = "*"
+_LISTENER_RETRY_SECONDS = 1.0
+
+
+def _search_cache_channel() -> str:
+    """Redis pub/sub channel that fans invalidations out to every worker."""
+    return f"{settings.SEARCH_CACHE_KEY_PREFIX}:invalidate"
+
+
+def _apply_invalidation_message(data: str) -> None:
+    """Apply one published invalidation (``*`` or a JSON list of scopes) locally."""
+    if data == _INVALIDATE_ALL_MESSAGE:
+        _local_search_cache.invalidate()
+        return
+    try:
+        scopes = json.loads(data)
+    except ValueError:
+        scopes = None
+    _local_search_cache.invalidate(scopes if isinstance(scopes, list) else None)
+
+
+async def _close_pubsub(pubsub: PubSub) -> None:
+    """Close a pub/sub connection; redis-py leaves ``PubSub.aclose`` unannotated."""
+    close: Callable[[], Awaitable[None]] = pubsub.aclose
+    await close()
+
+
+async def run_search_cache_invalidation_listener() -> None:
+    """Apply invalidations published by other workers to the local search cache.
+
+    Runs until cancelled. After a lost subscription the local cache is cleared,
+    because invalidations may have been missed in the meantime.
+    """
+    while True:
+        try:
+            redis_client = await get_redis()
+            pubsub: PubSub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(_search_cache_channel())
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        _apply_invalidation_message(message["data"])
+            finally:
+                await _close_pubsub(pubsub)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("search_cache_invalidation_listener_disconnected")
+        _local_search_cache.invalidate()
+        await asyncio.sleep(_LISTENER_RETRY_SECONDS)
+
+
 async def invalidate_search_cache(reason: str) -> int:
     """Invalidate all cached search entries.
 
-    This broad invalidation strategy is applied on Nano data changes to keep
-    search results consistent. It is safe to call in degraded mode (Redis down).
+    Bumps the cache generation with a single ``INCR``; entries written under an
+    older generation are no longer addressed and expire by TTL. It is safe to
+    call in degraded mode (Redis down).
 
     Args:
         reason: Context for observability/logging.
 
     Returns:
-        Number of deleted cache keys.
+        New cache generation, or 0 when Redis is unavailable.
     """
+    _local_search_cache.invalidate()
     try:
         redis_client = await get_redis()
-        pattern = f"{settings.SEARCH_CACHE_KEY_PREFIX}:*"
-        deleted = 0
-        batch: list[str] = []
+        generation = int(await redis_client.incr(_search_cache_generation_key()))
+        await redis_client.publish(_search_cache_channel(), _INVALIDATE_ALL_MESSAGE)
+        logger.info(
+            "search_cache_invalidate",
+            extra={"reason": reason, "generation": generation},
+        )
+        return generation
+    except Exception:
+        logger.warning("search_cache_unavailable_on_invalidate", extra={"reason": reason})
+        return 0
+
 
-        async for key in redis_client.scan_iter(match=pattern, count=200):
-            batch.append(key)
-            if len(batch) >= 200:
-                deleted += int(await redis_client.delete(*batch))
-                batch = []
+def _status_value(nano_status: Any) -> Optional[str]:
+    value = getattr(nano_status, "value", nano_status)
+    return None if value is None else str(value)
 
-        if batch:
-            deleted += int(await redis_client.delete(*batch))
 
+def is_search_visible_change(
+    old_status: Any,
+    new_status: Any,
+    changed_fields: Optional[Iterable[str]] = None,
+) -> bool:
+    """Tell whether a Nano change can alter search results.
+
+    Search only returns published Nanos, so a change is invisible when the Nano
+    was not published before or after it, or when it stayed published and none
+    of the changed fields is part of the search document.
+
+    Args:
+        old_status: Nano status before the change (enum or value)
+        new_status: Nano status after the change (enum or value)
+        changed_fields: Changed field names; ``None`` means unknown (assume visible)
+    """
+    published = NanoStatus.PUBLISHED.value
+    was_visible = _status_value(old_status) == published
+    is_visible = _status_value(new_status) == published
+    if not was_visible and not is_visible:
+        return False
+    if was_visible and is_visible and changed_fields is not None:
+        return not SEARCH_VISIBLE_FIELDS.isdisjoint(changed_fields)
+    return True
+
+
+async def load_search_facets(db: AsyncSession, nano_id: UUID) -> Optional[SearchFacets]:
+    """Load the filterable facet values of one Nano, or ``None`` if it does not exist."""
+    row = (
+        await db.execute(select(Nano.language, Nano.competency_level).where(Nano.id == nano_id))
+    ).one_or_none()
+    if row is None:
+        return None
+
+    primary_categories = await _load_primary_categories(db, [nano_id])
+    return SearchFacets(
+        category=primary_categories.get(nano_id),
+        language=row.language,
+        level=int(row.competency_level) if row.competency_level is not None else None,
+    )
+
+
+async def invalidate_search_cache_for_nano(
+    db: AsyncSession,
+    nano_id: UUID,
+    *,
+    reason: str,
+    old_status: Any,
+    new_status: Any,
+    changed_fields: Optional[Iterable[str]] = None,
+    previous_facets: Optional[SearchFacets] = None,
+) -> bool:
+    """Invalidate only the cached searches a single Nano change can affect.
+
+    Changes that are invisible to search (see :func:`is_search_visible_change`)
+    are skipped. Otherwise the generations of the ``all`` scope and of the Nano's
+    category, language, and level scopes are bumped in one pipeline, so cached
+    searches filtered by unrelated facets stay warm. Safe in degraded mode.
+
+    Args:
+        db: Database session used to resolve the Nano's current facets
+        nano_id: Changed Nano
+        reason: Context for observability/logging
+        old_status: Nano status before the change
+        new_status: Nano status after the change
+        changed_fields: Changed field names, if known
+        previous_facets: Facets before the change when it may have moved the Nano out of
+            some scopes (see ``update_nano_metadata``)
+
+    Returns:
+        True if cache entries were invalidated, False if the change was skipped
+        or Redis is unavailable.
+    """
+    if not is_search_visible_change(old_status, new_status, changed_fields):
         logger.info(
-            "search_cache_invalidate",
-            extra={"reason": reason, "deleted_keys": deleted},
+            "search_cache_invalidate_skipped",
+            extra={"reason": reason, "nano_id": str(nano_id)},
         )
-        return deleted
+        return False
+
+    facets = [previous_facets, await load_search_facets(db, nano_id)]
+    scopes = sorted(_facet_scopes(facet for facet in facets if facet is not None))
+    _local_search_cache.invalidate(scopes)
+    try:
+        redis_client = await get_redis()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for scope in scopes:
+                pipe.incr(_search_cache_generation_key(scope))
+            pipe.publish(_search_cache_channel(), json.dumps(scopes))
+            await pipe.execute()
     except Exception:
         logger.warning("search_cache_unavailable_on_invalidate", extra={"reason": reason})
-        return 0
+        return False
+
+    logger.info(
+        "search_cache_invalidate",
+        extra={"reason": reason, "nano_id": str(nano_id), "scopes": scopes},
+    )
+    return True
 
 
 async def search_nanos(
@@ -480,6 +1428,38 @@ async def search_nanos(
     page: int = 1,
     limit: int = 20,
 ) -> SearchResponse:
+    """
+    Search for Nanos with full-text search and return the decoded response.
+
+    See :func:`search_nanos_json` for arguments; the HTTP endpoint uses that
+    function directly to avoid decoding and re-encoding cached responses.
+
+    Returns:
+        SearchResponse with results and pagination metadata
+    """
+    body = await search_nanos_json(
+        db=db,
+        query=query,
+        category=category,
+        level=level,
+        duration=duration,
+        language=language,
+        page=page,
+        limit=limit,
+    )
+    return SearchResponse.model_validate_json(body)
+
+
+async def search_nanos_json(
+    db: AsyncSession,
+    query: Optional[str] = None,
+    category: Optional[str] = None,
+    level: Optional[int] = None,
+    duration: Optional[str] = None,
+    language: Optional[str] = None,
+    page: int = 1,
+    limit: int = 20,
+) -> bytes:
     """
     Search for Nanos with full-text search.
 
@@ -494,7 +1474,8 @@ async def search_nanos(
         limit: Results per page (default 20, max 100)
 
     Returns:
-        SearchResponse with results and pagination metadata
+        Serialized SearchResponse JSON; cached bodies are returned as stored
+        with a fresh ``timestamp``
 
     Raises:
         HTTPException: If search service is unavailable or query is invalid
@@ -532,6 +1513,16 @@ async def search_nanos(
         )
 
     normalized_query = query.strip() if query else ""
+    scope = _search_cache_scope(category, language, level)
+    local_key = _canonical_search_params(
+        normalized_query, category, level, duration, language, page, limit
+    )
+    local_body = _local_search_cache.get(local_key)
+    if local_body is not None:
+        return _with_fresh_timestamp(local_body)
+
+    local_epoch = _local_search_cache.epoch
+    generation, scope_generation = await _get_search_cache_generations(scope)
     cache_key = build_search_cache_key(
         query=normalized_query,
         category=category,
@@ -540,24 +1531,57 @@ async def search_nanos(
         language=language,
         page=page,
         limit=limit,
+        generation=generation,
+        scope_generation=scope_generation,
     )
 
-    cached_response = await _get_cached_search_response(cache_key)
-    if cached_response is not None:
-        return cached_response
+    compute = partial(
+        _run_search_body,
+        query=normalized_query,
+        category=category,
+        level=level,
+        duration=duration,
+        language=language,
+        page=page,
+        limit=limit,
+    )
+
+    cached_body, ttl_seconds = await _get_cached_search_body(cache_key)
+    if cached_body is not None:
+        if _should_refresh_early(ttl_seconds):
+            _schedule_early_refresh(cache_key, compute)
+        _local_search_cache.set(local_key, scope, cached_body, epoch=local_epoch)
+        return _with_fresh_timestamp(cached_body)
 
     logger.info("search_cache_miss", extra={"cache_key_hash": _cache_key_hash(cache_key)})
 
-    try:
-        client = MeilisearchClient(settings.MEILI_URL, settings.MEILI_MASTER_KEY)
-    except ImportError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Search service not configured",
-        ) from e
+    body = await _coalesced_search(cache_key, compute)
+    if body is None:
+        # Joined an early refresh that yielded to another worker's lock.
+        body = await compute()
+        await _set_cached_search_body(cache_key, body)
+    _local_search_cache.set(local_key, scope, body, epoch=local_epoch)
+    return _with_fresh_timestamp(body)
 
-    search_result = client.search(
-        query=normalized_query,
+
+async def _run_search_body(**search_params: Any) -> bytes:
+    """Run one search and serialize the response body for caching."""
+    return _encode_search_body(await _run_search(**search_params))
+
+
+async def _run_search(
+    *,
+    query: str,
+    category: Optional[str],
+    level: Optional[int],
+    duration: Optional[str],
+    language: Optional[str],
+    page: int,
+    limit: int,
+) -> SearchResponse:
+    """Query Meilisearch and build the API response for one parameter set."""
+    search_result = await get_search_client().search(
+        query=query,
         category=category,
         level=level,
         duration=duration,
@@ -598,7 +1622,7 @@ async def search_nanos(
     has_next_page = page < total_pages
     has_prev_page = page > 1
 
-    response = SearchResponse(
+    return SearchResponse(
         success=True,
         data=results,
         meta={
@@ -611,7 +1635,7 @@ async def search_nanos(
                 "has_prev_page": has_prev_page,
             },
             "query": {
-                "search_query": normalized_query,
+                "search_query": query,
                 "category": category,
                 "level": level,
                 "duration": duration,
@@ -620,6 +1644,3 @@ async def search_nanos(
         },
         timestamp=datetime.now(timezone.utc),
     )
-
-    await _set_cached_search_response(cache_key, response)
-    return response
@@ -0,0 +1,129 @@
+"""Pooled asynchronous HTTP transport for the Meilisearch REST API.
+
+A single :class:`MeiliTransport` is shared by the indexing and query paths. It
+keeps TCP connections alive between calls, bounds the connection pool, applies
+per-request timeouts, and caps the number of in-flight requests so a burst of
+search misses or reindex uploads cannot exhaust the backend.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+import httpx
+
+from app.config import get_settings
+
+_transport: Optional["MeiliTransport"] = None
+
+
+class MeiliTransport:
+    """Thin async wrapper around a pooled ``httpx.AsyncClient`` for Meilisearch."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        *,
+        timeout_seconds: float = 10.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        max_concurrent_requests: int = 16,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            base_url: Meilisearch server URL (e.g., http://localhost:7700)
+            api_key: Optional master/API key sent as bearer token
+            timeout_seconds: Default per-request timeout
+            max_connections: Upper bound of open connections in the pool
+            max_keepalive_connections: Idle connections kept alive for reuse
+            max_concurrent_requests: Maximum number of requests in flight at once
+        """
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers=headers,
+            timeout=httpx.Timeout(timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+    async def request(
+        self,
+        path: str,
+        *,
+        method: str = "GET",
+        payload: Any = None,
+        timeout: Optional[float] = None,
+    ) -> tuple[int, Any]:
+        """Send one request and return ``(status_code, decoded_body)``.
+
+        Non-2xx responses are returned rather than raised so callers can map
+        backend error codes. Network failures and timeouts raise ``httpx.HTTPError``.
+
+        Args:
+            path: API path including any query string (e.g. ``/indexes/nanos_v1/search``)
+            method: HTTP method
+            payload: Optional JSON-serializable request body
+            timeout: Optional per-request timeout overriding the client default
+        """
+        request_timeout: Any = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        async with self._semaphore:
+            response = await self._client.request(
+                method,
+                path,
+                json=payload,
+                timeout=request_timeout,
+            )
+
+        if not response.content:
+            return response.status_code, None
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, response.text
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+
+def get_meili_transport() -> MeiliTransport:
+    """Get the shared Meilisearch transport, creating it on first use.
+
+    Returns:
+        Process-wide :class:`MeiliTransport` instance.
+    """
+    global _transport
+
+    if _transport is None:
+        settings = get_settings()
+        _transport = MeiliTransport(
+            settings.MEILI_URL,
+            settings.MEILI_MASTER_KEY,
+            timeout_seconds=settings.MEILI_TIMEOUT_SECONDS,
+            max_connections=settings.MEILI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.MEILI_MAX_KEEPALIVE_CONNECTIONS,
+            max_concurrent_requests=settings.MEILI_MAX_CONCURRENT_REQUESTS,
+        )
+
+    return _transport
+
+
+async def close_meili_transport() -> None:
+    """Close the shared Meilisearch transport.
+
+    Should be called during application shutdown.
+    """
+    global _transport
+
+    if _transport is not None:
+        await _transport.aclose()
+        _transport = None
@@ -6,7 +6,7 @@ from typing import Awaitable, Callable, Final
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.routing import APIRoute
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 from prometheus_fastapi_instrumentator import Instrumentator
 from starlette.requests import Request
 from starlette.responses import Response
@@ -38,6 +38,101 @@ SPAM_MESSAGE_RATE_LIMIT_429_TOTAL: Final[Counter] = Counter(
     ("endpoint",),
 )
 
+DB_POOL_CHECKED_OUT_CONNECTIONS: Final[Gauge] = Gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out of this process's pool.",
+    ("pool",),
+)
+
+DB_POOL_OVERFLOW_CONNECTIONS: Final[Gauge] = Gauge(
+    "db_pool_overflow_connections",
+    "Database connections open beyond DB_POOL_SIZE in this process's pool.",
+    ("pool",),
+)
+
+DB_POOL_CHECKOUT_WAIT_SECONDS: Final[Histogram] = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for (or opening) a pooled database connection.",
+    ("pool",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+DB_POOL_CHECKOUT_TIMEOUTS_TOTAL: Final[Counter] = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Database connection checkouts that gave up after DB_POOL_TIMEOUT_SECONDS.",
+    ("pool",),
+)
+
+REDIS_CIRCUIT_BREAKER_STATE: Final[Gauge] = Gauge(
+    "redis_circuit_breaker_state",
+    "Redis circuit breaker state: 0 closed, 1 open, 2 half-open.",
+)
+
+REDIS_CIRCUIT_BREAKER_REJECTED_TOTAL: Final[Counter] = Counter(
+    "redis_circuit_breaker_rejected_total",
+    "Redis calls failed fast because the circuit breaker was open.",
+)
+
+REDIS_FALLBACK_ENTRIES: Final[Gauge] = Gauge(
+    "redis_fallback_entries",
+    "Token entries held in process memory while Redis was unavailable.",
+    ("store",),
+)
+
+REDIS_FALLBACK_EVICTED_TOTAL: Final[Counter] = Counter(
+    "redis_fallback_evicted_total",
+    "Fallback store entries removed before being resynced to Redis.",
+    ("reason",),
+)
+
+REDIS_FALLBACK_RESYNC_TOTAL: Final[Counter] = Counter(
+    "redis_fallback_resync_total",
+    "Bulk resyncs of the fallback store to Redis by outcome.",
+    ("outcome",),
+)
+
+RATE_LIMIT_KEYS_EVICTED_TOTAL: Final[Counter] = Counter(
+    "rate_limit_keys_evicted_total",
+    "Rate limiter keys evicted from process memory because the key cap was reached.",
+    ("limiter",),
+)
+
+PASSWORD_HASH_QUEUE_DEPTH: Final[Gauge] = Gauge(
+    "password_hash_queue_depth",
+    "bcrypt jobs waiting for a password hashing worker thread.",
+)
+
+PASSWORD_HASH_QUEUE_WAIT_SECONDS: Final[Histogram] = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time bcrypt jobs waited for a password hashing worker thread.",
+    ("operation",),
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+PASSWORD_VERIFICATION_QUEUE_DEPTH: Final[Gauge] = Gauge(
+    "password_verification_queue_depth",
+    "Password verifications waiting for an admission slot.",
+)
+
+PASSWORD_VERIFICATION_REJECTED_TOTAL: Final[Counter] = Counter(
+    "password_verification_rejected_total",
+    "Password verifications rejected by bcrypt admission control, by reason.",
+    ("reason",),
+)
+
+LOGIN_RATE_LIMITED_TOTAL: Final[Counter] = Counter(
+    "login_rate_limited_total",
+    "Login requests rejected with HTTP 429 by rate limiting, by limiter scope.",
+    ("scope",),
+)
+
+PASSWORD_HASH_DURATION_SECONDS: Final[Histogram] = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hash/verify execution time in seconds.",
+    ("operation",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5),
+)
+
 
 def _classify_feedback_outcome(status_code: int) -> str:
     """Map HTTP status codes to low-cardinality Prometheus outcome labels."""
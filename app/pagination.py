@@ -0,0 +1,158 @@
+"""Keyset (cursor) pagination shared by the list endpoints.
+
+A cursor is the sort key of the last row on a page (the endpoint's sort columns
+plus ``id`` as tiebreaker), JSON-encoded and base64url-wrapped so clients treat
+it as opaque. The next page is selected with a row-value comparison such as
+``(created_at, id) < (:created_at, :id)``, which a matching index answers
+without walking the skipped rows, so deep pages cost the same as page 1.
+
+Offset pagination stays available for the first pages; every page also returns
+a ``next_cursor`` so clients can switch to keyset scrolling at any point.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, Optional, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+RowT = TypeVar("RowT")
+
+# Upper bound for the ``cursor`` query parameter; real cursors are far shorter
+MAX_CURSOR_LENGTH = 512
+
+# Sort key columns: Core columns or ORM model attributes such as ``Nano.id``
+KeysetColumn = ColumnElement[Any] | InstrumentedAttribute[Any]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client-supplied pagination cursor cannot be decoded."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(raw: Any, column: KeysetColumn) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(raw)
+    if python_type is uuid.UUID:
+        return uuid.UUID(raw)
+    return python_type(raw)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode a sort-key tuple into an opaque URL-safe cursor."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[KeysetColumn]) -> tuple[Any, ...]:
+    """Decode a cursor produced by :func:`encode_cursor` for the given key columns.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match the columns.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw_values, list) or len(raw_values) != len(columns):
+            raise InvalidCursorError("Cursor does not match this listing")
+        return tuple(_decode_value(raw, column) for raw, column in zip(raw_values, columns))
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise InvalidCursorError("Malformed pagination cursor") from exc
+
+
+def paginate_keyset(
+    stmt: Select,
+    columns: Sequence[KeysetColumn],
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    descending: bool = False,
+) -> Select:
+    """Order ``stmt`` by ``columns`` and select one page plus one look-ahead row.
+
+    With a ``cursor`` the page starts right after the encoded key and ``offset``
+    is ignored; without one, ``offset`` rows are skipped as before. All columns
+    sort in the same direction so the row-value comparison stays index-friendly.
+
+    Raises:
+        InvalidCursorError: If ``cursor`` cannot be decoded for ``columns``.
+    """
+    stmt = stmt.order_by(*(column.desc() if descending else column.asc() for column in columns))
+    if cursor is not None:
+        values = decode_cursor(cursor, columns)
+        key = tuple_(*columns)
+        bound = tuple_(*(literal(value, column.type) for value, column in zip(values, columns)))
+        stmt = stmt.where(key < bound if descending else key > bound)
+    elif offset:
+        stmt = stmt.offset(offset)
+    return stmt.limit(limit + 1)
+
+
+def paginate_keyset_or_400(
+    stmt: Select,
+    columns: Sequence[KeysetColumn],
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    descending: bool = False,
+) -> Select:
+    """Apply :func:`paginate_keyset`, mapping a malformed cursor to a 400 response.
+
+    Raises:
+        HTTPException: 400 if ``cursor`` cannot be decoded for ``columns``.
+    """
+    try:
+        return paginate_keyset(
+            stmt, columns, limit=limit, cursor=cursor, offset=offset, descending=descending
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from exc
+
+
+def split_page(
+    rows: Sequence[RowT],
+    limit: int,
+    sort_key: Callable[[RowT], Sequence[Any]],
+) -> tuple[list[RowT], Optional[str]]:
+    """Trim the look-ahead row fetched by :func:`paginate_keyset`.
+
+    Returns:
+        The rows of this page and the cursor for the next one (None on the last page).
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    return page, encode_cursor(sort_key(page[-1]))
+
+
+def should_count_total(cursor: Optional[str], include_total: Optional[bool]) -> bool:
+    """Decide whether to run the ``COUNT(*)`` for a listing.
+
+    Totals are computed for offset pages by default and skipped when scrolling
+    by cursor, unless the client asks explicitly via ``include_total``.
+    """
+    if include_total is not None:
+        return include_total
+    return cursor is None
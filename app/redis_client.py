@@ -1,78 +1,356 @@
 """Redis client for token storage and blacklist management"""
 
 import asyncio
+import hashlib
+import heapq
+import logging
 import time
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 import redis.asyncio as redis
+from prometheus_client import Counter, Gauge
+from redis.asyncio.client import Pipeline
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import RedisError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from app.config import get_settings
+from app.monitoring import (
+    REDIS_CIRCUIT_BREAKER_REJECTED_TOTAL,
+    REDIS_CIRCUIT_BREAKER_STATE,
+    REDIS_FALLBACK_ENTRIES,
+    REDIS_FALLBACK_EVICTED_TOTAL,
+    REDIS_FALLBACK_RESYNC_TOTAL,
+)
 
-_redis_client: Optional[redis.Redis] = None
-_fallback_store: dict[str, tuple[str, Optional[float]]] = {}
+T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
 
-def _fallback_prune_expired() -> None:
-    now = time.time()
-    expired_keys = [
-        key
-        for key, (_, expires_at) in _fallback_store.items()
-        if expires_at is not None and expires_at <= now
-    ]
-    for key in expired_keys:
-        _fallback_store.pop(key, None)
 
+class RedisCircuitOpenError(RedisConnectionError):
+    """Raised instead of calling Redis while the circuit breaker is open."""
 
-def _fallback_set(key: str, value: str, expires_in_seconds: int) -> None:
-    _fallback_prune_expired()
-    if expires_in_seconds <= 0:
-        _fallback_store.pop(key, None)
-        return
-    expires_at = time.time() + expires_in_seconds
-    _fallback_store[key] = (value, expires_at)
 
+class RedisCircuitBreaker:
+    """Consecutive-failure circuit breaker for Redis calls.
+
+    After ``failure_threshold`` consecutive connection failures or timeouts the
+    breaker opens and calls fail immediately with :class:`RedisCircuitOpenError`,
+    so callers take their fallback path without waiting for a timeout. After
+    ``reset_timeout_seconds`` one probe call is let through (half-open); its
+    outcome closes or re-opens the breaker. The state is exported to
+    ``state_gauge`` (0 closed, 1 open, 2 half-open).
+    """
+
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout_seconds: float,
+        *,
+        state_gauge: Gauge,
+        rejected_counter: Counter,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be greater than zero")
+        if reset_timeout_seconds <= 0:
+            raise ValueError("reset_timeout_seconds must be greater than zero")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._state_gauge = state_gauge
+        self._rejected_counter = rejected_counter
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.reset()
+
+    @property
+    def state(self) -> int:
+        return self._state
+
+    def _set_state(self, state: int) -> None:
+        self._state = state
+        self._state_gauge.set(state)
+
+    def allow_request(self) -> bool:
+        """Return True if a Redis call may be attempted now."""
+        if self._state == self.OPEN:
+            if time.monotonic() < self._opened_at + self.reset_timeout_seconds:
+                self._rejected_counter.inc()
+                return False
+            self._set_state(self.HALF_OPEN)
+
+        if self._state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                self._rejected_counter.inc()
+                return False
+            self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probe_in_flight = False
+        if self._state != self.CLOSED:
+            self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                logger.warning("redis_circuit_breaker_opened", extra={"failures": self._failures})
+            self._opened_at = time.monotonic()
+            self._set_state(self.OPEN)
+
+    def release(self) -> None:
+        """Give up a half-open probe whose outcome is unknown (e.g. cancelled)."""
+        self._probe_in_flight = False
+
+    def reset(self) -> None:
+        """Close the breaker and forget past failures."""
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._set_state(self.CLOSED)
+
+
+# Errors meaning Redis could not be reached in time; other Redis errors come
+# from a server that answered and do not count against the breaker.
+_REDIS_OUTAGE_ERRORS = (RedisConnectionError, RedisTimeoutError, OSError, asyncio.TimeoutError)
+
+REDIS_CIRCUIT_BREAKER = RedisCircuitBreaker(
+    get_settings().REDIS_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    get_settings().REDIS_CIRCUIT_BREAKER_RESET_SECONDS,
+    state_gauge=REDIS_CIRCUIT_BREAKER_STATE,
+    rejected_counter=REDIS_CIRCUIT_BREAKER_REJECTED_TOTAL,
+)
+
+
+async def _call_through_breaker(call: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    if not REDIS_CIRCUIT_BREAKER.allow_request():
+        raise RedisCircuitOpenError("Redis circuit breaker is open")
+    try:
+        result = await call(*args, **kwargs)
+    except _REDIS_OUTAGE_ERRORS:
+        REDIS_CIRCUIT_BREAKER.record_failure()
+        raise
+    except RedisError:
+        REDIS_CIRCUIT_BREAKER.record_success()
+        raise
+    except BaseException:
+        REDIS_CIRCUIT_BREAKER.release()
+        raise
+    REDIS_CIRCUIT_BREAKER.record_success()
+    return result
+
+
+class _CircuitBreakingPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        return await _call_through_breaker(super().execute, raise_on_error)
+
+
+class _CircuitBreakingRedis(redis.Redis):
+    """Redis client whose commands and pipelines go through ``REDIS_CIRCUIT_BREAKER``."""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        return await _call_through_breaker(super().execute_command, *args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> Pipeline:
+        return _CircuitBreakingPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
 
-def _fallback_get(key: str) -> Optional[str]:
-    _fallback_prune_expired()
-    entry = _fallback_store.get(key)
-    if entry is None:
-        return None
-    return entry[0]
 
+class BoundedTTLStore:
+    """In-memory key/value store with per-entry TTL and an optional size cap.
 
-def _fallback_delete(key: str) -> None:
-    _fallback_store.pop(key, None)
+    Expiry times are kept in a min-heap, so expired entries are dropped in
+    amortized O(log n) per operation instead of scanning the whole store. When
+    ``max_entries`` is reached the entry closest to expiry is evicted, since it
+    would be the next one to disappear anyway; with ``max_entries=None`` entries
+    are only removed when they expire. Removed entries are counted in
+    ``evicted_counter`` by reason (``expired`` or ``capacity``).
+    """
 
+    def __init__(
+        self, max_entries: Optional[int], *, size_gauge: Gauge, evicted_counter: Counter
+    ) -> None:
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be greater than zero")
+
+        self.max_entries = max_entries
+        self._size_gauge = size_gauge
+        self._evicted_counter = evicted_counter
+        self._entries: dict[str, tuple[str, float]] = {}
+        # (expires_at, key); entries whose key was overwritten or deleted are
+        # skipped lazily and compacted once they outnumber the live entries.
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def _pop_heap_head(self, reason: str) -> None:
+        expires_at, key = heapq.heappop(self._expiry_heap)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] == expires_at:
+            del self._entries[key]
+            self._evicted_counter.labels(reason=reason).inc()
+
+    def _prune_expired(self, now: float) -> None:
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            self._pop_heap_head("expired")
+
+    def _update_size(self) -> None:
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                (expires_at, key) for key, (_, expires_at) in self._entries.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+        self._size_gauge.set(len(self._entries))
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        """Store ``value`` for ``ttl_seconds``; a non-positive TTL deletes the key."""
+        now = time.monotonic()
+        self._prune_expired(now)
+        if ttl_seconds <= 0:
+            self._entries.pop(key, None)
+        else:
+            expires_at = now + ttl_seconds
+            self._entries[key] = (value, expires_at)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            while self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._pop_heap_head("capacity")
+        self._update_size()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the live value of ``key`` or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if entry[1] <= now:
+            self._prune_expired(now)
+            self._update_size()
+            return None
+        return entry[0]
+
+    def delete(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._update_size()
+
+    def items(self) -> list[tuple[str, str, float]]:
+        """Return ``(key, value, expires_at)`` of all live entries (monotonic clock)."""
+        self._prune_expired(time.monotonic())
+        self._update_size()
+        return [(key, value, expires_at) for key, (value, expires_at) in self._entries.items()]
+
+    def discard(self, key: str, expires_at: float) -> None:
+        """Delete ``key`` only if it was not rewritten since ``items()`` returned it."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] == expires_at:
+            del self._entries[key]
+            self._update_size()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._expiry_heap.clear()
+        self._size_gauge.set(0)
 
-def _fallback_get_with_ttl(key: str) -> tuple[Optional[str], Optional[int]]:
-    _fallback_prune_expired()
-    entry = _fallback_store.get(key)
-    if entry is None:
-        return None, None
 
-    value, expires_at = entry
-    if expires_at is None:
-        return value, None
+_redis_client: Optional[redis.Redis] = None
+# Refresh tokens written during an outage. Evicting one only forces that user
+# to log in again, so this store is capped.
+_fallback_store = BoundedTTLStore(
+    get_settings().REDIS_FALLBACK_MAX_ENTRIES,
+    size_gauge=REDIS_FALLBACK_ENTRIES.labels(store="refresh_token"),
+    evicted_counter=REDIS_FALLBACK_EVICTED_TOTAL,
+)
+# Blacklist entries written during an outage. Evicting one would make a revoked
+# token valid again, so they are never evicted and only leave by expiry or resync.
+_fallback_blacklist = BoundedTTLStore(
+    None,
+    size_gauge=REDIS_FALLBACK_ENTRIES.labels(store="blacklist"),
+    evicted_counter=REDIS_FALLBACK_EVICTED_TOTAL,
+)
+_FALLBACK_RESYNC_RETRY_SECONDS = 5.0
+_fallback_resync_not_before = 0.0
+
+
+def _blacklist_key(token: str) -> str:
+    """Return the fixed-size blacklist key of a token (SHA-256 of the encoded JWT)."""
+    return f"blacklist:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def _blacklist_lookup_keys(token: str) -> list[str]:
+    """Return the Redis keys that may hold a revocation of ``token``.
+
+    Revocations written before blacklist keys were hashed live under
+    ``blacklist:{token}`` until they expire, so they are checked as well while
+    ``BLACKLIST_CHECK_LEGACY_KEYS`` is enabled.
+    """
+    keys = [_blacklist_key(token)]
+    if get_settings().BLACKLIST_CHECK_LEGACY_KEYS:
+        keys.append(f"blacklist:{token}")
+    return keys
 
-    ttl_seconds = int(expires_at - time.time())
-    if ttl_seconds <= 0:
-        _fallback_store.pop(key, None)
-        return None, None
 
-    return value, ttl_seconds
+async def _resync_fallback_to_redis(client: redis.Redis) -> None:
+    """Copy entries written during a Redis outage back to Redis in one pipeline.
 
+    Called after a successful Redis command. Keys already present in Redis are
+    left untouched (``NX``), matching reads, which prefer the Redis value. Resynced
+    entries are dropped from the fallback stores; after a failure the next attempt
+    waits ``_FALLBACK_RESYNC_RETRY_SECONDS``.
+    """
+    global _fallback_resync_not_before
 
-async def _best_effort_resync_to_redis(
-    client: redis.Redis, key: str, value: str, ttl_seconds: Optional[int]
-) -> None:
-    if ttl_seconds is None or ttl_seconds <= 0:
+    now = time.monotonic()
+    if not (_fallback_store or _fallback_blacklist) or now < _fallback_resync_not_before:
         return
 
+    entries = [
+        (store, key, value, expires_at)
+        for store in (_fallback_blacklist, _fallback_store)
+        for key, value, expires_at in store.items()
+    ]
+    # Also keeps concurrent callers from starting a second resync meanwhile.
+    _fallback_resync_not_before = now + _FALLBACK_RESYNC_RETRY_SECONDS
     try:
-        await client.setex(key, ttl_seconds, value)
+        async with client.pipeline(transaction=False) as pipe:
+            for _, key, value, expires_at in entries:
+                pipe.set(key, value, px=max(1, int((expires_at - now) * 1000)), nx=True)
+            await pipe.execute()
     except Exception:
-        pass
+        REDIS_FALLBACK_RESYNC_TOTAL.labels(outcome="failure").inc()
+        logger.warning("redis_fallback_resync_failed", extra={"entries": len(entries)})
+        return
+
+    for store, key, _, expires_at in entries:
+        store.discard(key, expires_at)
+    _fallback_resync_not_before = 0.0
+    REDIS_FALLBACK_RESYNC_TOTAL.labels(outcome="success").inc()
+
+
+def decode_redis_value(value: bytes | str | None) -> Optional[str]:
+    """Return a Redis reply as text.
+
+    The client is created with ``decode_responses=True``, but redis-py types
+    replies as ``bytes | str``; this narrows them for typed callers.
+    """
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
 
 
 def _is_redis_unavailable(error: Exception) -> bool:
@@ -101,17 +379,27 @@ async def get_redis() -> redis.Redis:
         Redis client instance.
 
     Note:
-        Uses a singleton pattern with connection pooling for thread-safety.
+        Uses a singleton client over a bounded connection pool. Commands time out
+        after ``REDIS_SOCKET_TIMEOUT_SECONDS`` and fail fast with
+        :class:`RedisCircuitOpenError` while the circuit breaker is open.
     """
     global _redis_client
 
     if _redis_client is None:
-        redis_url = get_redis_url()
-        _redis_client = redis.from_url(
-            redis_url,
+        settings = get_settings()
+        connection_pool = redis.BlockingConnectionPool.from_url(
+            get_redis_url(),
             encoding="utf-8",
             decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            retry_on_timeout=settings.REDIS_RETRY_ON_TIMEOUT,
+            retry=Retry(ExponentialBackoff(cap=0.1, base=0.01), settings.REDIS_RETRY_ATTEMPTS),
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
         )
+        _redis_client = _CircuitBreakingRedis.from_pool(connection_pool)
 
     return _redis_client
 
@@ -128,6 +416,7 @@ async def close_redis() -> None:
         _redis_client = None
 
     _fallback_store.clear()
+    _fallback_blacklist.clear()
 
 
 async def check_redis_health() -> bool:
@@ -158,7 +447,9 @@ async def store_refresh_token(user_id: str, token: str, expires_in_seconds: int)
     except Exception as error:
         if not _is_redis_unavailable(error):
             raise
-        _fallback_set(key, token, expires_in_seconds)
+        _fallback_store.set(key, token, expires_in_seconds)
+        return
+    await _resync_fallback_to_redis(client)
 
 
 async def get_refresh_token(user_id: str) -> Optional[str]:
@@ -173,22 +464,16 @@ async def get_refresh_token(user_id: str) -> Optional[str]:
     client = await get_redis()
     key = f"refresh_token:{user_id}"
     try:
-        token = await client.get(key)
+        token = decode_redis_value(await client.get(key))
     except Exception as error:
         if not _is_redis_unavailable(error):
             raise
-        fallback_token, _ = _fallback_get_with_ttl(key)
-        return fallback_token
-
-    if token:
-        return token
+        return _fallback_store.get(key)
 
-    fallback_token, ttl_seconds = _fallback_get_with_ttl(key)
-    if fallback_token is None:
-        return None
-
-    await _best_effort_resync_to_redis(client, key, fallback_token, ttl_seconds)
-    return fallback_token
+    if not token:
+        token = _fallback_store.get(key)
+    await _resync_fallback_to_redis(client)
+    return token
 
 
 async def delete_refresh_token(user_id: str) -> None:
@@ -205,7 +490,7 @@ async def delete_refresh_token(user_id: str) -> None:
         if not _is_redis_unavailable(error):
             raise
     finally:
-        _fallback_delete(key)
+        _fallback_store.delete(key)
 
 
 async def blacklist_token(token: str, expires_in_seconds: int) -> None:
@@ -216,13 +501,15 @@ async def blacklist_token(token: str, expires_in_seconds: int) -> None:
         expires_in_seconds: Time until token naturally expires
     """
     client = await get_redis()
-    key = f"blacklist:{token}"
+    key = _blacklist_key(token)
     try:
         await client.setex(key, expires_in_seconds, "1")
     except Exception as error:
         if not _is_redis_unavailable(error):
             raise
-        _fallback_set(key, "1", expires_in_seconds)
+        _fallback_blacklist.set(key, "1", expires_in_seconds)
+        return
+    await _resync_fallback_to_redis(client)
 
 
 async def is_token_blacklisted(token: str) -> bool:
@@ -235,20 +522,46 @@ async def is_token_blacklisted(token: str) -> bool:
         True if blacklisted, False otherwise
     """
     client = await get_redis()
-    key = f"blacklist:{token}"
+    keys = _blacklist_lookup_keys(token)
     try:
-        exists = await client.exists(key)
+        exists = await client.exists(*keys)
     except Exception as error:
         if not _is_redis_unavailable(error):
             raise
-        return _fallback_get(key) is not None
+        return keys[0] in _fallback_blacklist
 
-    if exists > 0:
-        return True
+    blacklisted = exists > 0 or keys[0] in _fallback_blacklist
+    await _resync_fallback_to_redis(client)
+    return blacklisted
 
-    fallback_value, ttl_seconds = _fallback_get_with_ttl(key)
-    if fallback_value is None:
-        return False
 
-    await _best_effort_resync_to_redis(client, key, fallback_value, ttl_seconds)
-    return True
+async def is_token_blacklisted_with_value(token: str, key: str) -> tuple[bool, Optional[str]]:
+    """Check if token is blacklisted and read another key in the same round-trip.
+
+    Used by request authentication to fetch cached per-user state together with
+    the blacklist flag via a single ``MGET``.
+
+    Args:
+        token: Token to check
+        key: Additional Redis key to read
+
+    Returns:
+        Tuple of the blacklist flag and the value stored at ``key``. The value is
+        None if the key is missing or Redis is unavailable; in the latter case
+        the blacklist flag is answered from the in-memory fallback store.
+    """
+    client = await get_redis()
+    blacklist_keys = _blacklist_lookup_keys(token)
+    try:
+        *blacklist_values, value = await client.mget(*blacklist_keys, key)
+    except Exception as error:
+        if not _is_redis_unavailable(error):
+            raise
+        return blacklist_keys[0] in _fallback_blacklist, None
+
+    blacklisted = (
+        any(blacklist_value is not None for blacklist_value in blacklist_values)
+        or blacklist_keys[0] in _fallback_blacklist
+    )
+    await _resync_fallback_to_redis(client)
+    return blacklisted, decode_redis_value(value)
@@ -216,18 +216,20 @@ class AuditLogsQueryResponse(BaseModel):
     """Paginated audit logs query response schema"""
 
     logs: list[AuditLogResponse]
-    total: int
+    total: Optional[int]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class AdminUserListResponse(BaseModel):
     """Paginated admin user list response."""
 
     users: list[UserResponse]
-    total: int
+    total: Optional[int]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class AdminUserRoleUpdateRequest(BaseModel):
@@ -0,0 +1,98 @@
+"""Admission control for CPU-bound operations under abusive load."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from prometheus_client import Counter, Gauge
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when an operation is shed instead of being queued."""
+
+    def __init__(self, reason: str, retry_after_seconds: int) -> None:
+        super().__init__(f"Admission rejected: {reason}")
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+class ConcurrencyAdmissionController:
+    """Per-process concurrency limit with a bounded wait queue.
+
+    At most ``max_concurrent`` operations run at once. Up to ``max_queue``
+    further callers wait for a slot for at most ``queue_timeout_seconds``; any
+    caller beyond that is rejected immediately, so overload sheds work instead of
+    building an unbounded backlog.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+        *,
+        queue_depth_gauge: Gauge,
+        rejected_counter: Counter,
+    ) -> None:
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be greater than zero")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        if queue_timeout_seconds <= 0:
+            raise ValueError("queue_timeout_seconds must be greater than zero")
+
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.retry_after_seconds = max(1, math.ceil(queue_timeout_seconds))
+        self._queue_depth_gauge = queue_depth_gauge
+        self._rejected_counter = rejected_counter
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers currently waiting for a slot."""
+        return self._waiting
+
+    def _reject(self, reason: str) -> AdmissionRejectedError:
+        self._rejected_counter.labels(reason=reason).inc()
+        return AdmissionRejectedError(reason, self.retry_after_seconds)
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block.
+
+        Raises:
+            AdmissionRejectedError: If the wait queue is full (``queue_full``) or
+                no slot became free in time (``queue_timeout``)
+        """
+        if self._semaphore.locked():
+            if self._waiting >= self.max_queue:
+                raise self._reject("queue_full")
+
+            self._waiting += 1
+            self._queue_depth_gauge.inc()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout_seconds)
+            except asyncio.TimeoutError:
+                raise self._reject("queue_timeout") from None
+            finally:
+                self._waiting -= 1
+                self._queue_depth_gauge.dec()
+        else:
+            await self._semaphore.acquire()
+
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    def reset(self) -> None:
+        """Drop all slots and waiters (primarily for tests)."""
+        self._queue_depth_gauge.dec(self._waiting)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._waiting = 0
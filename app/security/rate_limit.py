@@ -2,31 +2,67 @@
 
 from __future__ import annotations
 
-import asyncio
+import logging
+import math
 import time
-from collections import deque
+from collections import OrderedDict
+from uuid import uuid4
 
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 
-class SlidingWindowRateLimiter:
-    """In-memory sliding-window rate limiter.
+from app.config import get_settings
+from app.monitoring import RATE_LIMIT_KEYS_EVICTED_TOTAL
+from app.redis_client import get_redis
 
-    Each key maintains a rolling deque of hit timestamps.  On every check the
-    deque is pruned to the current ``window_seconds`` interval so the visible
-    request count always reflects a true sliding window rather than a discrete
-    epoch boundary.  Keys should be endpoint-scoped and identity-scoped.
+logger = logging.getLogger(__name__)
+
+
+class CompactRateLimiter:
+    """Bounded in-memory rate limiter based on GCRA.
+
+    Approximates a sliding window of ``max_requests`` per ``window_seconds``
+    with one theoretical-arrival timestamp and a violation counter per key, so a
+    key costs a fixed few bytes no matter how many hits it takes. At most
+    ``max_keys`` keys are tracked; the least recently used key is evicted beyond
+    that (``rate_limit_keys_evicted_total``). ``check`` never awaits, so it is
+    atomic on the event loop and needs no lock.
+
+    Repeated violations within one window add a linear Retry-After penalty of
+    one second per violation.
     """
 
-    def __init__(self, max_requests: int, window_seconds: int) -> None:
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: int,
+        *,
+        name: str = "default",
+        max_keys: int = 100_000,
+    ) -> None:
         if max_requests <= 0:
             raise ValueError("max_requests must be greater than zero")
         if window_seconds <= 0:
             raise ValueError("window_seconds must be greater than zero")
+        if max_keys <= 0:
+            raise ValueError("max_keys must be greater than zero")
 
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._hits: dict[str, deque[float]] = {}
-        self._violations: dict[str, deque[float]] = {}
-        self._lock = asyncio.Lock()
+        self.name = name
+        self.max_keys = max_keys
+        # key -> (theoretical arrival time, violations, last violation time)
+        self._states: OrderedDict[str, tuple[float, int, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def _store(self, key: str, state: tuple[float, int, float]) -> None:
+        self._states[key] = state
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_keys:
+            self._states.popitem(last=False)
+            RATE_LIMIT_KEYS_EVICTED_TOTAL.labels(limiter=self.name).inc()
 
     async def check(self, key: str) -> tuple[bool, int]:
         """Check whether a request for ``key`` is allowed.
@@ -36,40 +72,132 @@ class SlidingWindowRateLimiter:
             retry_after_seconds is always 0.
         """
         now = time.monotonic()
+        emission_interval = self.window_seconds / self.max_requests
+        tat, violations, last_violation_at = self._states.get(key, (now, 0, 0.0))
 
-        async with self._lock:
-            bucket = self._hits.setdefault(key, deque())
-            violation_bucket = self._violations.setdefault(key, deque())
-            cutoff = now - self.window_seconds
-
-            while bucket and bucket[0] <= cutoff:
-                bucket.popleft()
-            while violation_bucket and violation_bucket[0] <= cutoff:
-                violation_bucket.popleft()
-
-            # Evict the key when the bucket is empty to prevent the _hits dict
-            # from growing without bound across many distinct client keys.
-            if not bucket:
-                del self._hits[key]
-            if not violation_bucket:
-                self._violations.pop(key, None)
-
-            if len(bucket) >= self.max_requests:
-                violation_bucket = self._violations.setdefault(key, deque())
-                violation_bucket.append(now)
-
-                base_retry_after_seconds = max(1, int(self.window_seconds - (now - bucket[0])))
-                # Apply a linear penalty on repeated violations for this key.
-                linear_penalty_seconds = len(violation_bucket)
-                retry_after_seconds = max(base_retry_after_seconds, linear_penalty_seconds)
-                return False, retry_after_seconds
-
-            bucket = self._hits.setdefault(key, deque())
-            bucket.append(now)
-            self._violations.pop(key, None)
+        new_tat = max(tat, now) + emission_interval
+        if new_tat - now <= self.window_seconds:
+            self._store(key, (new_tat, 0, 0.0))
             return True, 0
 
+        if now - last_violation_at > self.window_seconds:
+            violations = 0
+        violations += 1
+        self._store(key, (tat, violations, now))
+
+        base_retry_after_seconds = max(1, math.ceil(new_tat - now - self.window_seconds))
+        return False, max(base_retry_after_seconds, violations)
+
     def reset(self) -> None:
         """Clear all counters (primarily for tests)."""
-        self._hits.clear()
-        self._violations.clear()
+        self._states.clear()
+
+
+# Atomic sliding window over a sorted set of hit timestamps, with the same
+# linear violation penalty as CompactRateLimiter.check.
+# Uses the Redis server clock so all workers share one time base.
+_SLIDING_WINDOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local window = tonumber(ARGV[1])
+local max_requests = tonumber(ARGV[2])
+local ttl = math.ceil(window)
+local cutoff = now - window
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', cutoff)
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', cutoff)
+
+if redis.call('ZCARD', KEYS[1]) >= max_requests then
+    redis.call('ZADD', KEYS[2], now, ARGV[3])
+    redis.call('EXPIRE', KEYS[2], ttl)
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    local base_retry_after = math.max(1, math.floor(window - (now - tonumber(oldest[2]))))
+    local penalty = redis.call('ZCARD', KEYS[2])
+    return {0, math.max(base_retry_after, penalty)}
+end
+
+redis.call('ZADD', KEYS[1], now, ARGV[3])
+redis.call('EXPIRE', KEYS[1], ttl)
+redis.call('DEL', KEYS[2])
+return {1, 0}
+"""
+
+
+class RedisSlidingWindowRateLimiter(CompactRateLimiter):
+    """Sliding-window rate limiter shared by all workers through Redis.
+
+    Each check runs one Lua script, so the limit holds across processes and no
+    in-process lock is taken. While Redis is unavailable the inherited bounded
+    in-memory limiter is used (per-process limits), and Redis is retried after
+    ``redis_retry_seconds``.
+    """
+
+    redis_retry_seconds = 5.0
+
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: int,
+        *,
+        name: str = "default",
+        max_keys: int = 100_000,
+    ) -> None:
+        super().__init__(max_requests, window_seconds, name=name, max_keys=max_keys)
+        self._namespace = "ratelimit"
+        self._script: AsyncScript | None = None
+        self._script_client: redis.Redis | None = None
+        self._redis_retry_at = 0.0
+
+    def _get_script(self, client: redis.Redis) -> AsyncScript:
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(_SLIDING_WINDOW_SCRIPT)
+            self._script_client = client
+        return self._script
+
+    async def check(self, key: str) -> tuple[bool, int]:
+        """Check whether a request for ``key`` is allowed (same contract as the base class)."""
+        if time.monotonic() < self._redis_retry_at:
+            return await super().check(key)
+
+        # Hash tag keeps both keys in one cluster slot for the script.
+        tagged_key = f"{self._namespace}:{{{key}}}"
+        try:
+            client = await get_redis()
+            allowed, retry_after_seconds = await self._get_script(client)(
+                keys=[f"{tagged_key}:hits", f"{tagged_key}:violations"],
+                args=[self.window_seconds, self.max_requests, uuid4().hex],
+            )
+        except Exception:
+            logger.warning("rate_limit_redis_unavailable_using_memory_fallback")
+            self._redis_retry_at = time.monotonic() + self.redis_retry_seconds
+            return await super().check(key)
+
+        return bool(allowed), int(retry_after_seconds)
+
+    def reset(self) -> None:
+        """Clear in-memory counters and switch to a fresh Redis key namespace (for tests)."""
+        super().reset()
+        self._namespace = f"ratelimit:{uuid4().hex[:8]}"
+        self._redis_retry_at = 0.0
+
+
+def create_rate_limiter(max_requests: int, window_seconds: int, *, name: str) -> CompactRateLimiter:
+    """Create the rate limiter selected by ``RATE_LIMIT_BACKEND`` (``memory`` or ``redis``).
+
+    Args:
+        max_requests: Allowed requests per window
+        window_seconds: Window length in seconds
+        name: Limiter name used as metric label
+    """
+    settings = get_settings()
+    limiter_class = (
+        RedisSlidingWindowRateLimiter
+        if settings.RATE_LIMIT_BACKEND == "redis"
+        else CompactRateLimiter
+    )
+    return limiter_class(
+        max_requests,
+        window_seconds,
+        name=name,
+        max_keys=settings.RATE_LIMIT_MEMORY_MAX_KEYS,
+    )
@@ -0,0 +1,34 @@
+"""Add composite indexes for keyset pagination of audit logs and chat messages
+
+Revision ID: 4f2b9c1d7e3a
+Revises: e8a1d7f4c2b9
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f2b9c1d7e3a"
+down_revision: Union[str, Sequence[str], None] = "e8a1d7f4c2b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create (sort key, id) indexes so cursor pages seek instead of scanning."""
+    op.create_index("ix_audit_logs_created_at_id", "audit_logs", ["created_at", "id"], unique=False)
+    op.create_index(
+        "ix_chat_messages_session_id_created_at_id",
+        "chat_messages",
+        ["session_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    op.drop_index("ix_chat_messages_session_id_created_at_id", table_name="chat_messages")
+    op.drop_index("ix_audit_logs_created_at_id", table_name="audit_logs")
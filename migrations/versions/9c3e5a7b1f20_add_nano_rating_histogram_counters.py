@@ -0,0 +1,61 @@
+"""Add per-score approved rating counters to nanos
+
+Revision ID: 9c3e5a7b1f20
+Revises: 4f2b9c1d7e3a
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3e5a7b1f20"
+down_revision: Union[str, Sequence[str], None] = "4f2b9c1d7e3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SCORES = range(1, 6)
+
+
+def upgrade() -> None:
+    """Add rating_count_1..5 and backfill them from approved nano_ratings."""
+    for score in _SCORES:
+        op.add_column(
+            "nanos",
+            sa.Column(
+                f"rating_count_{score}",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+                comment=f"Approved {score}-star ratings (cache)",
+            ),
+        )
+
+    assignments = ",\n            ".join(
+        f"rating_count_{score} = counts.c{score}" for score in _SCORES
+    )
+    buckets = ",\n                ".join(
+        f"count(*) FILTER (WHERE score = {score}) AS c{score}" for score in _SCORES
+    )
+    op.execute(f"""
+        UPDATE nanos SET
+            {assignments}
+        FROM (
+            SELECT
+                nano_id,
+                {buckets}
+            FROM nano_ratings
+            WHERE moderation_status = 'APPROVED'
+            GROUP BY nano_id
+        ) AS counts
+        WHERE nanos.id = counts.nano_id
+        """)
+
+
+def downgrade() -> None:
+    """Drop the rating histogram counters."""
+    for score in reversed(_SCORES):
+        op.drop_column("nanos", f"rating_count_{score}")
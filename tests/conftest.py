@@ -235,13 +235,18 @@ def app(db_session, mock_redis, mock_minio_storage):
 @pytest.fixture(autouse=True)
 def reset_rate_limiters():
     """Reset endpoint rate limiters between tests to avoid cross-test leakage."""
-    from app.modules.auth.router import LOGIN_RATE_LIMITER
+    from app.modules.auth.password import PASSWORD_VERIFICATION_ADMISSION
+    from app.modules.auth.router import LOGIN_ACCOUNT_RATE_LIMITER, LOGIN_RATE_LIMITER
     from app.modules.chat.router import CHAT_MESSAGE_RATE_LIMITER
 
     LOGIN_RATE_LIMITER.reset()
+    LOGIN_ACCOUNT_RATE_LIMITER.reset()
+    PASSWORD_VERIFICATION_ADMISSION.reset()
     CHAT_MESSAGE_RATE_LIMITER.reset()
     yield
     LOGIN_RATE_LIMITER.reset()
+    LOGIN_ACCOUNT_RATE_LIMITER.reset()
+    PASSWORD_VERIFICATION_ADMISSION.reset()
     CHAT_MESSAGE_RATE_LIMITER.reset()
 
 
@@ -299,6 +304,57 @@ async def reset_redis_client(request):
         redis_module._redis_client = None
 
 
+@pytest.fixture(autouse=True)
+async def reset_meili_transport():
+    """Reset the shared search client/transport so pooled connections never cross event loops."""
+    import app.modules.search.service as search_service_module
+    import app.modules.search.transport as transport_module
+
+    search_service_module._search_client = None
+    transport_module._transport = None
+    yield
+    try:
+        await search_service_module.close_search_client()
+    except RuntimeError:
+        search_service_module._search_client = None
+        transport_module._transport = None
+
+
+@pytest.fixture(autouse=True)
+def reset_search_local_cache():
+    """Clear the in-process search cache so cached responses never leak across tests."""
+    from app.modules.search.service import _local_search_cache
+
+    _local_search_cache.invalidate()
+    yield
+    _local_search_cache.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def reset_user_status_cache():
+    """Clear the in-process user status cache so account states never leak across tests."""
+    from app.modules.auth.user_status import _local_status_cache
+
+    _local_status_cache.clear()
+    yield
+    _local_status_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_fallback_store(monkeypatch: pytest.MonkeyPatch):
+    """Clear outage fallback entries, resync backoff and breaker state between tests."""
+    import app.redis_client as redis_module
+
+    monkeypatch.setattr(redis_module, "_fallback_resync_not_before", 0.0)
+    redis_module._fallback_store.clear()
+    redis_module._fallback_blacklist.clear()
+    redis_module.REDIS_CIRCUIT_BREAKER.reset()
+    yield
+    redis_module._fallback_store.clear()
+    redis_module._fallback_blacklist.clear()
+    redis_module.REDIS_CIRCUIT_BREAKER.reset()
+
+
 @pytest.fixture
 async def redis_client():
     """Get Redis client for explicit use in async tests
@@ -321,7 +377,8 @@ def mock_redis(monkeypatch):
         side_effect=lambda key, _ttl, value: storage.__setitem__(key, value)
     )
     mock_client.get = AsyncMock(side_effect=lambda key: storage.get(key))
-    mock_client.exists = AsyncMock(side_effect=lambda key: 1 if key in storage else 0)
+    mock_client.mget = AsyncMock(side_effect=lambda *keys: [storage.get(key) for key in keys])
+    mock_client.exists = AsyncMock(side_effect=lambda *keys: sum(key in storage for key in keys))
     mock_client.delete = AsyncMock(side_effect=lambda key: 1 if storage.pop(key, None) else 0)
     mock_client.close = AsyncMock()
     mock_client.aclose = AsyncMock()
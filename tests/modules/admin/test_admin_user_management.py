@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime, timezone
 from uuid import UUID
 
 import pytest
@@ -80,6 +81,45 @@ class TestAdminUserManagement:
         assert moderator.username in usernames
         assert creator.username not in usernames
 
+    @pytest.mark.asyncio
+    async def test_user_list_cursor_pages_through_results(
+        self,
+        async_client,
+        db_session,
+        admin_token,
+    ) -> None:
+        users = [
+            await _create_verified_user(async_client, db_session, prefix="cursorpg")
+            for _ in range(3)
+        ]
+        for user in users:
+            user.created_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        await db_session.commit()
+        headers = {"Authorization": f"Bearer {admin_token}"}
+
+        first = await async_client.get(
+            "/api/v1/admin/users?search=cursorpg&limit=2", headers=headers
+        )
+        assert first.status_code == 200
+        first_payload = first.json()
+        assert first_payload["total"] == 3
+        assert first_payload["next_cursor"] is not None
+
+        second = await async_client.get(
+            "/api/v1/admin/users",
+            params={"search": "cursorpg", "limit": 2, "cursor": first_payload["next_cursor"]},
+            headers=headers,
+        )
+        assert second.status_code == 200
+        second_payload = second.json()
+        assert second_payload["total"] is None
+        assert second_payload["next_cursor"] is None
+        usernames = [user["username"] for user in first_payload["users"] + second_payload["users"]]
+        assert sorted(usernames) == sorted(user.username for user in users)
+
+        invalid = await async_client.get("/api/v1/admin/users?cursor=bogus", headers=headers)
+        assert invalid.status_code == 400
+
     @pytest.mark.asyncio
     async def test_admin_can_change_user_role_and_audit_is_written(
         self,
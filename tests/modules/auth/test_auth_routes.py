@@ -9,6 +9,7 @@ from sqlalchemy.exc import OperationalError
 
 from app.modules.auth.service import verify_user_email
 from app.modules.mail import SMTPAuthError, SMTPDeliveryError
+from app.monitoring import LOGIN_RATE_LIMITED_TOTAL, PASSWORD_VERIFICATION_REJECTED_TOTAL
 from app.schemas import UserRegister
 
 
@@ -385,6 +386,15 @@ async def test_root_endpoint(client: TestClient, monkeypatch: pytest.MonkeyPatch
     assert response.headers["location"] == "http://localhost:5173"
 
 
+def _admission_rejections() -> float:
+    return sum(
+        sample.value
+        for metric in PASSWORD_VERIFICATION_REJECTED_TOTAL.collect()
+        for sample in metric.samples
+        if sample.name.endswith("_total")
+    )
+
+
 @pytest.mark.asyncio
 async def test_login_endpoint_rate_limited(async_client):
     """Test /auth/login returns 429 after exceeding configured request threshold."""
@@ -395,6 +405,9 @@ async def test_login_endpoint_rate_limited(async_client):
     LOGIN_RATE_LIMITER.max_requests = 2
     LOGIN_RATE_LIMITER.window_seconds = 60
     LOGIN_RATE_LIMITER.reset()
+    ip_rate_limited = LOGIN_RATE_LIMITED_TOTAL.labels(scope="ip")
+    ip_rate_limited_before = ip_rate_limited._value.get()
+    admission_rejections_before = _admission_rejections()
 
     try:
         payload = {"email": "missing@example.com", "password": "WrongPassword123!"}
@@ -407,7 +420,60 @@ async def test_login_endpoint_rate_limited(async_client):
         assert second.status_code == 401
         assert third.status_code == 429
         assert third.headers.get("retry-after") is not None
+        assert ip_rate_limited._value.get() == ip_rate_limited_before + 1
+        assert _admission_rejections() == admission_rejections_before
     finally:
         LOGIN_RATE_LIMITER.max_requests = original_max_requests
         LOGIN_RATE_LIMITER.window_seconds = original_window_seconds
         LOGIN_RATE_LIMITER.reset()
+
+
+@pytest.mark.asyncio
+async def test_login_endpoint_rate_limited_per_account(async_client):
+    """Test /auth/login throttles one account even when attempts come from new IPs."""
+    from app.modules.auth.router import LOGIN_ACCOUNT_RATE_LIMITER, LOGIN_RATE_LIMITER
+
+    original_max_requests = LOGIN_ACCOUNT_RATE_LIMITER.max_requests
+    LOGIN_ACCOUNT_RATE_LIMITER.max_requests = 2
+    LOGIN_ACCOUNT_RATE_LIMITER.reset()
+
+    try:
+        payload = {"email": "Target@example.com", "password": "WrongPassword123!"}
+
+        responses = []
+        for _ in range(3):
+            # Simulate a distributed attack: the per-IP window never fills up.
+            LOGIN_RATE_LIMITER.reset()
+            responses.append(await async_client.post("/api/v1/auth/login", json=payload))
+        other_account = await async_client.post(
+            "/api/v1/auth/login",
+            json={"email": "other@example.com", "password": "WrongPassword123!"},
+        )
+
+        assert [response.status_code for response in responses] == [401, 401, 429]
+        assert responses[2].headers.get("retry-after") is not None
+        assert other_account.status_code == 401
+    finally:
+        LOGIN_ACCOUNT_RATE_LIMITER.max_requests = original_max_requests
+        LOGIN_ACCOUNT_RATE_LIMITER.reset()
+
+
+@pytest.mark.asyncio
+async def test_login_returns_503_when_password_verification_is_saturated(
+    async_client, verified_user_id, test_user_data, monkeypatch: pytest.MonkeyPatch
+):
+    """Test /auth/login sheds load with 503 + Retry-After instead of queueing bcrypt."""
+    from app.security.admission import AdmissionRejectedError
+
+    async def saturated_verify(plain_password: str, hashed_password: str) -> bool:
+        raise AdmissionRejectedError("queue_full", retry_after_seconds=2)
+
+    monkeypatch.setattr("app.modules.auth.service.verify_password_async", saturated_verify)
+
+    response = await async_client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user_data["email"], "password": test_user_data["password"]},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "2"
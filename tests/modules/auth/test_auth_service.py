@@ -296,3 +296,57 @@ async def test_password_is_hashed(db_session: AsyncSession, test_user_data: dict
 
     assert db_user.password_hash != test_user_data["password"]
     assert verify_password(test_user_data["password"], db_user.password_hash)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_upgrades_outdated_hash_cost(
+    db_session: AsyncSession, test_user_data: dict
+):
+    """Test login rehashes a password stored with a different bcrypt cost"""
+    import asyncio
+
+    import bcrypt
+    from sqlalchemy import select
+
+    from app.models import User
+    from app.modules.auth import service as auth_service
+    from app.modules.auth.password import BCRYPT_ROUNDS, get_password_hash_info
+
+    user_data = UserRegister(**test_user_data)
+    user = await register_user(db_session, user_data)
+    await verify_user_email(db_session, user.id)
+
+    db_user = (await db_session.execute(select(User).where(User.id == user.id))).scalar_one()
+    legacy_hash = bcrypt.hashpw(
+        test_user_data["password"].encode("utf-8"), bcrypt.gensalt(rounds=10)
+    ).decode("ascii")
+    db_user.password_hash = legacy_hash
+    await db_session.commit()
+
+    await authenticate_user(db_session, test_user_data["email"], test_user_data["password"])
+    await asyncio.gather(*auth_service._background_rehashes)
+
+    upgraded_hash = (
+        await db_session.execute(
+            select(User.password_hash)
+            .where(User.id == user.id)
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one()
+    assert upgraded_hash != legacy_hash
+    assert get_password_hash_info(upgraded_hash)["rounds"] == BCRYPT_ROUNDS
+    assert verify_password(test_user_data["password"], upgraded_hash)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_keeps_current_hash(db_session: AsyncSession, test_user_data: dict):
+    """Test login does not rehash passwords already stored at the configured cost"""
+    from app.modules.auth import service as auth_service
+
+    user_data = UserRegister(**test_user_data)
+    user = await register_user(db_session, user_data)
+    await verify_user_email(db_session, user.id)
+
+    await authenticate_user(db_session, test_user_data["email"], test_user_data["password"])
+
+    assert not auth_service._background_rehashes
@@ -10,19 +10,27 @@ Tests cover:
 - Hash metadata extraction
 """
 
+import asyncio
 import time
 from typing import Final
 
+import bcrypt
 import pytest
 
 from app.modules.auth.password import (
     BCRYPT_MAX_PASSWORD_BYTES,
     BCRYPT_ROUNDS,
+    benchmark_password_hash,
     get_password_hash_info,
     hash_password,
+    hash_password_async,
+    password_needs_rehash,
+    recommend_bcrypt_rounds,
     verify_password,
+    verify_password_async,
 )
 from app.modules.auth.validators import validate_password_strength
+from app.monitoring import PASSWORD_HASH_QUEUE_DEPTH
 
 
 class TestPasswordHashing:
@@ -264,6 +272,77 @@ class TestPasswordHashInfo:
             assert info["rounds"] is None
 
 
+class TestAsyncPasswordHashing:
+    """Test bcrypt offloading to the password worker pool"""
+
+    async def test_async_hash_and_verify_roundtrip(self):
+        """Test async variants produce hashes compatible with the sync API"""
+        hashed = await hash_password_async("TestPass123!")
+
+        assert verify_password("TestPass123!", hashed) is True
+        assert await verify_password_async("TestPass123!", hashed) is True
+        assert await verify_password_async("WrongPass123!", hashed) is False
+
+    async def test_async_hash_runs_off_event_loop(self):
+        """Test bcrypt runs in a worker thread while the event loop keeps serving"""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            await hash_password_async("TestPass123!")
+        finally:
+            ticker_task.cancel()
+
+        assert ticks > 1
+
+    async def test_async_hash_rejects_empty_password(self):
+        """Test validation errors propagate from the worker pool"""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            await hash_password_async("")
+
+    async def test_async_verify_short_circuits_missing_input(self):
+        """Test empty inputs are rejected without queueing a bcrypt job"""
+        assert await verify_password_async("", "$2b$12$abc") is False
+        assert await verify_password_async("TestPass123!", "") is False
+
+    async def test_queue_depth_returns_to_baseline(self):
+        """Test queue depth gauge is balanced after concurrent jobs"""
+        baseline = PASSWORD_HASH_QUEUE_DEPTH._value.get()
+
+        await asyncio.gather(*(hash_password_async(f"TestPass{i}!") for i in range(6)))
+
+        assert PASSWORD_HASH_QUEUE_DEPTH._value.get() == baseline
+
+
+class TestPasswordCostUpgrade:
+    """Test bcrypt cost detection and tuning helpers"""
+
+    def test_password_needs_rehash_for_other_cost(self):
+        """Test hashes with a different cost factor are flagged for upgrade"""
+        legacy_hash = bcrypt.hashpw(b"TestPass123!", bcrypt.gensalt(rounds=10)).decode("ascii")
+
+        assert password_needs_rehash(legacy_hash) is (BCRYPT_ROUNDS != 10)
+        assert password_needs_rehash(hash_password("TestPass123!")) is False
+        assert password_needs_rehash("not-a-hash") is False
+
+    def test_recommend_bcrypt_rounds(self):
+        """Test recommended cost doubles/halves the measured time per round"""
+        assert recommend_bcrypt_rounds(100.0, 250.0) == BCRYPT_ROUNDS + 1
+        assert recommend_bcrypt_rounds(100.0, 100.0) == BCRYPT_ROUNDS
+        assert recommend_bcrypt_rounds(500.0, 250.0) == max(10, BCRYPT_ROUNDS - 1)
+        assert recommend_bcrypt_rounds(10_000.0, 1.0) == 10
+
+    async def test_benchmark_password_hash(self):
+        """Test benchmark reports a positive time per hash"""
+        assert await benchmark_password_hash(samples=1) > 0
+
+
 class TestPasswordValidation:
     """Test password strength validation"""
 
@@ -0,0 +1,172 @@
+"""Tests for read-replica routing with read-your-writes stickiness."""
+
+from typing import Optional
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+
+import app.database as database_module
+import app.modules.auth.read_consistency as read_consistency_module
+from app.database import get_db, get_read_db
+from app.modules.auth.read_consistency import ReadYourWritesMiddleware
+from app.modules.auth.tokens import create_access_token
+from expect import expect
+
+
+class FakeRedisClient:
+    """Minimal async Redis stand-in for write marks."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.exists_calls = 0
+
+    async def set(self, key: str, value: str, px: Optional[int] = None) -> None:
+        self.data[key] = value
+
+    async def exists(self, key: str) -> int:
+        self.exists_calls += 1
+        return 1 if key in self.data else 0
+
+
+class FakeSessionFactory:
+    """Stands in for the replica session factory and yields a marker."""
+
+    def __call__(self) -> "FakeSessionFactory":
+        return self
+
+    async def __aenter__(self) -> str:
+        return "replica"
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedisClient:
+    client = FakeRedisClient()
+
+    async def fake_get_redis() -> FakeRedisClient:
+        return client
+
+    monkeypatch.setattr(read_consistency_module, "get_redis", fake_get_redis)
+    read_consistency_module._recent_writes.clear()
+    yield client
+    read_consistency_module._recent_writes.clear()
+
+
+@pytest.fixture
+def routed_app(monkeypatch: pytest.MonkeyPatch) -> FastAPI:
+    monkeypatch.setattr(database_module, "async_read_session", FakeSessionFactory())
+
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    async def primary_db():
+        yield "primary"
+
+    app.dependency_overrides[get_db] = primary_db
+
+    @app.get("/read")
+    async def read(db=Depends(get_read_db)) -> dict[str, str]:
+        return {"session": db}
+
+    @app.get("/plain")
+    async def plain() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.post("/write")
+    async def write() -> dict[str, bool]:
+        return {"ok": True}
+
+    return app
+
+
+async def _request(app: FastAPI, method: str, path: str, token: Optional[str]) -> httpx.Response:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, path, headers=headers)
+
+
+class TestReadReplicaRouting:
+    """``get_read_db`` prefers the replica unless the user just wrote."""
+
+    async def test_reads_use_replica_by_default(self, routed_app, fake_redis):
+        """Anonymous and idle users read from the replica."""
+        token, _ = create_access_token(uuid4(), "reader@example.com")
+
+        anonymous = await _request(routed_app, "GET", "/read", None)
+        authenticated = await _request(routed_app, "GET", "/read", token)
+
+        expect(anonymous.json()).equal({"session": "replica"})
+        expect(authenticated.json()).equal({"session": "replica"})
+
+    async def test_reads_stick_to_primary_after_write(self, routed_app, fake_redis):
+        """A successful write pins only that user's reads to the primary."""
+        user_id = uuid4()
+        writer, _ = create_access_token(user_id, "writer@example.com")
+        other, _ = create_access_token(uuid4(), "other@example.com")
+
+        await _request(routed_app, "POST", "/write", writer)
+
+        expect((await _request(routed_app, "GET", "/read", writer)).json()).equal(
+            {"session": "primary"}
+        )
+        expect((await _request(routed_app, "GET", "/read", other)).json()).equal(
+            {"session": "replica"}
+        )
+        expect(fake_redis.data).equal({f"read_primary:{user_id}": "1"})
+
+    async def test_write_mark_is_shared_through_redis(self, routed_app, fake_redis):
+        """Another worker (empty local marks) still routes to the primary via Redis."""
+        writer, _ = create_access_token(uuid4(), "writer@example.com")
+        await _request(routed_app, "POST", "/write", writer)
+        read_consistency_module._recent_writes.clear()
+
+        response = await _request(routed_app, "GET", "/read", writer)
+
+        expect(response.json()).equal({"session": "primary"})
+
+    async def test_sticky_window_expires(self, routed_app, fake_redis, monkeypatch):
+        """Once the sticky window has passed locally and in Redis, reads return to the replica."""
+        writer, _ = create_access_token(uuid4(), "writer@example.com")
+        await _request(routed_app, "POST", "/write", writer)
+        now = read_consistency_module.time.monotonic()
+        sticky_seconds = read_consistency_module.get_settings().DB_READ_REPLICA_STICKY_SECONDS
+        monkeypatch.setattr(
+            read_consistency_module.time, "monotonic", lambda: now + sticky_seconds + 1
+        )
+        fake_redis.data.clear()
+
+        response = await _request(routed_app, "GET", "/read", writer)
+
+        expect(response.json()).equal({"session": "replica"})
+        expect(read_consistency_module._recent_writes).equal({})
+
+    async def test_routes_without_read_session_skip_the_check(
+        self, routed_app, fake_redis, monkeypatch
+    ):
+        """GETs that never use ``get_read_db`` neither decode the token nor query Redis."""
+        writer, _ = create_access_token(uuid4(), "writer@example.com")
+        await _request(routed_app, "POST", "/write", writer)
+
+        def fail_verify(*args, **kwargs):
+            raise AssertionError("token decoded for a route without a read session")
+
+        monkeypatch.setattr(read_consistency_module, "verify_token", fail_verify)
+        read_consistency_module._recent_writes.clear()
+
+        response = await _request(routed_app, "GET", "/plain", writer)
+
+        expect(response.json()).equal({"ok": True})
+        expect(fake_redis.exists_calls).equal(0)
+
+    async def test_primary_used_without_replica(self, routed_app, fake_redis, monkeypatch):
+        """Without a configured replica every read uses the primary session."""
+        monkeypatch.setattr(database_module, "async_read_session", None)
+
+        response = await _request(routed_app, "GET", "/read", None)
+
+        expect(response.json()).equal({"session": "primary"})
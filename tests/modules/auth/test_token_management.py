@@ -10,7 +10,6 @@ This test file covers:
 """
 
 import asyncio
-import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import uuid4
@@ -26,6 +25,12 @@ from app.modules.auth.tokens import (
     create_refresh_token,
     verify_token,
 )
+from app.monitoring import (
+    REDIS_CIRCUIT_BREAKER_REJECTED_TOTAL,
+    REDIS_CIRCUIT_BREAKER_STATE,
+    REDIS_FALLBACK_ENTRIES,
+    REDIS_FALLBACK_EVICTED_TOTAL,
+)
 from app.redis_client import (
     blacklist_token,
     delete_refresh_token,
@@ -39,6 +44,62 @@ from expect import expect
 settings = get_settings()
 
 
+class FakeResyncPipeline:
+    """Queues SET commands and applies them to the owning fake client on execute."""
+
+    def __init__(self, client: "FakeResyncRedisClient") -> None:
+        self.client = client
+        self.commands: list[tuple[str, str, bool]] = []
+
+    async def __aenter__(self) -> "FakeResyncPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def set(self, key: str, value: str, px: int, nx: bool = False) -> None:
+        self.commands.append((key, value, nx))
+
+    async def execute(self) -> list[bool]:
+        self.client.pipelines_executed += 1
+        for key, value, nx in self.commands:
+            if not (nx and key in self.client.redis_data):
+                self.client.redis_data[key] = value
+        return [True] * len(self.commands)
+
+
+class FakeResyncRedisClient:
+    """Redis stand-in that is unreachable until ``available`` is set."""
+
+    def __init__(self) -> None:
+        self.available = False
+        self.pipelines_executed = 0
+        self.redis_data: dict[str, str] = {}
+
+    def _check_available(self) -> None:
+        if not self.available:
+            raise ConnectionError("redis unavailable")
+
+    async def setex(self, key: str, expires: int, value: str) -> None:
+        self._check_available()
+        self.redis_data[key] = value
+
+    async def get(self, key: str) -> Optional[str]:
+        self._check_available()
+        return self.redis_data.get(key)
+
+    async def exists(self, *keys: str) -> int:
+        self._check_available()
+        return sum(key in self.redis_data for key in keys)
+
+    async def mget(self, *keys: str) -> list[Optional[str]]:
+        self._check_available()
+        return [self.redis_data.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> FakeResyncPipeline:
+        return FakeResyncPipeline(self)
+
+
 class TestAccessTokenGeneration:
     """Tests for access token generation with enhanced claims."""
 
@@ -360,23 +421,9 @@ class TestRedisTokenStorage:
         Redis read-miss still consults fallback storage and returns the token.
         """
 
-        class FakeRedisClient:
-            def __init__(self) -> None:
-                self.fail_setex = True
-                self.redis_data: dict[str, str] = {}
+        fake_client = FakeResyncRedisClient()
 
-            async def setex(self, key: str, expires: int, value: str) -> None:
-                if self.fail_setex:
-                    raise ConnectionError("redis unavailable")
-                self.redis_data[key] = value
-
-            async def get(self, key: str) -> Optional[str]:
-                return self.redis_data.get(key)
-
-        redis_module._fallback_store.clear()
-        fake_client = FakeRedisClient()
-
-        async def fake_get_redis() -> FakeRedisClient:
+        async def fake_get_redis() -> FakeResyncRedisClient:
             return fake_client
 
         monkeypatch.setattr(redis_module, "get_redis", fake_get_redis)
@@ -386,25 +433,184 @@ class TestRedisTokenStorage:
 
         await store_refresh_token(user_id, token, 3600)
 
-        fake_client.fail_setex = False
+        fake_client.available = True
         retrieved_token = await get_refresh_token(user_id)
 
         expect(retrieved_token).equal(token)
         expect(fake_client.redis_data.get(f"refresh_token:{user_id}")).equal(token)
 
-    def test_fallback_set_prunes_and_drops_non_positive_ttl(self) -> None:
+    def test_fallback_set_prunes_and_drops_non_positive_ttl(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test fallback set performs pruning and ignores non-positive TTL values."""
-
+        now = [1000.0]
+        monkeypatch.setattr(redis_module.time, "monotonic", lambda: now[0])
         redis_module._fallback_store.clear()
-        redis_module._fallback_store["expired-key"] = ("value", time.time() - 10)
+        redis_module._fallback_store.set("expired-key", "value", 5)
+        now[0] += 10
 
-        redis_module._fallback_set("active-key", "active", 120)
-        redis_module._fallback_set("non-positive", "value", 0)
+        redis_module._fallback_store.set("active-key", "active", 120)
+        redis_module._fallback_store.set("non-positive", "value", 0)
 
-        expect("expired-key" in redis_module._fallback_store).to_be_false()
-        expect(redis_module._fallback_store.get("active-key")).is_not_none()
+        expect(len(redis_module._fallback_store)).equal(1)
+        expect(redis_module._fallback_store.get("active-key")).equal("active")
         expect("non-positive" in redis_module._fallback_store).to_be_false()
 
+    def test_fallback_store_evicts_entry_closest_to_expiry_when_full(self) -> None:
+        """Test the fallback store stays bounded and keeps the longest-lived entries."""
+        store = redis_module.BoundedTTLStore(
+            2,
+            size_gauge=REDIS_FALLBACK_ENTRIES.labels(store="test"),
+            evicted_counter=REDIS_FALLBACK_EVICTED_TOTAL,
+        )
+        evicted = REDIS_FALLBACK_EVICTED_TOTAL.labels(reason="capacity")
+        evicted_before = evicted._value.get()
+
+        store.set("short", "1", 60)
+        store.set("long", "1", 3600)
+        store.set("short", "1", 30)
+        store.set("medium", "1", 600)
+
+        expect(len(store)).equal(2)
+        expect("short" in store).to_be_false()
+        expect(store.get("long")).equal("1")
+        expect(store.get("medium")).equal("1")
+        expect(evicted._value.get()).equal(evicted_before + 1)
+
+    @pytest.mark.asyncio
+    async def test_fallback_blacklist_survives_full_capacity(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a revocation during an outage is kept when the fallback store is full."""
+        fake_client = FakeResyncRedisClient()
+
+        async def fake_get_redis() -> FakeResyncRedisClient:
+            return fake_client
+
+        monkeypatch.setattr(redis_module, "get_redis", fake_get_redis)
+        monkeypatch.setattr(
+            redis_module,
+            "_fallback_store",
+            redis_module.BoundedTTLStore(
+                2,
+                size_gauge=REDIS_FALLBACK_ENTRIES.labels(store="test"),
+                evicted_counter=REDIS_FALLBACK_EVICTED_TOTAL,
+            ),
+        )
+        refresh_ttl = 7 * 24 * 3600
+        for user_id in (str(uuid4()) for _ in range(3)):
+            await store_refresh_token(user_id, f"token-{user_id}", refresh_ttl)
+
+        await blacklist_token("access-token", 15 * 60)
+        await store_refresh_token(str(uuid4()), "late-token", refresh_ttl)
+
+        expect(len(redis_module._fallback_store)).equal(2)
+        expect(await is_token_blacklisted("access-token")).to_be_true()
+
+    @pytest.mark.asyncio
+    async def test_fallback_entries_are_resynced_in_one_pipeline(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test all outage writes reach Redis in one pipeline once it is reachable again."""
+        fake_client = FakeResyncRedisClient()
+
+        async def fake_get_redis() -> FakeResyncRedisClient:
+            return fake_client
+
+        monkeypatch.setattr(redis_module, "get_redis", fake_get_redis)
+        user_ids = [str(uuid4()) for _ in range(3)]
+        for user_id in user_ids:
+            await store_refresh_token(user_id, f"token-{user_id}", 3600)
+        await blacklist_token("revoked", 60)
+        expect(len(redis_module._fallback_store)).equal(3)
+        expect(len(redis_module._fallback_blacklist)).equal(1)
+
+        fake_client.available = True
+        await get_refresh_token(user_ids[0])
+
+        expect(fake_client.pipelines_executed).equal(1)
+        expect(len(redis_module._fallback_store)).equal(0)
+        expect(len(redis_module._fallback_blacklist)).equal(0)
+        expect(fake_client.redis_data[f"refresh_token:{user_ids[2]}"]).equal(f"token-{user_ids[2]}")
+        expect(await is_token_blacklisted("revoked")).to_be_true()
+
+
+class TestRedisCircuitBreaker:
+    """Tests for failing fast while Redis is unreachable."""
+
+    @staticmethod
+    def _breaker(monkeypatch: pytest.MonkeyPatch) -> tuple[redis_module.RedisCircuitBreaker, list]:
+        now = [1000.0]
+        monkeypatch.setattr(redis_module.time, "monotonic", lambda: now[0])
+        breaker = redis_module.RedisCircuitBreaker(
+            3,
+            10.0,
+            state_gauge=REDIS_CIRCUIT_BREAKER_STATE,
+            rejected_counter=REDIS_CIRCUIT_BREAKER_REJECTED_TOTAL,
+        )
+        return breaker, now
+
+    def test_opens_after_consecutive_failures(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the breaker opens only after the configured number of consecutive failures."""
+        breaker, _ = self._breaker(monkeypatch)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        expect(breaker.allow_request()).to_be_true()
+
+        breaker.record_failure()
+
+        expect(breaker.state).equal(redis_module.RedisCircuitBreaker.OPEN)
+        expect(breaker.allow_request()).to_be_false()
+        expect(REDIS_CIRCUIT_BREAKER_STATE._value.get()).equal(1)
+
+    def test_half_open_probe_closes_or_reopens(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a single probe is let through after the cooldown and decides the state."""
+        breaker, now = self._breaker(monkeypatch)
+        for _ in range(3):
+            breaker.record_failure()
+
+        now[0] += 10
+        expect(breaker.allow_request()).to_be_true()
+        expect(breaker.state).equal(redis_module.RedisCircuitBreaker.HALF_OPEN)
+        expect(breaker.allow_request()).to_be_false()
+
+        breaker.record_failure()
+        expect(breaker.state).equal(redis_module.RedisCircuitBreaker.OPEN)
+
+        now[0] += 10
+        expect(breaker.allow_request()).to_be_true()
+        breaker.record_success()
+        expect(breaker.state).equal(redis_module.RedisCircuitBreaker.CLOSED)
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_routes_token_calls_to_fallback(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test token operations skip the network while open and still use the fallback."""
+        breaker = redis_module.REDIS_CIRCUIT_BREAKER
+        commands: list[tuple] = []
+
+        async def fail_execute_command(self, *args, **options):
+            commands.append(args)
+            raise ConnectionError("redis unavailable")
+
+        monkeypatch.setattr(redis_module.redis.Redis, "execute_command", fail_execute_command)
+        monkeypatch.setattr(redis_module, "_redis_client", None)
+        for _ in range(breaker.failure_threshold):
+            await blacklist_token(f"token-{uuid4()}", 60)
+        expect(breaker.state).equal(redis_module.RedisCircuitBreaker.OPEN)
+        commands.clear()
+
+        await blacklist_token("revoked-while-open", 60)
+
+        expect(await is_token_blacklisted("revoked-while-open")).to_be_true()
+        expect(commands).equal([])
+        await redis_module.close_redis()
+
 
 class TestTokenBlacklisting:
     """Tests for token blacklist/revocation mechanism."""
@@ -471,23 +677,9 @@ class TestTokenBlacklisting:
     ) -> None:
         """Test fallback blacklist remains enforced across Redis outage and recovery."""
 
-        class FakeRedisClient:
-            def __init__(self) -> None:
-                self.fail_setex = True
-                self.redis_data: dict[str, str] = {}
-
-            async def setex(self, key: str, expires: int, value: str) -> None:
-                if self.fail_setex:
-                    raise ConnectionError("redis unavailable")
-                self.redis_data[key] = value
-
-            async def exists(self, key: str) -> int:
-                return 1 if key in self.redis_data else 0
+        fake_client = FakeResyncRedisClient()
 
-        redis_module._fallback_store.clear()
-        fake_client = FakeRedisClient()
-
-        async def fake_get_redis() -> FakeRedisClient:
+        async def fake_get_redis() -> FakeResyncRedisClient:
             return fake_client
 
         monkeypatch.setattr(redis_module, "get_redis", fake_get_redis)
@@ -495,11 +687,46 @@ class TestTokenBlacklisting:
         token = "fallback_blacklist_token"
         await blacklist_token(token, 3600)
 
-        fake_client.fail_setex = False
+        fake_client.available = True
         blacklisted = await is_token_blacklisted(token)
 
         expect(blacklisted).to_be_true()
-        expect(fake_client.redis_data.get(f"blacklist:{token}")).equal("1")
+        expect(fake_client.redis_data.get(redis_module._blacklist_key(token))).equal("1")
+
+    def test_blacklist_key_is_fixed_size_hash(self) -> None:
+        """Test blacklist keys hash the token instead of embedding the full JWT."""
+        token, _ = create_access_token(uuid4(), "test@example.com")
+
+        key = redis_module._blacklist_key(token)
+
+        expect(key).equal(redis_module._blacklist_key(token))
+        expect(len(key)).equal(len("blacklist:") + 64)
+        expect(token in key).to_be_false()
+
+    @pytest.mark.asyncio
+    async def test_legacy_blacklist_key_is_still_honoured(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test revocations stored under the pre-hash key format keep a token revoked."""
+        fake_client = FakeResyncRedisClient()
+        fake_client.available = True
+
+        async def fake_get_redis() -> FakeResyncRedisClient:
+            return fake_client
+
+        monkeypatch.setattr(redis_module, "get_redis", fake_get_redis)
+
+        legacy_token, _ = create_access_token(uuid4(), "legacy@example.com")
+        fake_client.redis_data[f"blacklist:{legacy_token}"] = "1"
+
+        expect(await is_token_blacklisted(legacy_token)).to_be_true()
+        blacklisted, _ = await redis_module.is_token_blacklisted_with_value(
+            legacy_token, "user_status:unknown"
+        )
+        expect(blacklisted).to_be_true()
+
+        monkeypatch.setattr(settings, "BLACKLIST_CHECK_LEGACY_KEYS", False)
+        expect(await is_token_blacklisted(legacy_token)).to_be_false()
 
 
 class TestTokenClaims:
@@ -0,0 +1,229 @@
+"""Tests for the cached user status lookup used by ``get_current_user``."""
+
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+import app.modules.auth.user_status as user_status_module
+import app.redis_client as redis_module
+from app.models import User, UserStatus
+from app.modules.auth.gdpr import request_account_deletion
+from app.modules.auth.user_status import (
+    get_token_auth_state,
+    get_user_status,
+    invalidate_user_status,
+)
+from expect import expect
+
+
+class FakeRedisClient:
+    """Minimal async Redis stand-in recording stored status entries."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.calls = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        self.calls += 1
+        return self.data.get(key)
+
+    async def mget(self, *keys: str) -> list[Optional[str]]:
+        self.calls += 1
+        return [self.data.get(key) for key in keys]
+
+    async def exists(self, *keys: str) -> int:
+        self.calls += 1
+        return sum(key in self.data for key in keys)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, key: str) -> int:
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+class CountingSession:
+    """Wraps an AsyncSession and counts executed statements."""
+
+    def __init__(self, session) -> None:
+        self._session = session
+        self.executed = 0
+
+    async def execute(self, statement):
+        self.executed += 1
+        return await self._session.execute(statement)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedisClient:
+    client = FakeRedisClient()
+
+    async def fake_get_redis() -> FakeRedisClient:
+        return client
+
+    monkeypatch.setattr(user_status_module, "get_redis", fake_get_redis)
+    monkeypatch.setattr(redis_module, "get_redis", fake_get_redis)
+    return client
+
+
+class TestUserStatusCache:
+    """Cache tiers and invalidation of the user status lookup."""
+
+    async def test_repeated_lookups_skip_database(self, db_session, verified_user, fake_redis):
+        """Only the first lookup reads the database; later ones are cache hits."""
+        session = CountingSession(db_session)
+
+        first = await get_user_status(session, verified_user.id)
+        second = await get_user_status(session, verified_user.id)
+
+        expect(first).equal(UserStatus.ACTIVE)
+        expect(second).equal(UserStatus.ACTIVE)
+        expect(session.executed).equal(1)
+        expect(fake_redis.data[f"user_status:{verified_user.id}"]).equal("active")
+
+    async def test_redis_tier_serves_other_workers(self, db_session, verified_user, fake_redis):
+        """An empty in-process tier falls back to Redis before the database."""
+        await get_user_status(db_session, verified_user.id)
+        user_status_module._local_status_cache.clear()
+        session = CountingSession(db_session)
+
+        cached = await get_user_status(session, verified_user.id)
+
+        expect(cached).equal(UserStatus.ACTIVE)
+        expect(session.executed).equal(0)
+
+    async def test_unknown_user_is_cached_as_missing(self, db_session, fake_redis):
+        """Lookups for non-existent users return None and are cached negatively."""
+        user_id = uuid4()
+        session = CountingSession(db_session)
+
+        expect(await get_user_status(session, user_id)).equal(None)
+        expect(await get_user_status(session, user_id)).equal(None)
+        expect(session.executed).equal(1)
+
+    async def test_invalidation_forces_reread(self, db_session, verified_user, fake_redis):
+        """Status changes become visible once the entry is invalidated."""
+        await get_user_status(db_session, verified_user.id)
+
+        user = (
+            await db_session.execute(select(User).where(User.id == verified_user.id))
+        ).scalar_one()
+        user.status = UserStatus.DELETED
+        await db_session.commit()
+        expect(await get_user_status(db_session, verified_user.id)).equal(UserStatus.ACTIVE)
+
+        await invalidate_user_status(verified_user.id)
+
+        expect(await get_user_status(db_session, verified_user.id)).equal(UserStatus.DELETED)
+        expect(fake_redis.data[f"user_status:{verified_user.id}"]).equal("deleted")
+
+    async def test_account_deletion_request_invalidates_status(
+        self, db_session, verified_user, fake_redis
+    ):
+        """GDPR deletion requests drop the cached status after committing."""
+        await get_user_status(db_session, verified_user.id)
+
+        await request_account_deletion(db_session, verified_user.id)
+
+        expect(f"user_status:{verified_user.id}" in fake_redis.data).equal(False)
+        expect(await get_user_status(db_session, verified_user.id)).equal(UserStatus.INACTIVE)
+
+    async def test_redis_outage_falls_back_to_database(
+        self, db_session, verified_user, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Redis errors never fail authentication; the database remains authoritative."""
+
+        async def broken_get_redis():
+            raise ConnectionError("redis unavailable")
+
+        monkeypatch.setattr(user_status_module, "get_redis", broken_get_redis)
+
+        expect(await get_user_status(db_session, verified_user.id)).equal(UserStatus.ACTIVE)
+        await invalidate_user_status(verified_user.id)
+
+
+class TestTokenAuthState:
+    """Blacklist flag and user status fetched in one Redis round-trip."""
+
+    async def test_cached_status_and_blacklist_in_one_round_trip(
+        self, db_session, verified_user, fake_redis
+    ):
+        """A Redis-cached status is read with the blacklist flag via a single MGET."""
+        await get_user_status(db_session, verified_user.id)
+        user_status_module._local_status_cache.clear()
+        fake_redis.calls = 0
+        session = CountingSession(db_session)
+
+        state = await get_token_auth_state(session, "token", verified_user.id)
+
+        expect(state).equal((False, UserStatus.ACTIVE))
+        expect(fake_redis.calls).equal(1)
+        expect(session.executed).equal(0)
+
+    async def test_blacklisted_token_skips_database(self, db_session, verified_user, fake_redis):
+        """Revoked tokens are rejected without loading the user's status."""
+        fake_redis.data[redis_module._blacklist_key("token")] = "1"
+        session = CountingSession(db_session)
+
+        blacklisted, _ = await get_token_auth_state(session, "token", verified_user.id)
+
+        expect(blacklisted).to_be_true()
+        expect(session.executed).equal(0)
+
+    async def test_status_miss_reads_database_once(self, db_session, verified_user, fake_redis):
+        """A status miss falls back to the database and populates the cache."""
+        session = CountingSession(db_session)
+
+        first = await get_token_auth_state(session, "token", verified_user.id)
+        second = await get_token_auth_state(session, "token", verified_user.id)
+
+        expect(first).equal((False, UserStatus.ACTIVE))
+        expect(second).equal((False, UserStatus.ACTIVE))
+        expect(session.executed).equal(1)
+
+    async def test_fallback_blacklist_used_when_redis_unavailable(
+        self, db_session, verified_user, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Blacklist entries held in the fallback store still apply during an outage."""
+
+        class BrokenRedisClient:
+            async def mget(self, *keys: str) -> list[Optional[str]]:
+                raise ConnectionError("redis unavailable")
+
+        async def broken_get_redis() -> BrokenRedisClient:
+            return BrokenRedisClient()
+
+        monkeypatch.setattr(redis_module, "get_redis", broken_get_redis)
+        redis_module._fallback_blacklist.set(redis_module._blacklist_key("token"), "1", 60)
+
+        revoked = await get_token_auth_state(db_session, "token", verified_user.id)
+        active = await get_token_auth_state(db_session, "other", verified_user.id)
+
+        expect(revoked[0]).to_be_true()
+        expect(active).equal((False, UserStatus.ACTIVE))
+
+
+class TestCurrentUserStatusCheck:
+    """``get_current_user`` rejects deleted accounts using the cached status."""
+
+    async def test_deleted_user_rejected_after_admin_delete(
+        self, async_client, access_token, verified_user_id, admin_token
+    ):
+        """Admin deletion invalidates the cached status, so the next request fails."""
+        headers = {"Authorization": f"Bearer {access_token}"}
+        me_response = await async_client.get("/api/v1/auth/me", headers=headers)
+        expect(me_response.status_code).equal(200)
+
+        delete_response = await async_client.delete(
+            f"/api/v1/admin/users/{verified_user_id}",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+        expect(delete_response.status_code).equal(200)
+
+        rejected = await async_client.get("/api/v1/auth/me", headers=headers)
+        expect(rejected.status_code).equal(401)
+        expect(rejected.json()["detail"]).equal("User account is no longer active")
@@ -600,6 +600,59 @@ class TestChatMessageRoutes:
         assert p2["meta"]["has_next_page"] is True
         assert p2["meta"]["has_prev_page"] is True
 
+    @pytest.mark.asyncio
+    async def test_list_messages_cursor_scrolls_without_counting(self, async_client, db_session):
+        """
+        Following next_cursor returns the remaining messages in order, skips the
+        total count and ends with next_cursor=null; a malformed cursor is a 400.
+
+        Two messages share a timestamp so the id tiebreaker is exercised.
+        """
+        creator = await self._create_user(
+            db_session, "msg-cur-creator@example.com", "msg_cur_creator"
+        )
+        participant = await self._create_user(
+            db_session, "msg-cur-participant@example.com", "msg_cur_participant"
+        )
+        nano = await self._create_published_nano(db_session, creator.id)
+        session = await self._create_session(db_session, nano.id, creator.id, participant.id)
+
+        t_base = datetime(2026, 2, 1, 8, 0, 0, tzinfo=timezone.utc)
+        for i, content in enumerate(["Message A", "Message B", "Message C"]):
+            msg = ChatMessage(session_id=session.id, sender_id=participant.id, content=content)
+            db_session.add(msg)
+            await db_session.flush()
+            msg.created_at = t_base.replace(second=min(i, 1))
+        await db_session.commit()
+
+        participant_token, _ = create_access_token(
+            participant.id, participant.email, role="consumer"
+        )
+        headers = {"Authorization": f"Bearer {participant_token}"}
+        url = f"/api/v1/chats/{session.id}/messages"
+
+        first = (await async_client.get(url, params={"limit": 1}, headers=headers)).json()
+        assert first["meta"]["total_results"] == 3
+        assert first["meta"]["next_cursor"] is not None
+
+        second_resp = await async_client.get(
+            url, params={"limit": 5, "cursor": first["meta"]["next_cursor"]}, headers=headers
+        )
+        assert second_resp.status_code == 200
+        second = second_resp.json()
+        contents = [first["data"][0]["content"]] + [m["content"] for m in second["data"]]
+        assert contents[0] == "Message A"
+        assert sorted(contents[1:]) == ["Message B", "Message C"]
+        assert second["meta"]["current_page"] is None
+        assert second["meta"]["total_results"] is None
+        assert second["meta"]["total_pages"] is None
+        assert second["meta"]["has_prev_page"] is True
+        assert second["meta"]["has_next_page"] is False
+        assert second["meta"]["next_cursor"] is None
+
+        invalid = await async_client.get(url, params={"cursor": "garbage"}, headers=headers)
+        assert invalid.status_code == 400
+
     @pytest.mark.asyncio
     async def test_send_message_rate_limited_returns_429(self, async_client, db_session):
         """Message POST is blocked with 429 after per-user threshold is exceeded."""
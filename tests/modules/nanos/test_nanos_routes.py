@@ -1484,6 +1484,9 @@ class TestNanoRatingsRoutes:
             status=NanoStatus.PUBLISHED,
             version="1.0.0",
             license=LicenseType.CC_BY,
+            # Cached histogram matching the two approved ratings seeded below
+            rating_count_2=1,
+            rating_count_4=1,
         )
         db_session.add(nano)
         await db_session.flush()
@@ -1587,6 +1590,8 @@ class TestNanoRatingsRoutes:
             status=NanoStatus.PUBLISHED,
             version="1.0.0",
             license=LicenseType.CC_BY,
+            # Cached histogram matching the one approved rating seeded below
+            rating_count_1=1,
         )
         db_session.add(nano)
         await db_session.flush()
@@ -0,0 +1,280 @@
+"""Tests for the shared histogram-based rating aggregation and its cached counters."""
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import (
+    CompetencyLevel,
+    FeedbackModerationStatus,
+    LicenseType,
+    Nano,
+    NanoFormat,
+    NanoRating,
+    NanoStatus,
+    User,
+    UserRole,
+    UserStatus,
+)
+from app.modules.auth.tokens import TokenData
+from app.modules.nanos.ratings import (
+    aggregation_from_histogram,
+    apply_rating_change,
+    recompute_nano_rating_cache,
+    remove_user_ratings,
+    repair_nano_rating_caches,
+)
+from app.modules.nanos.schemas import FeedbackModerationRequest
+from app.modules.nanos.service import moderate_nano_rating
+from expect import expect
+
+APPROVED = FeedbackModerationStatus.APPROVED
+PENDING = FeedbackModerationStatus.PENDING
+HIDDEN = FeedbackModerationStatus.HIDDEN
+
+
+async def _create_user(db_session, name: str, role: UserRole = UserRole.CONSUMER) -> User:
+    user = User(
+        id=uuid.uuid4(),
+        email=f"{name}@example.com",
+        username=name,
+        password_hash="dummy_hash",
+        email_verified=True,
+        status=UserStatus.ACTIVE,
+        role=role,
+        preferred_language="de",
+        login_attempts=0,
+    )
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+async def _create_nano(db_session, name: str, **rating_cache) -> Nano:
+    creator = await _create_user(db_session, f"{name}_creator", role=UserRole.CREATOR)
+    nano = Nano(
+        id=uuid.uuid4(),
+        creator_id=creator.id,
+        title="Aggregation Nano",
+        description="Nano for rating aggregation tests",
+        duration_minutes=5,
+        competency_level=CompetencyLevel.BASIC,
+        language="de",
+        format=NanoFormat.TEXT,
+        status=NanoStatus.PUBLISHED,
+        version="1.0.0",
+        license=LicenseType.CC_BY,
+        **rating_cache,
+    )
+    db_session.add(nano)
+    await db_session.flush()
+    return nano
+
+
+async def _add_ratings(
+    db_session, nano: Nano, ratings: list[tuple[int, FeedbackModerationStatus]]
+) -> None:
+    for index, (score, moderation_status) in enumerate(ratings):
+        rater = await _create_user(db_session, f"{nano.id.hex[:8]}_rater_{index}")
+        db_session.add(
+            NanoRating(
+                nano_id=nano.id,
+                user_id=rater.id,
+                score=score,
+                moderation_status=moderation_status,
+            )
+        )
+    await db_session.flush()
+
+
+def _histogram(nano: Nano) -> list[int]:
+    return [getattr(nano, f"rating_count_{score}") for score in range(1, 6)]
+
+
+@pytest.mark.parametrize(
+    ("histogram", "average", "median"),
+    [
+        ({}, "0.00", "0.00"),
+        ({4: 1}, "4.00", "4.00"),
+        ({1: 1, 2: 1, 5: 1}, "2.67", "2.00"),
+        ({1: 1, 4: 1}, "2.50", "2.50"),
+        ({2: 2, 3: 1, 5: 3}, "3.67", "4.00"),
+    ],
+)
+def test_aggregation_from_histogram(histogram: dict[int, int], average: str, median: str) -> None:
+    """Average and median match the expanded score list for odd, even and empty counts."""
+    aggregation = aggregation_from_histogram(histogram)
+
+    expect(aggregation.average_rating).equal(Decimal(average))
+    expect(aggregation.median_rating).equal(Decimal(median))
+    expect(aggregation.rating_count).equal(sum(histogram.values()))
+    expect([item.count for item in aggregation.distribution]).equal(
+        [histogram.get(score, 0) for score in range(1, 6)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_recompute_cache_uses_one_query_and_ignores_unapproved(
+    db_session, test_db_engine
+) -> None:
+    """Only approved ratings count, and rebuilding the cache issues a single statement."""
+    nano = await _create_nano(db_session, "agg_query")
+    await _add_ratings(
+        db_session,
+        nano,
+        [(5, APPROVED), (3, APPROVED), (4, APPROVED), (1, PENDING), (1, HIDDEN)],
+    )
+
+    statements: list[str] = []
+
+    def count_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(test_db_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        aggregation = await recompute_nano_rating_cache(nano, db_session)
+    finally:
+        event.remove(test_db_engine.sync_engine, "before_cursor_execute", count_statement)
+
+    expect(len(statements)).equal(1)
+    expect(_histogram(nano)).equal([0, 0, 1, 1, 1])
+    expect(aggregation.rating_count).equal(3)
+    expect(aggregation.average_rating).equal(Decimal("4.00"))
+    expect(aggregation.median_rating).equal(Decimal("4.00"))
+
+
+@pytest.mark.asyncio
+async def test_apply_rating_change_moves_votes_between_buckets(db_session) -> None:
+    """Only transitions into or out of APPROVED touch the counters."""
+    nano = await _create_nano(db_session, "agg_delta")
+
+    await apply_rating_change(nano, db_session, before=None, after=(4, PENDING))
+    expect(_histogram(nano)).equal([0, 0, 0, 0, 0])
+
+    await apply_rating_change(nano, db_session, before=(4, PENDING), after=(4, APPROVED))
+    await apply_rating_change(nano, db_session, before=(2, PENDING), after=(2, APPROVED))
+    expect(_histogram(nano)).equal([0, 1, 0, 1, 0])
+    expect(nano.average_rating).equal(Decimal("3.00"))
+    expect(nano.rating_count).equal(2)
+
+    aggregation = await apply_rating_change(
+        nano, db_session, before=(2, APPROVED), after=(5, PENDING)
+    )
+    expect(_histogram(nano)).equal([0, 0, 0, 1, 0])
+    expect(aggregation.average_rating).equal(Decimal("4.00"))
+
+    await apply_rating_change(nano, db_session, before=(4, APPROVED), after=(4, HIDDEN))
+    await db_session.commit()
+    await db_session.refresh(nano)
+
+    expect(_histogram(nano)).equal([0, 0, 0, 0, 0])
+    expect(nano.average_rating).equal(Decimal("0.00"))
+    expect(nano.rating_count).equal(0)
+
+
+@pytest.mark.asyncio
+async def test_repair_recomputes_drifted_caches(db_session) -> None:
+    """The repair job rebuilds counters from nano_ratings and reports only drifted Nanos."""
+    drifted = await _create_nano(
+        db_session,
+        "agg_drift",
+        rating_count_1=3,
+        average_rating=Decimal("1.00"),
+        rating_count=3,
+    )
+    await _add_ratings(db_session, drifted, [(5, APPROVED), (4, APPROVED), (1, PENDING)])
+    consistent = await _create_nano(
+        db_session,
+        "agg_ok",
+        rating_count_2=1,
+        average_rating=Decimal("2.00"),
+        rating_count=1,
+    )
+    await _add_ratings(db_session, consistent, [(2, APPROVED)])
+    await db_session.commit()
+
+    repaired = await repair_nano_rating_caches(db_session, batch_size=1)
+
+    expect(repaired).equal([drifted.id])
+    await db_session.refresh(drifted)
+    expect(_histogram(drifted)).equal([0, 0, 0, 1, 1])
+    expect(drifted.average_rating).equal(Decimal("4.50"))
+    expect(drifted.rating_count).equal(2)
+    expect(await repair_nano_rating_caches(db_session)).equal([])
+
+
+@pytest.mark.asyncio
+async def test_remove_user_ratings_decrements_only_approved_votes(db_session) -> None:
+    """A deleted user's approved votes leave the cached histograms; pending ones never counted."""
+    rater = await _create_user(db_session, "agg_leaving_rater")
+    approved_nano = await _create_nano(db_session, "agg_leave_approved")
+    pending_nano = await _create_nano(db_session, "agg_leave_pending")
+    await _add_ratings(db_session, approved_nano, [(2, APPROVED)])
+    for nano, score, moderation_status in (
+        (approved_nano, 4, APPROVED),
+        (pending_nano, 5, PENDING),
+    ):
+        db_session.add(
+            NanoRating(
+                nano_id=nano.id,
+                user_id=rater.id,
+                score=score,
+                moderation_status=moderation_status,
+            )
+        )
+        await apply_rating_change(nano, db_session, before=None, after=(score, moderation_status))
+    await apply_rating_change(approved_nano, db_session, before=None, after=(2, APPROVED))
+    await db_session.commit()
+    expect(_histogram(approved_nano)).equal([0, 1, 0, 1, 0])
+
+    changed = await remove_user_ratings(db_session, rater.id)
+    await db_session.delete(rater)
+    await db_session.commit()
+
+    expect(changed).equal([approved_nano.id])
+    await db_session.refresh(approved_nano)
+    expect(_histogram(approved_nano)).equal([0, 1, 0, 0, 0])
+    expect(approved_nano.average_rating).equal(Decimal("2.00"))
+    expect(approved_nano.rating_count).equal(1)
+
+
+@pytest.mark.asyncio
+async def test_repeated_approval_counts_the_vote_once(db_session, test_db_engine) -> None:
+    """A second approval re-reads the rating, so a stale PENDING copy is not counted again."""
+    nano = await _create_nano(db_session, "agg_double_approve")
+    moderator = await _create_user(db_session, "agg_double_moderator", role=UserRole.MODERATOR)
+    await _add_ratings(db_session, nano, [(4, PENDING)])
+    await db_session.commit()
+    now = datetime.now(timezone.utc)
+    moderator_token = TokenData(
+        user_id=moderator.id,
+        email=moderator.email,
+        role=UserRole.MODERATOR.value,
+        exp=now,
+        iat=now,
+    )
+    approve = FeedbackModerationRequest(status=APPROVED.value)
+
+    # The racing request loads the rating while it is still PENDING
+    stale_rating = (
+        await db_session.execute(select(NanoRating).where(NanoRating.nano_id == nano.id))
+    ).scalar_one()
+    expect(stale_rating.moderation_status).equal(PENDING)
+
+    session_factory = async_sessionmaker(
+        test_db_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_factory() as other_session:
+        await moderate_nano_rating(
+            nano.id, stale_rating.id, approve, moderator_token, other_session
+        )
+
+    await moderate_nano_rating(nano.id, stale_rating.id, approve, moderator_token, db_session)
+
+    await db_session.refresh(nano)
+    expect(_histogram(nano)).equal([0, 0, 0, 1, 0])
+    expect(nano.rating_count).equal(1)
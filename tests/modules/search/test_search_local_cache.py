@@ -0,0 +1,67 @@
+"""Tests for the in-process search response cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.modules.search.local_cache import SearchLocalCache
+
+
+class TestSearchLocalCache:
+    """Tests for LRU eviction, TTL expiry, and scoped invalidation."""
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used_entry(self):
+        """Reads refresh recency; the oldest unread entry is evicted at capacity."""
+        cache: SearchLocalCache[str] = SearchLocalCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", "all", "A", epoch=cache.epoch)
+        cache.set("b", "all", "B", epoch=cache.epoch)
+        assert cache.get("a") == "A"
+
+        cache.set("c", "all", "C", epoch=cache.epoch)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+
+    @pytest.mark.unit
+    def test_expired_entries_are_not_served(self):
+        """Entries older than the TTL are dropped on read."""
+        cache: SearchLocalCache[str] = SearchLocalCache(max_entries=10, ttl_seconds=5)
+        with patch("app.modules.search.local_cache.monotonic", return_value=100.0):
+            cache.set("a", "all", "A", epoch=cache.epoch)
+        with patch("app.modules.search.local_cache.monotonic", return_value=106.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_scoped_invalidation_keeps_unrelated_entries(self):
+        """Only entries of the invalidated scopes are dropped."""
+        cache: SearchLocalCache[str] = SearchLocalCache(max_entries=10, ttl_seconds=60)
+        cache.set("browse", "all", "A", epoch=cache.epoch)
+        cache.set("office", "category:Office", "B", epoch=cache.epoch)
+        cache.set("python", "category:Programming", "C", epoch=cache.epoch)
+
+        cache.invalidate(["all", "category:Office"])
+
+        assert cache.get("browse") is None
+        assert cache.get("office") is None
+        assert cache.get("python") == "C"
+
+    @pytest.mark.unit
+    def test_write_after_invalidation_is_discarded(self):
+        """A response fetched before an invalidation is not stored afterwards."""
+        cache: SearchLocalCache[str] = SearchLocalCache(max_entries=10, ttl_seconds=60)
+        epoch = cache.epoch
+        cache.invalidate(["all"])
+
+        cache.set("browse", "all", "stale", epoch=epoch)
+
+        assert cache.get("browse") is None
+
+    @pytest.mark.unit
+    def test_zero_capacity_disables_cache(self):
+        """``max_entries=0`` turns the cache into a no-op."""
+        cache: SearchLocalCache[str] = SearchLocalCache(max_entries=0, ttl_seconds=60)
+        cache.set("a", "all", "A", epoch=cache.epoch)
+        assert cache.get("a") is None
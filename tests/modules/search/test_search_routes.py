@@ -5,11 +5,18 @@ Unit and contract tests for the search endpoint, including request validation,
 response format, and HTTP status codes.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
 
+from app.modules.search.schemas import SearchResponse
+
+
+def _encoded_response(**fields) -> bytes:
+    """Serialize a SearchResponse the way the service hands it to the router."""
+    return SearchResponse(**fields).model_dump_json().encode()
+
 
 class TestSearchRoutes:
     """
@@ -29,8 +36,8 @@ class TestSearchRoutes:
 
         from app.modules.search.schemas import SearchResponse
 
-        with patch("app.modules.search.router.search_nanos") as mock_search:
-            mock_search.return_value = SearchResponse(
+        with patch("app.modules.search.router.search_nanos_json") as mock_search:
+            mock_search.return_value = _encoded_response(
                 success=True,
                 data=[],
                 meta={
@@ -68,8 +75,8 @@ class TestSearchRoutes:
 
         from app.modules.search.schemas import SearchResponse
 
-        with patch("app.modules.search.router.search_nanos") as mock_search:
-            mock_search.return_value = SearchResponse(
+        with patch("app.modules.search.router.search_nanos_json") as mock_search:
+            mock_search.return_value = _encoded_response(
                 success=True,
                 data=[],
                 meta={
@@ -103,7 +110,7 @@ class TestSearchRoutes:
 
         Expected: 400 Bad Request for invalid page values.
         """
-        with patch("app.modules.search.router.search_nanos") as mock_search:
+        with patch("app.modules.search.router.search_nanos_json") as mock_search:
             mock_search.side_effect = Exception("Should not be called")
 
             response = client.get("/api/v1/search?q=test&page=0")
@@ -141,7 +148,7 @@ class TestSearchRoutes:
         assert response.status_code == 422
 
     @pytest.mark.unit
-    @patch("app.modules.search.router.search_nanos")
+    @patch("app.modules.search.router.search_nanos_json")
     def test_get_search_endpoint_success(self, mock_search, client):
         """
         Test successful search request.
@@ -191,7 +198,7 @@ class TestSearchRoutes:
             timestamp=datetime.now(timezone.utc),
         )
 
-        mock_search.return_value = mock_response
+        mock_search.return_value = mock_response.model_dump_json().encode()
 
         response = client.get("/api/v1/search?q=excel")
 
@@ -207,7 +214,7 @@ class TestSearchRoutes:
         assert data["meta"]["pagination"]["total_results"] == 1
 
     @pytest.mark.unit
-    @patch("app.modules.search.router.search_nanos")
+    @patch("app.modules.search.router.search_nanos_json")
     def test_get_search_endpoint_with_filters(self, mock_search, client):
         """
         Test search request with category, level, and duration filters.
@@ -218,7 +225,7 @@ class TestSearchRoutes:
 
         from app.modules.search.schemas import SearchResponse
 
-        mock_search.return_value = SearchResponse(
+        mock_search.return_value = _encoded_response(
             success=True,
             data=[],
             meta={
@@ -259,7 +266,7 @@ class TestSearchRoutes:
         assert call_kwargs["limit"] == 20
 
     @pytest.mark.unit
-    @patch("app.modules.search.router.search_nanos")
+    @patch("app.modules.search.router.search_nanos_json")
     def test_get_search_endpoint_pagination(self, mock_search, client):
         """
         Test search endpoint with pagination parameters.
@@ -270,7 +277,7 @@ class TestSearchRoutes:
 
         from app.modules.search.schemas import SearchResponse
 
-        mock_search.return_value = SearchResponse(
+        mock_search.return_value = _encoded_response(
             success=True,
             data=[],
             meta={
@@ -303,7 +310,7 @@ class TestSearchRoutes:
         assert data["meta"]["pagination"]["has_prev_page"] is True
 
     @pytest.mark.unit
-    @patch("app.modules.search.router.search_nanos")
+    @patch("app.modules.search.router.search_nanos_json")
     def test_get_search_endpoint_service_unavailable(self, mock_search, client):
         """
         Test search endpoint when search service is unavailable.
@@ -323,7 +330,7 @@ class TestSearchRoutes:
         assert "detail" in error_data
 
     @pytest.mark.unit
-    @patch("app.modules.search.router.search_nanos")
+    @patch("app.modules.search.router.search_nanos_json")
     def test_get_search_endpoint_malformed_filter(self, mock_search, client):
         """
         Test search endpoint with invalid filter values.
@@ -342,7 +349,7 @@ class TestSearchRoutes:
         assert response.status_code in [400, 422]
 
     @pytest.mark.unit
-    @patch("app.modules.search.router.search_nanos")
+    @patch("app.modules.search.router.search_nanos_json")
     def test_get_search_endpoint_case_insensitive_query(self, mock_search, client):
         """
         Test that search query is case-insensitive.
@@ -353,7 +360,7 @@ class TestSearchRoutes:
 
         from app.modules.search.schemas import SearchResponse
 
-        mock_search.return_value = SearchResponse(
+        mock_search.return_value = _encoded_response(
             success=True,
             data=[],
             meta={
@@ -384,7 +391,7 @@ class TestSearchRoutes:
         assert call_kwargs["query"] == "EXCEL"
 
     @pytest.mark.unit
-    @patch("app.modules.search.router.search_nanos")
+    @patch("app.modules.search.router.search_nanos_json")
     def test_get_search_endpoint_partial_match(self, mock_search, client):
         """
         Test partial match search (e.g., 'Exce' matches 'Excel').
@@ -410,7 +417,7 @@ class TestSearchRoutes:
             thumbnail_url=None,
         )
 
-        mock_search.return_value = SearchResponse(
+        mock_search.return_value = _encoded_response(
             success=True,
             data=[mock_nano],
             meta={
@@ -445,7 +452,7 @@ class TestSearchEndpointContract:
     """
     Contract tests for the search endpoint with Meilisearch patched.
 
-    These tests patch ``MeilisearchClient`` and the ``get_db`` dependency so
+    These tests patch ``get_search_client`` and the ``get_db`` dependency so
     there is no dependency on real Docker services.  They verify the
     integration contract between the router/service layer and the rest of the
     application (response structure, status codes, header passing) without
@@ -458,15 +465,15 @@ class TestSearchEndpointContract:
     """
 
     @pytest.mark.unit
-    @patch("app.modules.search.service.MeilisearchClient")
-    def test_search_contract_with_published_nanos(self, mock_client_class, client):
+    @patch("app.modules.search.service.get_search_client")
+    def test_search_contract_with_published_nanos(self, mock_get_search_client, client):
         """
         Test that only published Nanos are returned in search results.
 
         Expected: Draft, archived, and deleted Nanos are excluded from results.
         """
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = AsyncMock()
+        mock_get_search_client.return_value = mock_client_instance
         mock_client_instance.search.return_value = {
             "hits": [
                 {
@@ -4,13 +4,57 @@ Unit and integration tests for the search service, including parameter
 validation, Meilisearch integration, Redis cache behavior, and degraded mode.
 """
 
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
+import httpx
 import pytest
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.search.service import build_search_cache_key, invalidate_search_cache, search_nanos
+from app.models import CompetencyLevel, LicenseType, Nano, NanoFormat, NanoStatus
+from app.modules.search.schemas import SearchResponse
+from app.modules.search.service import (
+    MeilisearchClient,
+    SearchFacets,
+    _apply_invalidation_message,
+    _background_refreshes,
+    _iter_search_document_batches,
+    _search_cache_scope,
+    _should_refresh_early,
+    _stream_search_documents,
+    build_search_cache_key,
+    get_search_client,
+    invalidate_search_cache,
+    invalidate_search_cache_for_nano,
+    is_search_visible_change,
+    rebuild_search_index,
+    reconcile_search_index,
+    run_search_reconciler,
+    search_nanos,
+    search_nanos_json,
+    settings,
+    sync_nano_search_document,
+)
+
+
+def _mock_cache_redis(payload: Optional[str] = None, ttl_ms: int = -2) -> AsyncMock:
+    """Build an async Redis mock whose pipelined GET/PTTL returns the given entry."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[payload, ttl_ms])
+    pipe_context = MagicMock()
+    pipe_context.__aenter__ = AsyncMock(return_value=pipe)
+    pipe_context.__aexit__ = AsyncMock(return_value=False)
+
+    redis_client = AsyncMock()
+    redis_client.pipeline = MagicMock(return_value=pipe_context)
+    redis_client.mget = AsyncMock(return_value=[None, None])
+    redis_client.set = AsyncMock(return_value=True)
+    redis_client.setex = AsyncMock(return_value=True)
+    return redis_client
 
 
 class TestSearchNanosService:
@@ -23,15 +67,13 @@ class TestSearchNanosService:
 
         with (
             patch("app.modules.search.service.get_redis") as mock_get_redis,
-            patch("app.modules.search.service.MeilisearchClient") as mock_client_class,
+            patch("app.modules.search.service.get_search_client") as mock_get_search_client,
         ):
-            mock_redis = AsyncMock()
-            mock_redis.get = AsyncMock(return_value=None)
-            mock_redis.setex = AsyncMock(return_value=True)
+            mock_redis = _mock_cache_redis()
             mock_get_redis.return_value = mock_redis
 
-            mock_client_instance = MagicMock()
-            mock_client_class.return_value = mock_client_instance
+            mock_client_instance = AsyncMock()
+            mock_get_search_client.return_value = mock_client_instance
             mock_client_instance.search.return_value = {"hits": [], "estimatedTotalHits": 0}
 
             result = await search_nanos(db=mock_db, query="", page=1, limit=20)
@@ -119,6 +161,7 @@ class TestSearchNanosService:
         )
 
         assert key_a == key_b
+        assert key_a.startswith("search:v2:g0:s0:")
         assert "q=python" in key_a
         assert "category=Programming" in key_a
         assert "level=2" in key_a
@@ -127,20 +170,35 @@ class TestSearchNanosService:
         assert "page=1" in key_a
         assert "limit=20" in key_a
 
+    @pytest.mark.unit
+    def test_build_search_cache_key_changes_with_generation(self):
+        """Bumping the generation addresses a fresh key namespace."""
+        params = dict(
+            query="python",
+            category=None,
+            level=None,
+            duration=None,
+            language=None,
+            page=1,
+            limit=20,
+        )
+
+        assert build_search_cache_key(**params, generation=1) != build_search_cache_key(
+            **params, generation=2
+        )
+
     @pytest.mark.asyncio
     @patch("app.modules.search.service.get_redis")
-    @patch("app.modules.search.service.MeilisearchClient")
-    async def test_search_cache_miss_then_store(self, mock_client_class, mock_get_redis):
+    @patch("app.modules.search.service.get_search_client")
+    async def test_search_cache_miss_then_store(self, mock_get_search_client, mock_get_redis):
         """On cache miss, service queries Meilisearch and stores response in Redis."""
         mock_db = AsyncMock(spec=AsyncSession)
 
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=None)
-        mock_redis.setex = AsyncMock(return_value=True)
+        mock_redis = _mock_cache_redis()
         mock_get_redis.return_value = mock_redis
 
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = AsyncMock()
+        mock_get_search_client.return_value = mock_client_instance
         mock_client_instance.search.return_value = {
             "hits": [
                 {
@@ -171,8 +229,8 @@ class TestSearchNanosService:
 
     @pytest.mark.asyncio
     @patch("app.modules.search.service.get_redis")
-    @patch("app.modules.search.service.MeilisearchClient")
-    async def test_search_cache_hit_skips_meilisearch(self, mock_client_class, mock_get_redis):
+    @patch("app.modules.search.service.get_search_client")
+    async def test_search_cache_hit_skips_meilisearch(self, mock_get_search_client, mock_get_redis):
         """On cache hit, service returns cached payload and skips Meilisearch call."""
         mock_db = AsyncMock(spec=AsyncSession)
 
@@ -180,34 +238,32 @@ class TestSearchNanosService:
             '{"success":true,"data":[],"meta":{"pagination":{"current_page":1,'
             '"page_size":20,"total_results":0,"total_pages":0,"has_next_page":false,'
             '"has_prev_page":false},"query":{"search_query":"python","category":null,'
-            '"level":null,"duration":null,"language":null}},"timestamp":"2026-03-16T12:34:56Z"}'
+            '"level":null,"duration":null,"language":null}}}'
         )
 
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=cached_payload)
-        mock_redis.setex = AsyncMock(return_value=True)
+        mock_redis = _mock_cache_redis(cached_payload, ttl_ms=1_800_000)
         mock_get_redis.return_value = mock_redis
 
         result = await search_nanos(db=mock_db, query="python", page=1, limit=20)
 
         assert result.success is True
         assert len(result.data) == 0
-        mock_client_class.assert_not_called()
+        mock_get_search_client.assert_not_called()
         mock_redis.setex.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("app.modules.search.service.get_redis")
-    @patch("app.modules.search.service.MeilisearchClient")
+    @patch("app.modules.search.service.get_search_client")
     async def test_search_degraded_mode_when_redis_unavailable(
-        self, mock_client_class, mock_get_redis
+        self, mock_get_search_client, mock_get_redis
     ):
         """Redis outages do not fail API; service falls back to live Meilisearch search."""
         mock_db = AsyncMock(spec=AsyncSession)
 
         mock_get_redis.side_effect = RuntimeError("redis unavailable")
 
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = AsyncMock()
+        mock_get_search_client.return_value = mock_client_instance
         mock_client_instance.search.return_value = {
             "hits": [
                 {
@@ -236,16 +292,14 @@ class TestSearchNanosService:
 
     @pytest.mark.asyncio
     @patch("app.modules.search.service.get_redis")
-    @patch("app.modules.search.service.MeilisearchClient")
-    async def test_search_pagination_calculation(self, mock_client_class, mock_get_redis):
+    @patch("app.modules.search.service.get_search_client")
+    async def test_search_pagination_calculation(self, mock_get_search_client, mock_get_redis):
         """Pagination metadata is correctly calculated from estimated total."""
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=None)
-        mock_redis.setex = AsyncMock(return_value=True)
+        mock_redis = _mock_cache_redis()
         mock_get_redis.return_value = mock_redis
 
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = AsyncMock()
+        mock_get_search_client.return_value = mock_client_instance
         mock_client_instance.search.return_value = {
             "hits": [{"id": "123", "title": f"Result {i}"} for i in range(20)],
             "estimatedTotalHits": 45,
@@ -275,16 +329,14 @@ class TestSearchNanosService:
 
     @pytest.mark.asyncio
     @patch("app.modules.search.service.get_redis")
-    @patch("app.modules.search.service.MeilisearchClient")
-    async def test_search_with_filters(self, mock_client_class, mock_get_redis):
+    @patch("app.modules.search.service.get_search_client")
+    async def test_search_with_filters(self, mock_get_search_client, mock_get_redis):
         """Filters are passed through to Meilisearch client."""
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=None)
-        mock_redis.setex = AsyncMock(return_value=True)
+        mock_redis = _mock_cache_redis()
         mock_get_redis.return_value = mock_redis
 
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = AsyncMock()
+        mock_get_search_client.return_value = mock_client_instance
         mock_client_instance.search.return_value = {"hits": [], "estimatedTotalHits": 0}
 
         mock_db = AsyncMock(spec=AsyncSession)
@@ -310,22 +362,39 @@ class TestSearchNanosService:
 
     @pytest.mark.asyncio
     @patch("app.modules.search.service.get_redis")
-    async def test_invalidate_search_cache_deletes_prefixed_keys(self, mock_get_redis):
-        """Invalidation removes all configured search cache keys via scan_iter."""
+    async def test_invalidate_search_cache_bumps_generation(self, mock_get_redis):
+        """Invalidation is a single INCR of the generation counter, without SCAN."""
         mock_redis = AsyncMock()
+        mock_redis.incr = AsyncMock(return_value=7)
+        mock_get_redis.return_value = mock_redis
+
+        generation = await invalidate_search_cache(reason="test")
 
-        async def _scan_iter(**_kwargs):
-            for key in ["search:v1:a", "search:v1:b"]:
-                yield key
+        assert generation == 7
+        mock_redis.incr.assert_awaited_once_with("search:v2:gen")
+        mock_redis.scan_iter.assert_not_called()
+        mock_redis.delete.assert_not_called()
 
-        mock_redis.scan_iter = _scan_iter
-        mock_redis.delete = AsyncMock(return_value=2)
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    @patch("app.modules.search.service.get_search_client")
+    async def test_search_cache_key_uses_current_generation(
+        self, mock_get_search_client, mock_get_redis
+    ):
+        """Lookups and stores address the key of the current generation only."""
+        mock_redis = _mock_cache_redis()
+        mock_redis.mget = AsyncMock(return_value=["3", "5"])
         mock_get_redis.return_value = mock_redis
 
-        deleted = await invalidate_search_cache(reason="test")
+        mock_client_instance = AsyncMock()
+        mock_get_search_client.return_value = mock_client_instance
+        mock_client_instance.search.return_value = {"hits": [], "estimatedTotalHits": 0}
+
+        await search_nanos(db=AsyncMock(spec=AsyncSession), query="python", language="de")
 
-        assert deleted == 2
-        mock_redis.delete.assert_awaited_once_with("search:v1:a", "search:v1:b")
+        mock_redis.mget.assert_awaited_once_with("search:v2:gen", "search:v2:gen:language:de")
+        stored_key = mock_redis.setex.await_args.args[0]
+        assert stored_key.startswith("search:v2:g3:s5:")
 
     @pytest.mark.asyncio
     @patch("app.modules.search.service.get_redis")
@@ -336,3 +405,710 @@ class TestSearchNanosService:
         deleted = await invalidate_search_cache(reason="test")
 
         assert deleted == 0
+
+
+_CACHED_EMPTY_PAYLOAD = (
+    '{"success":true,"data":[],"meta":{"pagination":{"current_page":1,'
+    '"page_size":20,"total_results":0,"total_pages":0,"has_next_page":false,'
+    '"has_prev_page":false},"query":{"search_query":"","category":null,'
+    '"level":null,"duration":null,"language":null}}}'
+)
+
+
+class TestPreEncodedSearchResponses:
+    """Tests for serving cached search bodies without decode/re-encode."""
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    @patch("app.modules.search.service.get_search_client")
+    async def test_cached_body_is_returned_with_fresh_timestamp(
+        self, mock_get_search_client, mock_get_redis
+    ):
+        """A cache hit returns the stored bytes plus the current timestamp."""
+        mock_get_redis.return_value = _mock_cache_redis(_CACHED_EMPTY_PAYLOAD, ttl_ms=1_800_000)
+        before = datetime.now(timezone.utc)
+
+        body = await search_nanos_json(db=AsyncMock(spec=AsyncSession), query="")
+
+        assert body.startswith(_CACHED_EMPTY_PAYLOAD[:-1].encode())
+        decoded = SearchResponse.model_validate_json(body)
+        assert decoded.timestamp >= before
+        mock_get_search_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    @patch("app.modules.search.service.get_search_client")
+    async def test_miss_stores_body_without_timestamp(self, mock_get_search_client, mock_get_redis):
+        """Stored bodies omit the timestamp so every hit can stamp its own."""
+        mock_redis = _mock_cache_redis()
+        mock_get_redis.return_value = mock_redis
+        mock_client_instance = AsyncMock()
+        mock_client_instance.search.return_value = {"hits": [], "estimatedTotalHits": 0}
+        mock_get_search_client.return_value = mock_client_instance
+
+        await search_nanos_json(db=AsyncMock(spec=AsyncSession), query="")
+
+        stored_body = mock_redis.setex.await_args.args[2]
+        assert b"timestamp" not in stored_body
+        assert SearchResponse.model_validate_json(
+            stored_body[:-1] + b',"timestamp":"2026-03-16T12:34:56Z"}'
+        )
+
+
+class TestSearchMissCoalescing:
+    """Tests for single-flight recomputation and early refresh of cached searches."""
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    @patch("app.modules.search.service.get_search_client")
+    async def test_concurrent_misses_share_one_meilisearch_call(
+        self, mock_get_search_client, mock_get_redis
+    ):
+        """Concurrent misses for one key are served by a single recomputation."""
+        mock_get_redis.return_value = _mock_cache_redis()
+        release = asyncio.Event()
+
+        async def _slow_search(**_kwargs):
+            await release.wait()
+            return {"hits": [], "estimatedTotalHits": 0}
+
+        mock_client_instance = AsyncMock()
+        mock_client_instance.search.side_effect = _slow_search
+        mock_get_search_client.return_value = mock_client_instance
+
+        pending = [
+            asyncio.create_task(search_nanos(db=AsyncMock(spec=AsyncSession), query=""))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert all(result.success for result in results)
+        mock_client_instance.search.assert_awaited_once()
+        mock_get_redis.return_value.setex.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service._SEARCH_LOCK_POLL_SECONDS", 0)
+    @patch("app.modules.search.service.get_redis")
+    @patch("app.modules.search.service.get_search_client")
+    async def test_miss_waits_for_worker_holding_lock(self, mock_get_search_client, mock_get_redis):
+        """When another worker holds the lock, the miss is served from its cached result."""
+        mock_redis = _mock_cache_redis()
+        mock_redis.set = AsyncMock(return_value=None)
+        pipe = mock_redis.pipeline.return_value.__aenter__.return_value
+        pipe.execute = AsyncMock(
+            side_effect=[[None, -2], [None, -2], [_CACHED_EMPTY_PAYLOAD, 1000]]
+        )
+        mock_get_redis.return_value = mock_redis
+
+        result = await search_nanos(db=AsyncMock(spec=AsyncSession), query="")
+
+        assert result.success is True
+        mock_get_search_client.assert_not_called()
+        mock_redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    @patch("app.modules.search.service.get_search_client")
+    async def test_hot_entry_is_refreshed_in_background(
+        self, mock_get_search_client, mock_get_redis
+    ):
+        """An early refresh returns the cached entry and recomputes it in the background."""
+        mock_get_redis.return_value = _mock_cache_redis(_CACHED_EMPTY_PAYLOAD, ttl_ms=500)
+        mock_client_instance = AsyncMock()
+        mock_client_instance.search.return_value = {"hits": [], "estimatedTotalHits": 0}
+        mock_get_search_client.return_value = mock_client_instance
+
+        with patch("app.modules.search.service._should_refresh_early", return_value=True):
+            result = await search_nanos(db=AsyncMock(spec=AsyncSession), query="")
+            await asyncio.gather(*_background_refreshes)
+
+        assert result.success is True
+        mock_client_instance.search.assert_awaited_once()
+        mock_get_redis.return_value.setex.assert_awaited_once()
+
+    @pytest.mark.unit
+    def test_should_refresh_early_probability(self):
+        """Refresh probability grows as the remaining TTL shrinks; no TTL means no refresh."""
+        assert _should_refresh_early(None) is False
+        with patch("app.modules.search.service.random.random", return_value=0.999):
+            assert _should_refresh_early(60) is True
+            assert _should_refresh_early(1800) is False
+        with patch("app.modules.search.service.random.random", return_value=0.0):
+            assert _should_refresh_early(1) is False
+        with patch.object(settings, "SEARCH_CACHE_EARLY_REFRESH_WINDOW_SECONDS", 0):
+            assert _should_refresh_early(0.001) is False
+
+
+class TestLocalSearchCache:
+    """Tests for the in-process cache tier in front of Redis."""
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    @patch("app.modules.search.service.get_search_client")
+    async def test_repeated_search_is_served_without_redis(
+        self, mock_get_search_client, mock_get_redis
+    ):
+        """The second identical search is answered from process memory."""
+        mock_get_redis.return_value = _mock_cache_redis(_CACHED_EMPTY_PAYLOAD, ttl_ms=1_800_000)
+
+        first = await search_nanos(db=AsyncMock(spec=AsyncSession), query="")
+        mock_get_redis.reset_mock()
+        second = await search_nanos(db=AsyncMock(spec=AsyncSession), query="")
+
+        assert second.data == first.data
+        assert second.timestamp >= first.timestamp
+        mock_get_redis.assert_not_called()
+        mock_get_search_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    @patch("app.modules.search.service.get_search_client")
+    async def test_published_invalidation_drops_local_entries(
+        self, mock_get_search_client, mock_get_redis
+    ):
+        """An invalidation received from another worker evicts the affected scopes."""
+        mock_get_redis.return_value = _mock_cache_redis(_CACHED_EMPTY_PAYLOAD, ttl_ms=1_800_000)
+        await search_nanos(db=AsyncMock(spec=AsyncSession), query="")
+
+        _apply_invalidation_message('["all", "category:Office"]')
+        mock_get_redis.reset_mock()
+        await search_nanos(db=AsyncMock(spec=AsyncSession), query="")
+
+        mock_get_redis.assert_called()
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    async def test_invalidation_is_published_to_other_workers(self, mock_get_redis):
+        """Full invalidations are fanned out on the invalidation channel."""
+        mock_redis = AsyncMock()
+        mock_redis.incr = AsyncMock(return_value=2)
+        mock_get_redis.return_value = mock_redis
+
+        await invalidate_search_cache(reason="test")
+
+        mock_redis.publish.assert_awaited_once_with("search:v2:invalidate", "*")
+
+
+class TestSelectiveCacheInvalidation:
+    """Tests for per-Nano cache invalidation that skips changes invisible to search."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("old_status", "new_status", "changed_fields", "expected"),
+        [
+            ("draft", "draft", ["title"], False),
+            ("archived", "deleted", None, False),
+            ("pending_review", "draft", None, False),
+            ("pending_review", "published", None, True),
+            ("published", "archived", None, True),
+            ("published", "published", ["license"], False),
+            ("published", "published", [], False),
+            ("published", "published", ["average_rating"], True),
+            (NanoStatus.PUBLISHED, NanoStatus.PUBLISHED, None, True),
+        ],
+    )
+    def test_is_search_visible_change(self, old_status, new_status, changed_fields, expected):
+        """Only changes touching published Nanos and indexed fields are visible."""
+        assert is_search_visible_change(old_status, new_status, changed_fields) is expected
+
+    @pytest.mark.unit
+    def test_search_cache_scope_prefers_most_selective_filter(self):
+        """Entries are versioned by category, then language, then level, else ``all``."""
+        assert _search_cache_scope("Office", "de", 1) == "category:Office"
+        assert _search_cache_scope(None, "de", 1) == "language:de"
+        assert _search_cache_scope(None, None, 2) == "level:2"
+        assert _search_cache_scope(None, None, None) == "all"
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    async def test_invisible_change_skips_redis(self, mock_get_redis):
+        """Draft edits never touch the cache."""
+        invalidated = await invalidate_search_cache_for_nano(
+            AsyncMock(spec=AsyncSession),
+            uuid4(),
+            reason="test",
+            old_status="draft",
+            new_status="draft",
+            changed_fields=["title"],
+        )
+
+        assert invalidated is False
+        mock_get_redis.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.modules.search.service.get_redis")
+    async def test_visible_change_bumps_affected_facet_scopes(self, mock_get_redis):
+        """Old and new facet scopes plus ``all`` are bumped in one pipeline."""
+        mock_redis = _mock_cache_redis()
+        pipe = mock_redis.pipeline.return_value.__aenter__.return_value
+        mock_get_redis.return_value = mock_redis
+
+        with patch(
+            "app.modules.search.service.load_search_facets",
+            AsyncMock(return_value=SearchFacets(category="Office", language="de", level=1)),
+        ):
+            invalidated = await invalidate_search_cache_for_nano(
+                AsyncMock(spec=AsyncSession),
+                uuid4(),
+                reason="test",
+                old_status="published",
+                new_status="archived",
+                previous_facets=SearchFacets(category="Programming", language="de", level=1),
+            )
+
+        assert invalidated is True
+        bumped = {call.args[0] for call in pipe.incr.call_args_list}
+        assert bumped == {
+            "search:v2:gen:all",
+            "search:v2:gen:category:Office",
+            "search:v2:gen:category:Programming",
+            "search:v2:gen:language:de",
+            "search:v2:gen:level:1",
+        }
+        pipe.execute.assert_awaited_once()
+
+
+class TestSearchIndexSync:
+    """Tests for incremental per-Nano index sync and watermark reconciliation."""
+
+    @pytest.mark.asyncio
+    async def test_sync_upserts_published_nano(self):
+        """Published Nanos are upserted as a single document."""
+        mock_db = AsyncMock(spec=AsyncSession)
+        nano_id = uuid4()
+        document = {"id": str(nano_id), "updated_at": "2026-03-10T10:00:00+00:00"}
+
+        with (
+            patch(
+                "app.modules.search.service._build_search_documents",
+                AsyncMock(return_value=[document]),
+            ),
+            patch("app.modules.search.service._upsert_search_documents") as mock_upsert,
+            patch("app.modules.search.service._delete_search_documents") as mock_delete,
+        ):
+            await sync_nano_search_document(
+                mock_db, nano_id, reason="test", old_status="draft", new_status="published"
+            )
+
+        mock_upsert.assert_awaited_once_with(settings.MEILI_INDEX_UID, [document], wait=False)
+        mock_delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_deletes_non_published_nano(self):
+        """Nanos that are not published are removed from the index."""
+        mock_db = AsyncMock(spec=AsyncSession)
+        nano_id = uuid4()
+
+        with (
+            patch(
+                "app.modules.search.service._build_search_documents",
+                AsyncMock(return_value=[]),
+            ),
+            patch("app.modules.search.service._upsert_search_documents") as mock_upsert,
+            patch("app.modules.search.service._delete_search_documents") as mock_delete,
+        ):
+            await sync_nano_search_document(
+                mock_db, nano_id, reason="test", old_status="published", new_status="archived"
+            )
+
+        mock_delete.assert_awaited_once_with(settings.MEILI_INDEX_UID, [str(nano_id)], wait=False)
+        mock_upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_skips_changes_invisible_to_search(self):
+        """Draft edits never touch the index."""
+        mock_db = AsyncMock(spec=AsyncSession)
+
+        with (
+            patch("app.modules.search.service._build_search_documents") as mock_build,
+            patch("app.modules.search.service._meili_request") as mock_request,
+        ):
+            synced = await sync_nano_search_document(
+                mock_db,
+                uuid4(),
+                reason="test",
+                old_status="draft",
+                new_status="draft",
+                changed_fields=["title"],
+            )
+
+        assert synced is False
+        mock_build.assert_not_called()
+        mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_does_not_poll_the_indexing_task(self):
+        """Write paths only enqueue the Meilisearch task."""
+        calls: list[str] = []
+
+        async def _request(path, *, method="GET", payload=None):
+            calls.append(path)
+            return 202, {"taskUid": 1}
+
+        with (
+            patch(
+                "app.modules.search.service._build_search_documents",
+                AsyncMock(return_value=[{"id": "x"}]),
+            ),
+            patch("app.modules.search.service._meili_request", _request),
+        ):
+            synced = await sync_nano_search_document(
+                AsyncMock(spec=AsyncSession),
+                uuid4(),
+                reason="test",
+                old_status="published",
+                new_status="published",
+            )
+
+        assert synced is True
+        assert calls == [f"/indexes/{settings.MEILI_INDEX_UID}/documents"]
+
+    @pytest.mark.asyncio
+    async def test_sync_swallows_backend_errors(self):
+        """Index sync failures never propagate to the calling request."""
+        mock_db = AsyncMock(spec=AsyncSession)
+
+        with (
+            patch(
+                "app.modules.search.service._build_search_documents",
+                AsyncMock(return_value=[{"id": "x"}]),
+            ),
+            patch(
+                "app.modules.search.service._meili_request",
+                AsyncMock(side_effect=OSError("meilisearch down")),
+            ),
+        ):
+            synced = await sync_nano_search_document(
+                mock_db, uuid4(), reason="test", old_status="published", new_status="published"
+            )
+
+        assert synced is False
+
+    @pytest.mark.asyncio
+    async def test_reconcile_upserts_stale_and_deletes_unpublished(self):
+        """Reconciler re-uploads drifted docs and drops docs no longer published."""
+        fresh_id, stale_id, missing_id, removed_id = uuid4(), uuid4(), uuid4(), uuid4()
+        watermark = datetime(2026, 3, 10, 10, 0, tzinfo=timezone.utc)
+
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            (fresh_id, watermark),
+            (stale_id, watermark),
+            (missing_id, watermark),
+        ]
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        indexed = {
+            str(fresh_id): watermark.isoformat(),
+            str(stale_id): "2026-01-01T00:00:00+00:00",
+            str(removed_id): watermark.isoformat(),
+        }
+
+        with (
+            patch(
+                "app.modules.search.service._fetch_index_watermarks",
+                AsyncMock(return_value=indexed),
+            ),
+            patch("app.modules.search.service._stream_search_documents") as mock_stream,
+            patch("app.modules.search.service._delete_search_documents") as mock_delete,
+            patch("app.modules.search.service._apply_index_settings") as mock_settings,
+            patch("app.modules.search.service.invalidate_search_cache") as mock_invalidate,
+        ):
+            result = await reconcile_search_index(mock_db)
+
+        assert result["upserted_count"] == 2
+        assert result["deleted_count"] == 1
+        assert set(mock_stream.await_args.kwargs["nano_ids"]) == {stale_id, missing_id}
+        mock_delete.assert_awaited_once_with(settings.MEILI_INDEX_UID, [str(removed_id)])
+        mock_settings.assert_awaited_once()
+        mock_invalidate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reconciler_runs_once_per_interval_across_workers(self):
+        """Only the worker that takes the Redis lease reconciles in a round."""
+        redis_client = AsyncMock()
+        redis_client.set = AsyncMock(side_effect=[True, None])
+        sleeps = 0
+
+        async def _sleep(_seconds):
+            nonlocal sleeps
+            sleeps += 1
+            if sleeps > 2:
+                raise asyncio.CancelledError
+
+        with (
+            patch("app.modules.search.service.get_redis", AsyncMock(return_value=redis_client)),
+            patch("app.modules.search.service.asyncio.sleep", _sleep),
+            patch("app.modules.search.service.reconcile_search_index") as mock_reconcile,
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await run_search_reconciler(MagicMock(), interval_seconds=300)
+
+        mock_reconcile.assert_awaited_once()
+        lock_call = redis_client.set.await_args_list[0]
+        assert lock_call.args[0] == f"{settings.SEARCH_CACHE_KEY_PREFIX}:lock:reconcile"
+        assert lock_call.kwargs == {"nx": True, "px": 300_000}
+
+
+def _batches(*batches: list[dict]):
+    """Build a replacement for ``_iter_search_document_batches`` yielding fixed batches."""
+
+    async def _iter(_db, nano_ids=None):
+        for batch in batches:
+            yield batch
+
+    return _iter
+
+
+class TestBlueGreenRebuild:
+    """Tests for the zero-downtime shadow-index rebuild."""
+
+    @staticmethod
+    def _fake_meili(calls: list[tuple[str, str, object]], fail_path: str | None = None):
+        async def _request(path, *, method="GET", payload=None):
+            calls.append((method, path, payload))
+            if fail_path is not None and path.endswith(fail_path):
+                return 400, {"code": "invalid_request"}
+            if path.startswith("/tasks/"):
+                return 200, {"status": "succeeded"}
+            return 202, {"taskUid": len(calls)}
+
+        return _request
+
+    @pytest.mark.asyncio
+    async def test_rebuild_swaps_shadow_index_before_dropping_old_one(self):
+        """Live index is never deleted; the shadow is swapped in and then dropped."""
+        calls: list[tuple[str, str, object]] = []
+
+        with (
+            patch(
+                "app.modules.search.service._iter_search_document_batches",
+                _batches([{"id": "a"}]),
+            ),
+            patch("app.modules.search.service._meili_request", self._fake_meili(calls)),
+            patch("app.modules.search.service.invalidate_search_cache", AsyncMock()),
+            patch("app.modules.search.service.reconcile_search_index", AsyncMock()),
+        ):
+            result = await rebuild_search_index(AsyncMock(spec=AsyncSession), index_name="live")
+
+        mutations = [(method, path) for method, path, _ in calls if not path.startswith("/tasks/")]
+        shadow_uid = calls[0][2]["uid"]
+        assert shadow_uid.startswith("live__")
+        assert ("DELETE", "/indexes/live") not in mutations
+        swap_position = mutations.index(("POST", "/swap-indexes"))
+        assert mutations.index(("POST", f"/indexes/{shadow_uid}/documents")) < swap_position
+        assert mutations[-1] == ("DELETE", f"/indexes/{shadow_uid}")
+        swap_payload = next(payload for _, path, payload in calls if path == "/swap-indexes")
+        assert swap_payload == [{"indexes": ["live", shadow_uid]}]
+        assert result["document_count"] == 1
+        assert result["build_seconds"] >= 0
+        assert result["swap_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_rebuild_failure_keeps_live_index_and_drops_shadow(self):
+        """A failed shadow build never swaps and cleans up the partial index."""
+        calls: list[tuple[str, str, object]] = []
+
+        with (
+            patch(
+                "app.modules.search.service._iter_search_document_batches",
+                _batches([{"id": "a"}]),
+            ),
+            patch(
+                "app.modules.search.service._meili_request",
+                self._fake_meili(calls, fail_path="/documents"),
+            ),
+            patch("app.modules.search.service.invalidate_search_cache", AsyncMock()),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await rebuild_search_index(AsyncMock(spec=AsyncSession), index_name="live")
+
+        assert exc_info.value.status_code == 503
+        shadow_uid = calls[0][2]["uid"]
+        paths = [path for _, path, _ in calls]
+        assert "/swap-indexes" not in paths
+        assert ("DELETE", f"/indexes/{shadow_uid}") in [(m, p) for m, p, _ in calls]
+
+
+class TestStreamingDocumentPipeline:
+    """Tests for keyset-batched document builds and bounded-concurrency uploads."""
+
+    @staticmethod
+    def _make_nano(creator_id, status: NanoStatus) -> Nano:
+        return Nano(
+            id=uuid4(),
+            creator_id=creator_id,
+            title="Streamed Nano",
+            description="Batch pipeline test",
+            duration_minutes=10,
+            competency_level=CompetencyLevel.BASIC,
+            language="de",
+            format=NanoFormat.TEXT,
+            status=status,
+            license=LicenseType.CC_BY,
+            published_at=datetime.now(timezone.utc),
+        )
+
+    @pytest.mark.asyncio
+    async def test_batches_cover_all_published_nanos_in_keyset_order(
+        self, db_session, verified_user, monkeypatch
+    ):
+        """Published Nanos are yielded once each, in id order, in fixed-size batches."""
+        monkeypatch.setattr(settings, "SEARCH_INDEX_BATCH_SIZE", 2)
+        published = [self._make_nano(verified_user.id, NanoStatus.PUBLISHED) for _ in range(5)]
+        draft = self._make_nano(verified_user.id, NanoStatus.DRAFT)
+        db_session.add_all([*published, draft])
+        await db_session.commit()
+
+        batches = [batch async for batch in _iter_search_document_batches(db_session)]
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        ids = [document["id"] for batch in batches for document in batch]
+        assert ids == sorted(str(nano.id) for nano in published)
+        assert all(document["creator"] == verified_user.username for document in batches[0])
+
+    @pytest.mark.asyncio
+    async def test_stream_uploads_each_batch_with_bounded_concurrency(self, monkeypatch):
+        """Each batch is uploaded separately and never more than the configured limit at once."""
+        monkeypatch.setattr(settings, "SEARCH_INDEX_UPLOAD_CONCURRENCY", 2)
+        in_flight = 0
+        peak_in_flight = 0
+        uploaded: list[list[dict]] = []
+
+        async def _upload(_index, batch):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            uploaded.append(batch)
+            in_flight -= 1
+
+        batches = [[{"id": str(i)}] for i in range(6)]
+        with (
+            patch("app.modules.search.service._iter_search_document_batches", _batches(*batches)),
+            patch("app.modules.search.service._upsert_search_documents", _upload),
+        ):
+            count = await _stream_search_documents(AsyncMock(spec=AsyncSession), "idx")
+
+        assert count == 6
+        assert len(uploaded) == 6
+        assert peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_propagates_upload_failure(self):
+        """A failed batch upload fails the whole stream."""
+        upload = AsyncMock(side_effect=HTTPException(status_code=503, detail="boom"))
+        with (
+            patch(
+                "app.modules.search.service._iter_search_document_batches",
+                _batches([{"id": "a"}], [{"id": "b"}]),
+            ),
+            patch("app.modules.search.service._upsert_search_documents", upload),
+            pytest.raises(HTTPException),
+        ):
+            await _stream_search_documents(AsyncMock(spec=AsyncSession), "idx")
+
+
+class TestMeilisearchClient:
+    """Tests for the async query client on top of the shared transport."""
+
+    @pytest.mark.asyncio
+    async def test_search_posts_query_and_filters_to_search_endpoint(self):
+        """Search is an async POST to the index search endpoint with built filters."""
+        transport = MagicMock()
+        transport.request = AsyncMock(
+            side_effect=[(200, {"uid": "idx"}), (200, {"hits": [], "estimatedTotalHits": 0})]
+        )
+        client = MeilisearchClient(index_name="idx", transport=transport)
+
+        result = await client.search(query="excel", category="Office", level=1, page=2, limit=10)
+
+        assert result == {"hits": [], "estimatedTotalHits": 0}
+        search_call = transport.request.await_args_list[-1]
+        assert search_call.args == ("/indexes/idx/search",)
+        assert search_call.kwargs["method"] == "POST"
+        payload = search_call.kwargs["payload"]
+        assert payload["q"] == "excel"
+        assert payload["offset"] == 10
+        assert payload["filter"] == (
+            "status = 'published' AND category = 'Office' AND competency_level = 1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_unreachable_backend_returns_503(self):
+        """Transport failures surface as 503 Search service unavailable."""
+        transport = MagicMock()
+        transport.request = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        client = MeilisearchClient(index_name="idx", transport=transport)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await client.search(query="excel")
+
+        assert exc_info.value.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_search_resolves_index_once_across_calls(self):
+        """The index lookup runs once; later searches only POST the query."""
+        transport = MagicMock()
+        transport.request = AsyncMock(
+            side_effect=[
+                (200, {"uid": "idx"}),
+                (200, {"hits": [], "estimatedTotalHits": 0}),
+                (200, {"hits": [], "estimatedTotalHits": 0}),
+            ]
+        )
+        client = MeilisearchClient(index_name="idx", transport=transport)
+
+        await client.search(query="excel")
+        await client.search(query="python")
+
+        paths = [call.args[0] for call in transport.request.await_args_list]
+        assert paths == ["/indexes/idx", "/indexes/idx/search", "/indexes/idx/search"]
+
+    @pytest.mark.asyncio
+    async def test_search_refreshes_index_handle_after_not_found(self):
+        """A 404 from the search endpoint re-resolves the index and retries once."""
+        transport = MagicMock()
+        transport.request = AsyncMock(
+            side_effect=[
+                (200, {"uid": "idx"}),
+                (404, {"code": "index_not_found"}),
+                (200, {"uid": "idx"}),
+                (200, {"hits": [], "estimatedTotalHits": 0}),
+            ]
+        )
+        client = MeilisearchClient(index_name="idx", transport=transport)
+
+        result = await client.search(query="excel")
+
+        assert result == {"hits": [], "estimatedTotalHits": 0}
+        assert transport.request.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_search_reresolves_index_after_transport_failure(self):
+        """A network error drops the resolved handle so the next call looks it up again."""
+        transport = MagicMock()
+        transport.request = AsyncMock(
+            side_effect=[
+                (200, {"uid": "idx"}),
+                httpx.ReadTimeout("slow"),
+                (200, {"uid": "idx"}),
+                (200, {"hits": [], "estimatedTotalHits": 0}),
+            ]
+        )
+        client = MeilisearchClient(index_name="idx", transport=transport)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await client.search(query="excel")
+        assert exc_info.value.status_code == 503
+
+        await client.search(query="excel")
+        paths = [call.args[0] for call in transport.request.await_args_list]
+        assert paths[2] == "/indexes/idx"
+
+    def test_get_search_client_returns_shared_instance(self):
+        """The search path reuses one long-lived client."""
+        assert get_search_client() is get_search_client()
@@ -0,0 +1,94 @@
+"""Tests for the pooled Meilisearch HTTP transport."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.modules.search.transport import MeiliTransport, close_meili_transport, get_meili_transport
+
+
+def _transport_with_handler(handler, **kwargs) -> MeiliTransport:
+    transport = MeiliTransport("http://meili.test/", "secret", **kwargs)
+    transport._client = httpx.AsyncClient(
+        base_url="http://meili.test",
+        headers=transport._client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return transport
+
+
+class TestMeiliTransport:
+    """Tests for request encoding, response decoding, and concurrency limits."""
+
+    @pytest.mark.asyncio
+    async def test_request_sends_json_and_auth_header(self):
+        """Payloads are JSON encoded and the master key is sent as bearer token."""
+        seen: list[httpx.Request] = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(202, json={"taskUid": 7})
+
+        transport = _transport_with_handler(_handler)
+        status_code, body = await transport.request(
+            "/indexes/nanos/documents", method="POST", payload=[{"id": "a"}]
+        )
+        await transport.aclose()
+
+        assert status_code == 202
+        assert body == {"taskUid": 7}
+        assert seen[0].headers["Authorization"] == "Bearer secret"
+        assert json.loads(seen[0].content) == [{"id": "a"}]
+
+    @pytest.mark.asyncio
+    async def test_error_responses_are_returned_not_raised(self):
+        """Non-2xx responses are returned with their decoded body."""
+        transport = _transport_with_handler(
+            lambda _request: httpx.Response(404, json={"code": "index_not_found"})
+        )
+        status_code, body = await transport.request("/indexes/missing")
+        await transport.aclose()
+
+        assert status_code == 404
+        assert body == {"code": "index_not_found"}
+
+    @pytest.mark.asyncio
+    async def test_empty_and_non_json_bodies(self):
+        """Empty bodies decode to None and non-JSON bodies fall back to text."""
+        responses = iter([httpx.Response(204), httpx.Response(502, text="bad gateway")])
+        transport = _transport_with_handler(lambda _request: next(responses))
+
+        assert await transport.request("/health") == (204, None)
+        assert await transport.request("/health") == (502, "bad gateway")
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_limits_in_flight_requests(self):
+        """No more than ``max_concurrent_requests`` requests run at the same time."""
+        in_flight = 0
+        peak = 0
+
+        async def _handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        transport = _transport_with_handler(_handler, max_concurrent_requests=2)
+        await asyncio.gather(*(transport.request("/health") for _ in range(6)))
+        await transport.aclose()
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_transport_is_reused_until_closed(self):
+        """The module-level transport is a singleton until explicitly closed."""
+        first = get_meili_transport()
+        assert get_meili_transport() is first
+
+        await close_meili_transport()
+        assert get_meili_transport() is not first
@@ -0,0 +1,94 @@
+"""Tests for the concurrency admission controller used by password verification."""
+
+import asyncio
+
+import pytest
+from prometheus_client import CollectorRegistry, Counter, Gauge
+
+from app.security.admission import AdmissionRejectedError, ConcurrencyAdmissionController
+
+
+def _controller(
+    max_concurrent: int = 1, max_queue: int = 1, queue_timeout_seconds: float = 1.0
+) -> tuple[ConcurrencyAdmissionController, Gauge, Counter]:
+    registry = CollectorRegistry()
+    gauge = Gauge("test_queue_depth", "Queue depth.", registry=registry)
+    counter = Counter("test_rejected", "Rejections.", ("reason",), registry=registry)
+    controller = ConcurrencyAdmissionController(
+        max_concurrent,
+        max_queue,
+        queue_timeout_seconds,
+        queue_depth_gauge=gauge,
+        rejected_counter=counter,
+    )
+    return controller, gauge, counter
+
+
+async def test_admits_up_to_max_concurrent_without_queueing() -> None:
+    controller, gauge, _ = _controller(max_concurrent=2)
+
+    async with controller.admit():
+        async with controller.admit():
+            assert controller.waiting == 0
+            assert gauge._value.get() == 0
+
+
+async def test_rejects_immediately_when_queue_is_full() -> None:
+    controller, gauge, counter = _controller(max_concurrent=1, max_queue=1)
+    release = asyncio.Event()
+
+    async def hold_slot() -> None:
+        async with controller.admit():
+            await release.wait()
+
+    async def wait_for_slot() -> None:
+        async with controller.admit():
+            pass
+
+    holder = asyncio.create_task(hold_slot())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(wait_for_slot())
+    await asyncio.sleep(0)
+    assert controller.waiting == 1
+    assert gauge._value.get() == 1
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        async with controller.admit():
+            pass
+
+    assert exc_info.value.reason == "queue_full"
+    assert exc_info.value.retry_after_seconds == 1
+    assert counter.labels(reason="queue_full")._value.get() == 1
+
+    release.set()
+    await asyncio.gather(holder, waiter)
+    assert controller.waiting == 0
+    assert gauge._value.get() == 0
+
+
+async def test_rejects_after_queue_timeout() -> None:
+    controller, gauge, counter = _controller(max_queue=4, queue_timeout_seconds=0.05)
+    release = asyncio.Event()
+
+    async def hold_slot() -> None:
+        async with controller.admit():
+            await release.wait()
+
+    holder = asyncio.create_task(hold_slot())
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        async with controller.admit():
+            pass
+
+    assert exc_info.value.reason == "queue_timeout"
+    assert counter.labels(reason="queue_timeout")._value.get() == 1
+    assert gauge._value.get() == 0
+
+    release.set()
+    await holder
+
+
+def test_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError):
+        _controller(max_concurrent=0)
@@ -0,0 +1,185 @@
+"""Tests for the in-memory and Redis-backed rate limiters."""
+
+import pytest
+
+import app.security.rate_limit as rate_limit_module
+from app.monitoring import RATE_LIMIT_KEYS_EVICTED_TOTAL
+from app.redis_client import check_redis_health
+from app.security.rate_limit import (
+    CompactRateLimiter,
+    RedisSlidingWindowRateLimiter,
+    create_rate_limiter,
+)
+
+
+class FakeScript:
+    def __init__(self, result: list[int]) -> None:
+        self.result = result
+        self.calls: list[dict] = []
+
+    async def __call__(self, keys: list[str], args: list) -> list[int]:
+        self.calls.append({"keys": keys, "args": args})
+        return self.result
+
+
+class FakeRedisClient:
+    def __init__(self, script: FakeScript) -> None:
+        self.script = script
+        self.registered = 0
+
+    def register_script(self, source: str) -> FakeScript:
+        self.registered += 1
+        return self.script
+
+
+def _fake_clock(monkeypatch: pytest.MonkeyPatch, start: float = 1000.0) -> list[float]:
+    now = [start]
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+async def test_compact_limiter_allows_burst_then_refills(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = _fake_clock(monkeypatch)
+    limiter = CompactRateLimiter(max_requests=2, window_seconds=60)
+
+    assert await limiter.check("client") == (True, 0)
+    assert await limiter.check("client") == (True, 0)
+    assert await limiter.check("client") == (False, 30)
+
+    now[0] += 30
+    assert await limiter.check("client") == (True, 0)
+    assert (await limiter.check("client"))[0] is False
+
+
+async def test_compact_limiter_adds_linear_violation_penalty(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = _fake_clock(monkeypatch)
+    limiter = CompactRateLimiter(max_requests=1, window_seconds=10)
+
+    await limiter.check("client")
+    now[0] += 9.5
+    retry_afters = [(await limiter.check("client"))[1] for _ in range(3)]
+
+    assert retry_afters == [1, 2, 3]
+
+    now[0] += 11
+    assert await limiter.check("client") == (True, 0)
+    now[0] += 0.5
+    assert (await limiter.check("client"))[1] == 10
+
+
+async def test_compact_limiter_evicts_least_recently_used_keys() -> None:
+    limiter = CompactRateLimiter(max_requests=1, window_seconds=60, name="evict_test", max_keys=2)
+    evicted = RATE_LIMIT_KEYS_EVICTED_TOTAL.labels(limiter="evict_test")
+    evicted_before = evicted._value.get()
+
+    await limiter.check("a")
+    await limiter.check("b")
+    assert (await limiter.check("a"))[0] is False
+    await limiter.check("c")
+
+    assert len(limiter) == 2
+    assert evicted._value.get() == evicted_before + 1
+    assert (await limiter.check("a"))[0] is False
+    assert (await limiter.check("b"))[0] is True
+
+
+def test_compact_limiter_rejects_invalid_key_cap() -> None:
+    with pytest.raises(ValueError):
+        CompactRateLimiter(max_requests=1, window_seconds=1, max_keys=0)
+
+
+def _patch_redis(monkeypatch: pytest.MonkeyPatch, client: object) -> None:
+    async def fake_get_redis() -> object:
+        return client
+
+    monkeypatch.setattr(rate_limit_module, "get_redis", fake_get_redis)
+
+
+async def test_redis_limiter_runs_one_script_per_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    script = FakeScript([0, 7])
+    client = FakeRedisClient(script)
+    _patch_redis(monkeypatch, client)
+    limiter = RedisSlidingWindowRateLimiter(max_requests=5, window_seconds=60)
+
+    first = await limiter.check("login:10.0.0.1")
+    second = await limiter.check("login:10.0.0.1")
+
+    assert first == (False, 7)
+    assert second == (False, 7)
+    assert client.registered == 1
+    assert script.calls[0]["keys"] == [
+        "ratelimit:{login:10.0.0.1}:hits",
+        "ratelimit:{login:10.0.0.1}:violations",
+    ]
+    assert script.calls[0]["args"][:2] == [60, 5]
+    assert script.calls[0]["args"][2] != script.calls[1]["args"][2]
+
+
+async def test_redis_limiter_falls_back_to_memory_when_unavailable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    attempts = 0
+
+    async def broken_get_redis() -> object:
+        nonlocal attempts
+        attempts += 1
+        raise ConnectionError("redis unavailable")
+
+    monkeypatch.setattr(rate_limit_module, "get_redis", broken_get_redis)
+    limiter = RedisSlidingWindowRateLimiter(max_requests=2, window_seconds=60)
+
+    results = [await limiter.check("chat_message:u:s") for _ in range(3)]
+
+    assert [allowed for allowed, _ in results] == [True, True, False]
+    assert results[2][1] >= 1
+    # Redis is not retried until redis_retry_seconds have passed.
+    assert attempts == 1
+
+
+async def test_redis_limiter_reset_clears_fallback_and_retries_redis(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def broken_get_redis() -> object:
+        raise ConnectionError("redis unavailable")
+
+    monkeypatch.setattr(rate_limit_module, "get_redis", broken_get_redis)
+    limiter = RedisSlidingWindowRateLimiter(max_requests=1, window_seconds=60)
+    await limiter.check("key")
+    assert (await limiter.check("key"))[0] is False
+
+    limiter.reset()
+    script = FakeScript([1, 0])
+    _patch_redis(monkeypatch, FakeRedisClient(script))
+
+    assert await limiter.check("key") == (True, 0)
+    assert script.calls[0]["keys"][0].startswith("ratelimit:")
+    assert script.calls[0]["keys"][0] != "ratelimit:{key}:hits"
+
+
+def test_create_rate_limiter_respects_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = rate_limit_module.get_settings()
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "memory")
+    monkeypatch.setattr(settings, "RATE_LIMIT_MEMORY_MAX_KEYS", 7)
+    memory_limiter = create_rate_limiter(max_requests=1, window_seconds=1, name="test")
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "redis")
+    redis_limiter = create_rate_limiter(max_requests=1, window_seconds=1, name="test")
+
+    assert type(memory_limiter) is CompactRateLimiter
+    assert memory_limiter.max_keys == 7
+    assert isinstance(redis_limiter, RedisSlidingWindowRateLimiter)
+
+
+async def test_redis_limiter_against_live_redis() -> None:
+    if not await check_redis_health():
+        pytest.skip("Redis is not reachable; run the verified Docker-backed test task")
+
+    limiter = RedisSlidingWindowRateLimiter(max_requests=2, window_seconds=60)
+    limiter.reset()
+
+    results = [await limiter.check("live-test") for _ in range(4)]
+
+    assert [allowed for allowed, _ in results] == [True, True, False, False]
+    assert results[3][1] >= results[2][1] >= 1
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import AuditAction, User
 from app.modules.audit.service import AuditLogger
+from app.pagination import MAX_CURSOR_LENGTH
 
 
 class TestAuditRoutes:
@@ -68,6 +69,25 @@ class TestAuditRoutes:
         assert data["offset"] == 0
         assert isinstance(data["logs"], list)
 
+    @pytest.mark.asyncio
+    async def test_query_audit_logs_rejects_bad_cursors(
+        self,
+        async_client,
+        admin_token: str,
+    ) -> None:
+        """Malformed cursors get 400 and oversized ones are rejected before decoding."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+
+        response = await async_client.get("/api/v1/admin/audit-logs?cursor=bogus", headers=headers)
+        assert response.status_code == 400
+
+        response = await async_client.get(
+            "/api/v1/admin/audit-logs",
+            params={"cursor": "a" * (MAX_CURSOR_LENGTH + 1)},
+            headers=headers,
+        )
+        assert response.status_code == 422
+
     @pytest.mark.asyncio
     async def test_query_audit_logs_filters_by_action(
         self,
@@ -58,7 +58,7 @@ class TestAuditLoggerService:
         )
         await db_session.commit()
 
-        logs, total = await AuditLogger.query_logs(
+        logs, total, _ = await AuditLogger.query_logs(
             db_session,
             action=AuditAction.LOGIN_SUCCESS,
         )
@@ -80,8 +80,8 @@ class TestAuditLoggerService:
             )
         await db_session.commit()
 
-        page_one, total = await AuditLogger.query_logs(db_session, limit=2, offset=0)
-        page_two, _ = await AuditLogger.query_logs(db_session, limit=2, offset=2)
+        page_one, total, _ = await AuditLogger.query_logs(db_session, limit=2, offset=0)
+        page_two, _, _ = await AuditLogger.query_logs(db_session, limit=2, offset=2)
 
         assert len(page_one) == 2
         assert len(page_two) <= 2
@@ -89,6 +89,40 @@ class TestAuditLoggerService:
         if page_two:
             assert page_one[0].id != page_two[0].id
 
+    @pytest.mark.asyncio
+    async def test_query_logs_cursor_pages_cover_all_entries_once(
+        self, db_session: AsyncSession, verified_user: User
+    ) -> None:
+        """Keyset cursors walk every entry exactly once, even with equal timestamps."""
+        shared_timestamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        created_ids = set()
+        for _ in range(5):
+            log = await AuditLogger.log_action(
+                db_session,
+                action=AuditAction.LOGIN_SUCCESS,
+                user_id=verified_user.id,
+                resource_type="cursor-test",
+            )
+            log.created_at = shared_timestamp
+            created_ids.add(log.id)
+        await db_session.commit()
+
+        seen_ids = []
+        logs, total, cursor = await AuditLogger.query_logs(
+            db_session, resource_type="cursor-test", limit=2
+        )
+        seen_ids.extend(log.id for log in logs)
+        assert total == 5
+        while cursor is not None:
+            logs, total, cursor = await AuditLogger.query_logs(
+                db_session, resource_type="cursor-test", limit=2, cursor=cursor
+            )
+            assert total is None
+            seen_ids.extend(log.id for log in logs)
+
+        assert len(seen_ids) == 5
+        assert set(seen_ids) == created_ids
+
     @pytest.mark.asyncio
     async def test_get_suspicious_activity_threshold(
         self, db_session: AsyncSession, verified_user: User
@@ -0,0 +1,58 @@
+"""Tests for database connection pool instrumentation."""
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import InstrumentedAsyncQueuePool
+from app.monitoring import DB_POOL_CHECKOUT_TIMEOUTS_TOTAL, DB_POOL_CHECKOUT_WAIT_SECONDS
+from expect import expect
+
+
+def _gauge(name: str) -> float:
+    return REGISTRY.get_sample_value(name, {"pool": "pool_test"})
+
+
+def _engine(**pool_options):
+    return create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name="pool_test",
+        **pool_options,
+    )
+
+
+CHECKOUT_WAIT = DB_POOL_CHECKOUT_WAIT_SECONDS.labels(pool="pool_test")
+CHECKOUT_TIMEOUTS = DB_POOL_CHECKOUT_TIMEOUTS_TOTAL.labels(pool="pool_test")
+
+
+async def test_pool_gauges_track_checked_out_and_overflow_connections() -> None:
+    """Gauges reflect open checkouts beyond the pool size and drop back on return."""
+    engine = _engine(pool_size=1, max_overflow=1)
+    waits_before = CHECKOUT_WAIT._sum.get()
+
+    async with engine.connect() as first, engine.connect():
+        await first.execute(text("SELECT 1"))
+        expect(_gauge("db_pool_checked_out_connections")).equal(2)
+        expect(_gauge("db_pool_overflow_connections")).equal(1)
+
+    expect(_gauge("db_pool_checked_out_connections")).equal(0)
+    expect(_gauge("db_pool_overflow_connections")).equal(0)
+    expect(CHECKOUT_WAIT._sum.get() > waits_before).to_be_true()
+    await engine.dispose()
+
+
+async def test_pool_checkout_timeout_is_counted() -> None:
+    """An exhausted pool raises after pool_timeout and counts the timeout."""
+    engine = _engine(pool_size=1, max_overflow=0, pool_timeout=0.05)
+    timeouts_before = CHECKOUT_TIMEOUTS._value.get()
+
+    async with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            async with engine.connect():
+                pass
+
+    expect(CHECKOUT_TIMEOUTS._value.get()).equal(timeouts_before + 1)
+    await engine.dispose()
@@ -0,0 +1,64 @@
+"""Tests for the shared keyset pagination helpers."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.models import AuditLog
+from app.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    should_count_total,
+    split_page,
+)
+from expect import expect
+
+KEY_COLUMNS = (AuditLog.created_at, AuditLog.id)
+
+
+def test_cursor_round_trips_datetimes_and_uuids() -> None:
+    """Decoding restores the typed sort key that was encoded."""
+    key = (datetime(2026, 5, 1, 12, 30, 15, 250, tzinfo=timezone.utc), uuid4())
+
+    cursor = encode_cursor(key)
+
+    expect(decode_cursor(cursor, KEY_COLUMNS)).equal(key)
+    expect("=" in cursor).to_be_false()
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64 !",
+        encode_cursor(["2026-05-01T12:30:15"]),
+        encode_cursor(["yesterday", str(uuid4())]),
+        encode_cursor(["2026-05-01T12:30:15", "not-a-uuid"]),
+    ],
+)
+def test_malformed_cursors_are_rejected(cursor: str) -> None:
+    """Garbage, wrong arity and wrong value types raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, KEY_COLUMNS)
+
+
+def test_split_page_trims_look_ahead_row() -> None:
+    """Only a look-ahead row beyond the limit produces a next cursor."""
+    rows = [(1, "a"), (2, "b"), (3, "c")]
+
+    page, next_cursor = split_page(rows, 2, lambda row: row)
+    last_page, no_cursor = split_page(rows[:2], 2, lambda row: row)
+
+    expect(page).equal(rows[:2])
+    expect(next_cursor).equal(encode_cursor((2, "b")))
+    expect(last_page).equal(rows[:2])
+    expect(no_cursor).is_none()
+
+
+def test_totals_are_counted_for_offset_pages_by_default() -> None:
+    """The COUNT runs for page requests, is skipped for cursors and can be forced."""
+    expect(should_count_total(None, None)).to_be_true()
+    expect(should_count_total("cursor", None)).to_be_false()
+    expect(should_count_total("cursor", True)).to_be_true()
+    expect(should_count_total(None, False)).to_be_false()